@@ -0,0 +1,177 @@
+"""Structured JSON-lines access log written off the request path."""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class RingBuffer:
+    """Fixed-capacity FIFO that drops new items instead of blocking when full.
+
+    ``put`` and ``drain`` rely on ``deque.append``/``popleft`` being atomic,
+    so producers never take a lock. ``dropped`` counts rejected items.
+    """
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("Capacity must be a positive integer")
+        self.capacity = capacity
+        self.dropped = 0
+        self._items: deque = deque()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def put(self, item: Any) -> bool:
+        """Add an item; return False (and count it) if the buffer is full."""
+        if len(self._items) >= self.capacity:
+            self.dropped += 1
+            return False
+        self._items.append(item)
+        return True
+
+    def drain(self, max_items: int) -> list:
+        """Remove and return up to ``max_items`` items, oldest first."""
+        items = []
+        try:
+            while len(items) < max_items:
+                items.append(self._items.popleft())
+        except IndexError:
+            pass
+        return items
+
+
+class AccessLog:
+    """Buffer access records and write them in batches from a background thread.
+
+    The file is rotated like ``logging.handlers.RotatingFileHandler``: once it
+    reaches ``max_bytes`` it is renamed to ``path.1`` (shifting older files up
+    to ``backup_count``) and a new file is started.
+    """
+
+    def __init__(self, path: str, capacity: int = 10_000, batch_size: int = 256,
+                 flush_interval: float = 0.5, max_bytes: int = 10 * 1024 * 1024, backup_count: int = 5):
+        self.path = path
+        self.buffer = RingBuffer(capacity)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._file = None
+
+    @property
+    def dropped(self) -> int:
+        """Number of records dropped because the buffer was full."""
+        return self.buffer.dropped
+
+    def record(self, entry: dict[str, Any]) -> bool:
+        """Queue a record without blocking; return False if it was dropped."""
+        return self.buffer.put(entry)
+
+    def start(self) -> None:
+        """Start the writer thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="access-log", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the writer thread after flushing everything buffered."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+        self.flush()
+        self._close()
+
+    def flush(self) -> int:
+        """Write all buffered records and return how many were written."""
+        written = 0
+        while True:
+            batch = self.buffer.drain(self.batch_size)
+            if not batch:
+                return written
+            self._write("".join(json.dumps(entry, separators=(",", ":")) + "\n" for entry in batch))
+            written += len(batch)
+
+    def _write(self, data: str) -> None:
+        if self._file is None:
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write(data)
+        self._file.flush()
+        if self.max_bytes and self._file.tell() >= self.max_bytes:
+            self._rotate()
+
+    def _rotate(self) -> None:
+        self._close()
+        if self.backup_count > 0:
+            for i in range(self.backup_count - 1, 0, -1):
+                source = f"{self.path}.{i}"
+                if os.path.exists(source):
+                    os.replace(source, f"{self.path}.{i + 1}")
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+
+    def _close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class AccessLogMiddleware:
+    """ASGI middleware recording one access log entry per HTTP request."""
+
+    def __init__(self, app: ASGIApp, access_log: AccessLog):
+        self.app = app
+        self.access_log = access_log
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        request_bytes = 0
+        status = 500
+
+        async def counting_receive() -> Message:
+            nonlocal request_bytes
+            message = await receive()
+            if message["type"] == "http.request":
+                request_bytes += len(message.get("body", b""))
+            return message
+
+        async def status_send(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, counting_receive, status_send)
+        finally:
+            route = scope.get("route")
+            endpoint = scope.get("endpoint")
+            self.access_log.record({
+                "ts": time.time(),
+                "method": scope["method"],
+                "path": scope["path"],
+                "operation": route.name if route is not None else getattr(endpoint, "__name__", None),
+                "request_bytes": request_bytes,
+                "status": status,
+                "duration_ms": round((time.perf_counter() - start) * 1000, 3),
+            })
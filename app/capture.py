@@ -0,0 +1,107 @@
+"""Sampled capture of requests and responses to JSONL for later replay with ``app.replay``."""
+
+import base64
+import random
+import time
+from typing import Any, Callable, Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.access_log import AccessLog
+
+# Request headers needed to reproduce a response. Credentials are never captured.
+CAPTURED_HEADERS = (b"content-type", b"accept")
+
+
+def encode_body(body: bytes) -> dict[str, str]:
+    """Store a body as text when it is UTF-8, otherwise as base64."""
+    try:
+        return {"text": body.decode("utf-8")}
+    except UnicodeDecodeError:
+        return {"base64": base64.b64encode(body).decode("ascii")}
+
+
+def decode_body(encoded: dict[str, str]) -> bytes:
+    """Reverse ``encode_body``."""
+    if "base64" in encoded:
+        return base64.b64decode(encoded["base64"])
+    return encoded["text"].encode("utf-8")
+
+
+class CaptureMiddleware:
+    """ASGI middleware recording a random sample of requests with their responses.
+
+    Records are written through an ``AccessLog``, so capturing never blocks
+    a request and drops records when its buffer is full. Bodies larger than
+    ``max_body_bytes`` are left out and the record is marked ``truncated``;
+    such records cannot be replayed.
+    """
+
+    def __init__(self, app: ASGIApp, capture_log: AccessLog, sample_rate: float = 0.01,
+                 max_body_bytes: int = 64 * 1024, rng: Callable[[], float] = random.random):
+        self.app = app
+        self.capture_log = capture_log
+        self.sample_rate = sample_rate
+        self.max_body_bytes = max_body_bytes
+        self._random = rng
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or self._random() >= self.sample_rate:
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        request_body: list[bytes] = []
+        response_body: list[bytes] = []
+        sizes = {"request": 0, "response": 0}
+        status: Optional[int] = None
+
+        def keep(chunks: list[bytes], kind: str, chunk: bytes) -> None:
+            sizes[kind] += len(chunk)
+            if sizes[kind] <= self.max_body_bytes:
+                chunks.append(chunk)
+
+        async def capturing_receive() -> Message:
+            message = await receive()
+            if message["type"] == "http.request":
+                keep(request_body, "request", message.get("body", b""))
+            return message
+
+        async def capturing_send(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                keep(response_body, "response", message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, capturing_receive, capturing_send)
+        finally:
+            self.capture_log.record(self._entry(
+                scope, start, status, request_body, response_body,
+                truncated=max(sizes.values()) > self.max_body_bytes,
+            ))
+
+    def _entry(self, scope: Scope, start: float, status: Optional[int], request_body: list[bytes],
+               response_body: list[bytes], truncated: bool) -> dict[str, Any]:
+        route = scope.get("route")
+        entry = {
+            "ts": time.time(),
+            "method": scope["method"],
+            "path": scope["path"],
+            "query": scope["query_string"].decode("latin-1"),
+            "operation": route.name if route is not None else getattr(scope.get("endpoint"), "__name__", None),
+            "headers": {
+                name.decode("latin-1"): value.decode("latin-1")
+                for name, value in scope["headers"] if name in CAPTURED_HEADERS
+            },
+            "status": status,
+            "duration_ms": round((time.perf_counter() - start) * 1000, 3),
+        }
+        if truncated:
+            entry["truncated"] = True
+        else:
+            entry["body"] = encode_body(b"".join(request_body))
+            entry["response"] = encode_body(b"".join(response_body))
+        return entry
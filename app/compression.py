@@ -0,0 +1,196 @@
+"""Response compression negotiated with Accept-Encoding: gzip, plus zstd and brotli when installed."""
+
+import zlib
+from typing import Callable, Optional
+
+from anyio import to_thread
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - zstandard is optional
+    zstandard = None
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
+# Bodies are compressed in pieces of this size, so output starts before the whole body is compressed.
+PIECE_SIZE = 256 * 1024
+# Pieces at least this large are compressed in a worker thread instead of on the event loop.
+OFFLOAD_SIZE = 64 * 1024
+
+
+class GzipEncoder:
+    """Incremental gzip compressor."""
+
+    def __init__(self, level: int = 6):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes, flush: bool = False) -> bytes:
+        """Compress data; with ``flush``, also emit everything buffered so far."""
+        output = self._compressor.compress(data)
+        return output + self._compressor.flush(zlib.Z_SYNC_FLUSH) if flush else output
+
+    def finish(self) -> bytes:
+        """Return the end of the compressed stream."""
+        return self._compressor.flush()
+
+
+class ZstdEncoder:
+    """Incremental zstd compressor."""
+
+    def __init__(self, level: int = 3):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes, flush: bool = False) -> bytes:
+        """Compress data; with ``flush``, also emit everything buffered so far."""
+        output = self._compressor.compress(data)
+        return output + self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK) if flush else output
+
+    def finish(self) -> bytes:
+        """Return the end of the compressed stream."""
+        return self._compressor.flush()
+
+
+class BrotliEncoder:
+    """Incremental brotli compressor."""
+
+    def __init__(self, quality: int = 4):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes, flush: bool = False) -> bytes:
+        """Compress data; with ``flush``, also emit everything buffered so far."""
+        output = self._compressor.process(data)
+        return output + self._compressor.flush() if flush else output
+
+    def finish(self) -> bytes:
+        """Return the end of the compressed stream."""
+        return self._compressor.finish()
+
+
+def available_encoders() -> dict[str, Callable]:
+    """Return the supported encodings, most preferred first."""
+    encoders: dict[str, Callable] = {}
+    if zstandard is not None:
+        encoders["zstd"] = ZstdEncoder
+    if brotli is not None:
+        encoders["br"] = BrotliEncoder
+    encoders["gzip"] = GzipEncoder
+    return encoders
+
+
+def negotiate(accept_encoding: str, encodings: list[str]) -> Optional[str]:
+    """Pick the best of ``encodings`` for an Accept-Encoding header, or None for identity.
+
+    The client's q-values decide first and the order of ``encodings`` breaks ties.
+    """
+    weights: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if name:
+            weights[name.strip().lower()] = q
+    best, best_q = None, 0.0
+    for encoding in encodings:
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+class CompressionMiddleware:
+    """ASGI middleware compressing response bodies of at least ``minimum_size`` bytes.
+
+    Responses whose first body message is complete and smaller than
+    ``minimum_size``, or that already have a Content-Encoding, are passed
+    through unchanged. Streamed responses are compressed chunk by chunk and
+    flushed after each one, so NDJSON lines still reach the client promptly.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, encoders: Optional[dict[str, Callable]] = None):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.encoders = encoders if encoders is not None else available_encoders()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        accept = ""
+        for name, value in scope.get("headers", ()):
+            if name == b"accept-encoding":
+                accept = value.decode("latin-1")
+                break
+        encoding = negotiate(accept, list(self.encoders)) if accept else None
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressingResponder(send, encoding, self.encoders[encoding], self.minimum_size)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressingResponder:
+    """Wrap ``send`` for one response, deciding on the first body message whether to compress."""
+
+    def __init__(self, send: Send, encoding: str, encoder_factory: Callable, minimum_size: int):
+        self._send = send
+        self.encoding = encoding
+        self.encoder_factory = encoder_factory
+        self.minimum_size = minimum_size
+        self.start: Optional[Message] = None
+        self.encoder = None
+        self.passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start = message
+            headers = MutableHeaders(raw=message["headers"])
+            self.passthrough = "content-encoding" in headers
+            return
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self._flush_start()
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.encoder is None:
+            if not more_body and len(body) < self.minimum_size:
+                self.passthrough = True
+                await self._flush_start()
+                await self._send(message)
+                return
+            self.encoder = self.encoder_factory()
+            headers = MutableHeaders(raw=self.start["headers"])
+            del headers["content-length"]
+            headers["content-encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+            self.start["headers"] = headers.raw
+            await self._flush_start()
+
+        # Streamed chunks are flushed so the client can decode each one as it arrives.
+        pieces = [body[offset:offset + PIECE_SIZE] for offset in range(0, len(body), PIECE_SIZE)] or [b""]
+        for i, piece in enumerate(pieces):
+            flush = more_body and i == len(pieces) - 1
+            if len(piece) >= OFFLOAD_SIZE:
+                output = await to_thread.run_sync(self.encoder.compress, piece, flush)
+            else:
+                output = self.encoder.compress(piece, flush)
+            if output:
+                await self._send({"type": "http.response.body", "body": output, "more_body": True})
+        if not more_body:
+            await self._send({"type": "http.response.body", "body": self.encoder.finish(), "more_body": False})
+
+    async def _flush_start(self) -> None:
+        if self.start is not None:
+            start, self.start = self.start, None
+            await self._send(start)
@@ -1,37 +1,67 @@
 """Custom error handlers."""
 
 from fastapi import Request, status
-from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
+from starlette.exceptions import HTTPException
+
+from app.serialization import NegotiatedResponse
+
+
+def validation_error_content(errors: list[dict]) -> dict:
+    """Build the validation error body from pydantic-style errors."""
+    return {
+        "detail": "Validation error",
+        "errors": [
+            {
+                "field": ".".join(str(loc) for loc in error["loc"]),
+                "message": error["msg"]
+            }
+            for error in errors
+        ]
+    }
 
 
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle validation errors."""
-    errors = []
-    for error in exc.errors():
-        errors.append({
-            "field": ".".join(str(loc) for loc in error["loc"]),
-            "message": error["msg"]
-        })
-    return JSONResponse(
+    return NegotiatedResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        content={"detail": "Validation error", "errors": errors}
+        content=validation_error_content(exc.errors())
+    )
+
+
+async def http_exception_handler(request: Request, exc: HTTPException):
+    """Handle HTTP errors, answering in the format the client negotiated."""
+    return NegotiatedResponse(
+        status_code=exc.status_code,
+        content={"detail": exc.detail},
+        headers=getattr(exc, "headers", None)
     )
 
 
 async def division_by_zero_handler(request: Request, exc: ValueError):
     """Handle division by zero errors."""
     if "zero" in str(exc).lower():
-        return JSONResponse(
+        return NegotiatedResponse(
             status_code=status.HTTP_400_BAD_REQUEST,
             content={"detail": "Division by zero is not allowed"}
         )
     raise exc
 
 
+async def math_error_handler(request: Request, exc: "MathError"):
+    """Handle invalid operands and unrepresentable results."""
+    return NegotiatedResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content={"detail": exc.message}
+    )
+
+
 class MathError(Exception):
     """Custom math error."""
     def __init__(self, message: str):
         self.message = message
         super().__init__(self.message)
 
+
+class JobQueueFullError(MathError):
+    """Raised when the background job queue cannot take another job."""
@@ -0,0 +1,222 @@
+"""Background jobs for long-running statistics requests."""
+
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Optional
+
+from app.errors import JobQueueFullError
+from app.utils import get_statistics
+
+PENDING = "pending"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    result TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    expires_at REAL
+)
+"""
+
+
+class JobStore:
+    """SQLite-backed job table, so finished results survive a worker restart."""
+
+    def __init__(self, path: str, result_ttl: float = 3600.0):
+        self.path = path
+        self.result_ttl = result_ttl
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the database on first use and make sure the table exists."""
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_SCHEMA)
+            conn.execute("CREATE INDEX IF NOT EXISTS jobs_expires_at ON jobs (expires_at)")
+            self._conn = conn
+        return self._conn
+
+    def _execute(self, sql: str, params: tuple = ()) -> list[tuple]:
+        with self._lock:
+            return self._connection().execute(sql, params).fetchall()
+
+    def create(self, job_id: str, payload: dict[str, Any]) -> None:
+        """Insert a new pending job."""
+        self._execute(
+            "INSERT INTO jobs (id, status, payload, created_at) VALUES (?, ?, ?, ?)",
+            (job_id, PENDING, json.dumps(payload), time.time()),
+        )
+
+    def mark_running(self, job_id: str) -> None:
+        """Record that a worker picked up the job."""
+        self._execute("UPDATE jobs SET status = ? WHERE id = ?", (RUNNING, job_id))
+
+    def complete(self, job_id: str, result: dict[str, Any]) -> None:
+        """Store a job result; it is kept for ``result_ttl`` seconds."""
+        self._execute(
+            "UPDATE jobs SET status = ?, result = ?, expires_at = ? WHERE id = ?",
+            (COMPLETED, json.dumps(result), time.time() + self.result_ttl, job_id),
+        )
+
+    def fail(self, job_id: str, error: str) -> None:
+        """Store a job failure; it expires like a result."""
+        self._execute(
+            "UPDATE jobs SET status = ?, error = ?, expires_at = ? WHERE id = ?",
+            (FAILED, error, time.time() + self.result_ttl, job_id),
+        )
+
+    def get(self, job_id: str) -> Optional[dict[str, Any]]:
+        """Return a job, or None if it does not exist or has expired."""
+        rows = self._execute(
+            "SELECT status, result, error, expires_at FROM jobs WHERE id = ?", (job_id,)
+        )
+        if not rows:
+            return None
+        status, result, error, expires_at = rows[0]
+        if expires_at is not None and expires_at <= time.time():
+            return None
+        return {
+            "job_id": job_id,
+            "status": status,
+            "result": json.loads(result) if result is not None else None,
+            "error": error,
+        }
+
+    def unfinished(self) -> list[tuple[str, dict[str, Any]]]:
+        """Return the ids and payloads of jobs that never finished."""
+        rows = self._execute(
+            "SELECT id, payload FROM jobs WHERE status IN (?, ?) ORDER BY created_at", (PENDING, RUNNING)
+        )
+        return [(job_id, json.loads(payload)) for job_id, payload in rows]
+
+    def mark_pending(self, job_id: str) -> None:
+        """Put a job back in the pending state."""
+        self._execute("UPDATE jobs SET status = ? WHERE id = ?", (PENDING, job_id))
+
+    def purge_expired(self) -> int:
+        """Delete expired jobs and return how many were removed."""
+        with self._lock:
+            cursor = self._connection().execute(
+                "DELETE FROM jobs WHERE expires_at IS NOT NULL AND expires_at <= ?", (time.time(),)
+            )
+            return cursor.rowcount
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def run_statistics_job(payload: dict[str, Any]) -> dict[str, Any]:
+    """Compute the result for a statistics job payload."""
+    return get_statistics(
+        payload["numbers"],
+        quantiles=payload.get("quantiles"),
+        median=payload.get("median", False),
+        bins=payload.get("bins"),
+    )
+
+
+class JobManager:
+    """Run jobs on a bounded thread pool and record their outcome in a JobStore.
+
+    Expired jobs are purged at most every ``purge_interval`` seconds as new
+    jobs are submitted. The manager assumes it is the only process using the
+    store: ``recover`` re-queues every job that was left unfinished.
+    """
+
+    def __init__(self, store: JobStore, max_workers: int = 4, max_pending: int = 64, purge_interval: float = 60.0):
+        self.store = store
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.purge_interval = purge_interval
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._futures: dict[str, Future] = {}
+        # Re-entrant: a done callback runs inline when a job finishes before it is attached.
+        self._lock = threading.RLock()
+        self._last_purge = time.monotonic()
+
+    def submit(self, payload: dict[str, Any]) -> str:
+        """Queue a job and return its id."""
+        self._purge_if_due()
+        with self._lock:
+            if len(self._futures) >= self.max_pending:
+                raise JobQueueFullError("Job queue is full, try again later")
+            job_id = uuid.uuid4().hex
+            self.store.create(job_id, payload)
+            self._enqueue(job_id, payload)
+        return job_id
+
+    def recover(self) -> int:
+        """Re-queue jobs left pending or running by a previous process.
+
+        Returns how many jobs were re-queued. Recovered jobs do not count
+        against ``max_pending``, so none are lost after a restart.
+        """
+        self.store.purge_expired()
+        jobs = self.store.unfinished()
+        with self._lock:
+            for job_id, payload in jobs:
+                if job_id not in self._futures:
+                    self.store.mark_pending(job_id)
+                    self._enqueue(job_id, payload)
+        return len(jobs)
+
+    def _enqueue(self, job_id: str, payload: dict[str, Any]) -> None:
+        # Called with self._lock held.
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="job")
+        future = self._executor.submit(self._run, job_id, payload)
+        self._futures[job_id] = future
+        future.add_done_callback(lambda _: self._forget(job_id))
+
+    def _purge_if_due(self) -> None:
+        now = time.monotonic()
+        if now - self._last_purge >= self.purge_interval:
+            self._last_purge = now
+            self.store.purge_expired()
+
+    def _run(self, job_id: str, payload: dict[str, Any]) -> None:
+        self.store.mark_running(job_id)
+        try:
+            result = run_statistics_job(payload)
+        except Exception as exc:
+            self.store.fail(job_id, str(exc))
+            return
+        self.store.complete(job_id, result)
+
+    def _forget(self, job_id: str) -> None:
+        with self._lock:
+            self._futures.pop(job_id, None)
+
+    def future(self, job_id: str) -> Optional[Future]:
+        """Return the in-flight future for a job, if this process is running it."""
+        with self._lock:
+            return self._futures.get(job_id)
+
+    def get(self, job_id: str) -> Optional[dict[str, Any]]:
+        """Return the stored state of a job."""
+        return self.store.get(job_id)
+
+    def shutdown(self) -> None:
+        """Wait for running jobs, then release the pool and the database."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        self.store.purge_expired()
+        self.store.close()
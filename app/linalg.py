@@ -0,0 +1,268 @@
+"""Vector and matrix operations on nested lists, backed by NumPy/BLAS when installed.
+
+Arrays are scalars, vectors (lists) or matrices (lists of equal-length
+lists). Small inputs are computed in pure Python, where NumPy's conversion
+overhead would dominate; larger ones use NumPy, whose matmul and dot run on
+BLAS. Results from the two paths can differ in the last bits of precision.
+"""
+
+import math
+import os
+import struct
+import sys
+from array import array
+from typing import Any, Callable, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy is optional
+    np = None
+
+Array = Union[float, list[float], list[list[float]]]
+
+# Largest operand or result, in elements, that any operation accepts.
+MAX_ELEMENTS = int(os.environ.get("LINALG_MAX_ELEMENTS", "1000000"))
+# Inputs with at least this many elements use NumPy when it is available.
+NUMPY_MIN_ELEMENTS = 64
+# Pure Python is far slower than BLAS, so cap its multiply-adds separately.
+MAX_PURE_PYTHON_WORK = 10_000_000
+
+_ELEMENTWISE: dict[str, Callable[[float, float], float]] = {
+    "add": lambda x, y: x + y,
+    "subtract": lambda x, y: x - y,
+    "multiply": lambda x, y: x * y,
+    "divide": lambda x, y: x / y,
+}
+ELEMENTWISE_OPS = tuple(_ELEMENTWISE)
+NORM_ORDERS = ("1", "2", "inf")
+
+
+def shape_of(value: Any) -> tuple[int, ...]:
+    """Return the shape of a scalar, vector or matrix, checking it is rectangular."""
+    if np is not None and isinstance(value, np.ndarray):
+        if value.ndim > 2:
+            raise ValueError("Arrays may have at most 2 dimensions")
+        return value.shape
+    if not isinstance(value, list):
+        return ()
+    if not value or not isinstance(value[0], list):
+        if any(isinstance(row, list) for row in value):
+            raise ValueError("Array rows must all have the same length")
+        return (len(value),)
+    columns = len(value[0])
+    for row in value:
+        if not isinstance(row, list) or len(row) != columns:
+            raise ValueError("Array rows must all have the same length")
+        if any(isinstance(x, list) for x in row):
+            raise ValueError("Arrays may have at most 2 dimensions")
+    return (len(value), columns)
+
+
+def size_of(shape: tuple[int, ...]) -> int:
+    """Return the number of elements in an array of the given shape."""
+    return math.prod(shape)
+
+
+def _check_size(shape: tuple[int, ...]) -> tuple[int, ...]:
+    if size_of(shape) > MAX_ELEMENTS:
+        raise ValueError(f"Arrays are limited to {MAX_ELEMENTS} elements")
+    return shape
+
+
+def _operand_shape(value: Any) -> tuple[int, ...]:
+    return _check_size(shape_of(value))
+
+
+def _flatten(value: Any, shape: tuple[int, ...]) -> list[float]:
+    if len(shape) == 0:
+        return [value]
+    if len(shape) == 1:
+        return list(value)
+    return [x for row in value for x in row]
+
+
+def _use_numpy(*values: Any) -> bool:
+    if np is None:
+        return False
+    return any(isinstance(v, np.ndarray) for v in values) or \
+        sum(size_of(shape_of(v)) for v in values) >= NUMPY_MIN_ELEMENTS
+
+
+def _check_work(work: int) -> None:
+    if work > MAX_PURE_PYTHON_WORK:
+        raise ValueError("Input is too large to compute without NumPy")
+
+
+def _finite(value: Any) -> Any:
+    """Return value if every element is finite, since JSON cannot represent the rest."""
+    if np is not None and isinstance(value, np.ndarray):
+        if not np.isfinite(value).all():
+            raise ValueError("Result is not a finite number")
+        return value.tolist()
+    shape = shape_of(value)
+    if not all(math.isfinite(x) for x in _flatten(value, shape)):
+        raise ValueError("Result is not a finite number")
+    return value
+
+
+def dot(a: Any, b: Any) -> float:
+    """Calculate the dot product of two vectors."""
+    shape_a, shape_b = _operand_shape(a), _operand_shape(b)
+    if len(shape_a) != 1 or shape_a != shape_b:
+        raise ValueError("Dot product requires two vectors of the same length")
+    if _use_numpy(a, b):
+        return _finite(float(np.dot(np.asarray(a, dtype=np.float64), np.asarray(b, dtype=np.float64))))
+    return _finite(math.fsum(x * y for x, y in zip(a, b)))
+
+
+def norm(a: Any, ord: str = "2") -> float:
+    """Calculate the 1-, 2- or max-norm of an array's elements.
+
+    Matrices are treated as flat, so ``ord="2"`` gives the Frobenius norm.
+    """
+    if ord not in NORM_ORDERS:
+        raise ValueError(f"Unknown norm order: {ord}")
+    shape = _operand_shape(a)
+    if _use_numpy(a):
+        flat = np.asarray(a, dtype=np.float64).ravel()
+        if ord == "1":
+            return _finite(float(np.abs(flat).sum()))
+        if ord == "inf":
+            return _finite(float(np.abs(flat).max(initial=0.0)))
+        return _finite(float(np.linalg.norm(flat)))
+    flat = _flatten(a, shape)
+    if ord == "1":
+        return _finite(math.fsum(abs(x) for x in flat))
+    if ord == "inf":
+        return _finite(max((abs(x) for x in flat), default=0.0))
+    return _finite(math.hypot(*flat))
+
+
+def matmul(a: Any, b: Any) -> Array:
+    """Multiply matrices and/or vectors following NumPy's matmul rules."""
+    shape_a, shape_b = _operand_shape(a), _operand_shape(b)
+    if not shape_a or not shape_b:
+        raise ValueError("Matrix multiplication requires vectors or matrices")
+    if shape_a[-1] != shape_b[0]:
+        raise ValueError(f"Shapes {list(shape_a)} and {list(shape_b)} are not aligned")
+    _check_size(shape_a[:-1] + shape_b[1:])
+    if _use_numpy(a, b):
+        with np.errstate(over="ignore", invalid="ignore"):
+            result = np.matmul(np.asarray(a, dtype=np.float64), np.asarray(b, dtype=np.float64))
+        return _finite(result if isinstance(result, np.ndarray) and result.ndim else float(result))
+    rows = a if len(shape_a) == 2 else [a]
+    columns = list(zip(*b)) if len(shape_b) == 2 else [b]
+    _check_work(len(rows) * len(columns) * shape_a[-1])
+    result = [[math.fsum(x * y for x, y in zip(row, column)) for column in columns] for row in rows]
+    if len(shape_b) == 1:
+        result = [row[0] for row in result]
+    if len(shape_a) == 1:
+        result = result[0]
+    return _finite(result)
+
+
+def transpose(a: Any) -> Array:
+    """Transpose a matrix; scalars and vectors are returned unchanged."""
+    shape = _operand_shape(a)
+    if np is not None and isinstance(a, np.ndarray):
+        return a.T.tolist()
+    if len(shape) < 2:
+        return a
+    return [list(column) for column in zip(*a)]
+
+
+def _broadcast(shape_a: tuple[int, ...], shape_b: tuple[int, ...]) -> tuple[int, ...]:
+    result = []
+    for i in range(1, max(len(shape_a), len(shape_b)) + 1):
+        x = shape_a[-i] if i <= len(shape_a) else 1
+        y = shape_b[-i] if i <= len(shape_b) else 1
+        if x != y and 1 not in (x, y):
+            raise ValueError(f"Shapes {list(shape_a)} and {list(shape_b)} cannot be broadcast together")
+        result.append(max(x, y) if 0 not in (x, y) else 0)
+    return tuple(reversed(result))
+
+
+def _as_matrix(value: Any, shape: tuple[int, ...]) -> list[list[float]]:
+    if len(shape) == 0:
+        return [[value]]
+    if len(shape) == 1:
+        return [value]
+    return value
+
+
+def elementwise(op: str, a: Any, b: Any) -> Array:
+    """Apply add, subtract, multiply or divide elementwise with NumPy broadcasting."""
+    if op not in _ELEMENTWISE:
+        raise ValueError(f"Unknown operation: {op}")
+    shape_a, shape_b = _operand_shape(a), _operand_shape(b)
+    shape = _check_size(_broadcast(shape_a, shape_b))
+    if _use_numpy(a, b):
+        x, y = np.asarray(a, dtype=np.float64), np.asarray(b, dtype=np.float64)
+        if op == "divide" and (y == 0).any():
+            raise ValueError("Division by zero is not allowed")
+        with np.errstate(over="ignore", invalid="ignore"):
+            result = getattr(np, op)(x, y)
+        return _finite(result if result.ndim else float(result))
+    if op == "divide" and any(y == 0 for y in _flatten(b, shape_b)):
+        raise ValueError("Division by zero is not allowed")
+    _check_work(size_of(shape))
+    f = _ELEMENTWISE[op]
+    matrix_a, matrix_b = _as_matrix(a, shape_a), _as_matrix(b, shape_b)
+    rows_a, rows_b = len(matrix_a), len(matrix_b)
+    result = []
+    for i in range(shape[0] if len(shape) == 2 else 1):
+        row_a = matrix_a[i if rows_a > 1 else 0]
+        row_b = matrix_b[i if rows_b > 1 else 0]
+        columns = shape[-1] if shape else 1
+        step_a, step_b = len(row_a) > 1, len(row_b) > 1
+        result.append([f(row_a[j if step_a else 0], row_b[j if step_b else 0]) for j in range(columns)])
+    if len(shape) == 0:
+        return _finite(result[0][0])
+    if len(shape) == 1:
+        return _finite(result[0])
+    return _finite(result)
+
+
+def parse_shape(text: str) -> tuple[int, ...]:
+    """Parse a comma-separated shape such as ``"2,3"``."""
+    try:
+        shape = tuple(int(part) for part in text.split(",")) if text else ()
+    except ValueError:
+        raise ValueError(f"Invalid shape: {text!r}")
+    if len(shape) > 2 or any(dim < 0 for dim in shape):
+        raise ValueError(f"Invalid shape: {text!r}")
+    return shape
+
+
+def from_buffer(data: bytes, shapes: list[tuple[int, ...]]) -> list[Any]:
+    """Split a buffer of little-endian row-major float64 values into arrays."""
+    sizes = [size_of(_check_size(shape)) for shape in shapes]
+    if len(data) != 8 * sum(sizes):
+        raise ValueError("Buffer size does not match the given shapes")
+    arrays = []
+    offset = 0
+    for shape, size in zip(shapes, sizes):
+        chunk = data[offset:offset + 8 * size]
+        offset += 8 * size
+        if np is not None:
+            arrays.append(np.frombuffer(chunk, dtype="<f8").reshape(shape))
+            continue
+        values = array("d")
+        values.frombytes(chunk)
+        if sys.byteorder == "big":  # pragma: no cover
+            values.byteswap()
+        values = values.tolist()
+        if len(shape) == 0:
+            arrays.append(values[0])
+        elif len(shape) == 1:
+            arrays.append(values)
+        else:
+            arrays.append([values[i * shape[1]:(i + 1) * shape[1]] for i in range(shape[0])])
+    return arrays
+
+
+def to_buffer(value: Array) -> tuple[bytes, tuple[int, ...]]:
+    """Encode an array as little-endian row-major float64 bytes with its shape."""
+    shape = shape_of(value)
+    flat = _flatten(value, shape)
+    return struct.pack(f"<{len(flat)}d", *flat), shape
@@ -1,17 +1,163 @@
-from fastapi import FastAPI, HTTPException
-from app.models import MathRequest, MathResponse, SingleNumberRequest, HealthResponse
-from app.utils import validate_division, calculate_percentage, round_to_precision, factorial, get_statistics, is_even, format_number
-from app.errors import MathError
-import math
-
-app = FastAPI(title="Math Operations API", version="1.0.0")
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import Response
+from pydantic import BaseModel, ValidationError
+from starlette.concurrency import run_in_threadpool
+from app.models import MathRequest, MathResponse, SingleNumberRequest, HealthResponse, ReadinessResponse, JobResponse, SessionResponse, RollingStatisticsRequest, RollingStreamParams
+from app.models import BulkMathRequest, BulkSingleNumberRequest, BulkMathResponse
+from app.models import ExactPowerRequest, ModularPowerRequest, BulkModularPowerRequest, IntegerResponse, BulkIntegerResponse
+from app.models import VectorPairRequest, ArrayRequest, ArrayPairRequest, ArrayResponse, ScanRequest, ScanStreamParams
+from app import linalg
+from app.utils import get_statistics, is_even, format_number, exact_power, modular_power, modular_power_cost
+from app.errors import MathError, JobQueueFullError
+from app.operations import OPERATIONS, Operation
+from app.jobs import JobManager, JobStore
+from app.sessions import SessionStore
+from app.access_log import AccessLog, AccessLogMiddleware
+from app.capture import CaptureMiddleware
+from app.monitor import UNREADY, InFlightMiddleware, LoadMonitor
+from app.compression import CompressionMiddleware
+from app.fastlane import FastLane
+from app.serialization import NegotiatedResponse, NegotiatedRoute, NegotiationMiddleware, NOT_DECODED, decode_body
+from app.ratelimit import COST_UNITS, LoadShedder, RateLimitMiddleware, TokenBuckets
+from app.rolling import RollingWindow, rolling_statistics
+from app.streaming import NumberStreamEndpoint
+from app.scan import ChunkedScanner, scan
+from contextlib import asynccontextmanager
+from typing import Optional
+import asyncio
+import os
+
+MAX_JOB_WAIT_SECONDS = 30.0
+BINS_PATTERN = r"^(auto|[1-9][0-9]*)$"
+MAX_HISTOGRAM_BINS = 10_000
+MAX_BULK_ITEMS = int(os.environ.get("BULK_MAX_ITEMS", "100000"))
+# Python refuses to convert integers longer than this to decimal strings by default.
+MAX_EXACT_DIGITS = 4300
+MAX_MODULAR_BITS = 4096
+# Total work allowed in one /bulk/power/mod request: that of 16 operations at the bit limit.
+MAX_BULK_MODULAR_WORK = 16 * modular_power_cost(2 ** MAX_MODULAR_BITS - 1, 2 ** MAX_MODULAR_BITS - 1)
+# Generous room for JSON-encoded numbers of up to linalg.MAX_ELEMENTS per operand.
+MAX_ARRAY_BODY_BYTES = 64 * linalg.MAX_ELEMENTS
+
+job_manager = JobManager(
+    JobStore(os.environ.get("JOBS_DB_PATH", "jobs.db"), result_ttl=float(os.environ.get("JOBS_RESULT_TTL", "3600"))),
+    max_workers=int(os.environ.get("JOBS_MAX_WORKERS", "4")),
+    max_pending=int(os.environ.get("JOBS_MAX_PENDING", "64")),
+)
+
+session_store = SessionStore(
+    max_sessions=int(os.environ.get("SESSIONS_MAX", "1000")),
+    ttl=float(os.environ.get("SESSIONS_TTL", "3600")),
+)
+
+# (degraded, unready) limits for each load metric reported by /ready.
+load_monitor = LoadMonitor(
+    {
+        "event_loop_lag_ms": (
+            float(os.environ.get("READY_LAG_DEGRADED_MS", "100")),
+            float(os.environ.get("READY_LAG_UNREADY_MS", "500")),
+        ),
+        "threadpool_waiting": (
+            int(os.environ.get("READY_THREADPOOL_WAITING_DEGRADED", "1")),
+            int(os.environ.get("READY_THREADPOOL_WAITING_UNREADY", "100")),
+        ),
+        "in_flight": (
+            int(os.environ.get("READY_IN_FLIGHT_DEGRADED", "200")),
+            int(os.environ.get("READY_IN_FLIGHT_UNREADY", "1000")),
+        ),
+    },
+    interval=float(os.environ.get("READY_SAMPLE_INTERVAL", "0.1")),
+)
+
+# Rate limiting is enabled by RATE_LIMIT_RATE (tokens per second per client)
+# and load shedding by SHED_LATENCY_MS (target average latency).
+rate_limit_buckets = TokenBuckets(
+    float(os.environ["RATE_LIMIT_RATE"]),
+    float(os.environ.get("RATE_LIMIT_BURST", os.environ["RATE_LIMIT_RATE"])),
+    slots=int(os.environ.get("RATE_LIMIT_SLOTS", "4096")),
+) if os.environ.get("RATE_LIMIT_RATE") else None
+load_shedder = LoadShedder(
+    float(os.environ["SHED_LATENCY_MS"]) / 1000,
+) if os.environ.get("SHED_LATENCY_MS") else None
+
+# Traffic capture is only enabled when CAPTURE_PATH is set; records go through their own AccessLog writer.
+capture_log = AccessLog(
+    os.environ["CAPTURE_PATH"],
+    capacity=int(os.environ.get("CAPTURE_BUFFER", "1000")),
+    max_bytes=int(os.environ.get("CAPTURE_MAX_BYTES", str(100 * 1024 * 1024))),
+    backup_count=int(os.environ.get("CAPTURE_BACKUPS", "1")),
+) if os.environ.get("CAPTURE_PATH") else None
+
+# The access log is only enabled when ACCESS_LOG_PATH is set.
+access_log = AccessLog(
+    os.environ["ACCESS_LOG_PATH"],
+    capacity=int(os.environ.get("ACCESS_LOG_BUFFER", "10000")),
+    max_bytes=int(os.environ.get("ACCESS_LOG_MAX_BYTES", str(10 * 1024 * 1024))),
+    backup_count=int(os.environ.get("ACCESS_LOG_BACKUPS", "5")),
+) if os.environ.get("ACCESS_LOG_PATH") else None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await run_in_threadpool(job_manager.recover)
+    load_monitor.start()
+    if access_log is not None:
+        access_log.start()
+    if capture_log is not None:
+        capture_log.start()
+    yield
+    if capture_log is not None:
+        await run_in_threadpool(capture_log.stop)
+    if access_log is not None:
+        await run_in_threadpool(access_log.stop)
+    await load_monitor.stop()
+    await run_in_threadpool(job_manager.shutdown)
+
+
+app = FastAPI(title="Math Operations API", version="1.0.0", lifespan=lifespan, default_response_class=NegotiatedResponse)
+# Every route accepts and returns MessagePack or CBOR as well as JSON.
+app.router.route_class = NegotiatedRoute
+# Added first so that it sits inside the other middleware, which still see fast-lane requests.
+if os.environ.get("FASTLANE", "").lower() in ("1", "true", "yes"):
+    app.add_middleware(FastLane)
+# Inside compression, so captured responses are the uncompressed bodies.
+if capture_log is not None:
+    app.add_middleware(
+        CaptureMiddleware,
+        capture_log=capture_log,
+        sample_rate=float(os.environ.get("CAPTURE_SAMPLE_RATE", "0.01")),
+        max_body_bytes=int(os.environ.get("CAPTURE_MAX_BODY_BYTES", str(64 * 1024))),
+    )
+app.add_middleware(CompressionMiddleware, minimum_size=int(os.environ.get("COMPRESSION_MIN_SIZE", "1024")))
+app.add_middleware(InFlightMiddleware, monitor=load_monitor, exclude=("/health", "/ready"))
+if rate_limit_buckets is not None or load_shedder is not None:
+    app.add_middleware(
+        RateLimitMiddleware,
+        buckets=rate_limit_buckets,
+        shedder=load_shedder,
+        path_costs={
+            **{path: COST_UNITS[operation.cost] for operation in OPERATIONS.values()
+               for path in (operation.path, f"/bulk{operation.path}")},
+            "/power/exact": COST_UNITS["heavy"],
+            "/power/mod": COST_UNITS["moderate"],
+            "/bulk/power/mod": COST_UNITS["moderate"],
+        },
+        bytes_per_token=int(os.environ.get("RATE_LIMIT_BYTES_PER_TOKEN", "1024")),
+        exclude=("/health", "/ready"),
+    )
+if access_log is not None:
+    app.add_middleware(AccessLogMiddleware, access_log=access_log)
+app.add_middleware(NegotiationMiddleware)
 
 # Add error handlers
-from app.errors import validation_exception_handler, division_by_zero_handler
+from app.errors import validation_exception_handler, http_exception_handler, division_by_zero_handler, math_error_handler
 from fastapi.exceptions import RequestValidationError
+from starlette.exceptions import HTTPException as StarletteHTTPException
 
 app.add_exception_handler(RequestValidationError, validation_exception_handler)
+app.add_exception_handler(StarletteHTTPException, http_exception_handler)
 app.add_exception_handler(ValueError, division_by_zero_handler)
+app.add_exception_handler(MathError, math_error_handler)
 
 
 @app.get("/")
@@ -25,85 +171,162 @@ def health_check():
     return HealthResponse(status="healthy", version="1.0.0")
 
 
-@app.post("/add", response_model=MathResponse)
-def add(request: MathRequest) -> MathResponse:
-    """Add two numbers."""
-    result = request.a + request.b
-    return MathResponse(result=result)
-
-
-@app.post("/subtract", response_model=MathResponse)
-def subtract(request: MathRequest) -> MathResponse:
-    """Subtract two numbers."""
-    result = request.a - request.b
-    return MathResponse(result=result)
-
-
-@app.post("/multiply", response_model=MathResponse)
-def multiply(request: MathRequest) -> MathResponse:
-    """Multiply two numbers."""
-    result = request.a * request.b
-    return MathResponse(result=result)
+@app.get("/ready", response_model=ReadinessResponse, responses={503: {"model": ReadinessResponse}})
+async def readiness_check() -> NegotiatedResponse:
+    """Report whether this worker should receive traffic, with the load metrics behind the decision."""
+    snapshot = load_monitor.snapshot()
+    status = load_monitor.status(snapshot)
+    return NegotiatedResponse(
+        status_code=503 if status == UNREADY else 200,
+        content=ReadinessResponse(status=status, **snapshot).model_dump(),
+    )
+
+
+def operation_endpoint(operation: Operation):
+    """Build the POST endpoint for a registered scalar operation."""
+    if operation.arity == 2:
+        def endpoint(request: MathRequest) -> MathResponse:
+            return MathResponse(result=operation(request.a, request.b))
+    else:
+        def endpoint(request: SingleNumberRequest) -> MathResponse:
+            return MathResponse(result=operation(request.value))
+    endpoint.__name__ = operation.name
+    endpoint.__doc__ = operation.summary
+    return endpoint
+
+
+def bulk_endpoint(operation: Operation):
+    """Build the POST endpoint applying a registered operation to columns of operands."""
+    if operation.arity == 2:
+        def endpoint(request: BulkMathRequest) -> NegotiatedResponse:
+            if len(request.a) != len(request.b):
+                raise HTTPException(status_code=400, detail="Operand lists must have the same length")
+            return bulk_response(operation, request.a, request.b)
+    else:
+        def endpoint(request: BulkSingleNumberRequest) -> NegotiatedResponse:
+            return bulk_response(operation, request.value)
+    endpoint.__name__ = f"bulk_{operation.name}"
+    endpoint.__doc__ = f"{operation.summary} Applied to every item of the operand lists."
+    return endpoint
+
+
+def bulk_response(operation: Operation, *columns: list[float]) -> NegotiatedResponse:
+    """Apply an operation to operand columns, enforcing the bulk item limit."""
+    if len(columns[0]) > MAX_BULK_ITEMS:
+        raise HTTPException(status_code=400, detail=f"Bulk requests are limited to {MAX_BULK_ITEMS} items")
+    return NegotiatedResponse({"results": operation.bulk(*columns)})
+
+
+# Scalar routes and their bulk variants are generated from the operation registry.
+for operation in OPERATIONS.values():
+    app.add_api_route(
+        operation.path, operation_endpoint(operation),
+        methods=["POST"], response_model=MathResponse, name=operation.name,
+    )
+    app.add_api_route(
+        f"/bulk{operation.path}", bulk_endpoint(operation),
+        methods=["POST"], response_model=BulkMathResponse, name=f"bulk_{operation.name}",
+    )
+
+
+@app.post("/power/exact", response_model=IntegerResponse)
+def power_exact(request: ExactPowerRequest) -> IntegerResponse:
+    """Raise an integer to a non-negative integer power exactly."""
+    try:
+        result = exact_power(request.base, request.exponent, MAX_EXACT_DIGITS)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return IntegerResponse(result=str(result))
 
 
-@app.post("/divide", response_model=MathResponse)
-def divide(request: MathRequest) -> MathResponse:
-    """Divide two numbers."""
-    if not validate_division(request.b):
-        raise HTTPException(status_code=400, detail="Division by zero is not allowed")
-    result = request.a / request.b
-    return MathResponse(result=round_to_precision(result))
+@app.post("/power/mod", response_model=IntegerResponse)
+def power_mod(request: ModularPowerRequest) -> IntegerResponse:
+    """Calculate base raised to exponent modulo modulus."""
+    try:
+        result = modular_power(request.base, request.exponent, request.modulus, MAX_MODULAR_BITS)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return IntegerResponse(result=str(result))
+
+
+@app.post("/bulk/power/mod", response_model=BulkIntegerResponse)
+def bulk_power_mod(request: BulkModularPowerRequest) -> BulkIntegerResponse:
+    """Calculate modular powers for a list of (base, exponent, modulus) triples."""
+    if len(request.triples) > MAX_BULK_ITEMS:
+        raise HTTPException(status_code=400, detail=f"Bulk requests are limited to {MAX_BULK_ITEMS} items")
+    # Oversized operands are reported per item below, so count them at the limit here.
+    limit = 2 ** MAX_MODULAR_BITS - 1
+    work = sum(modular_power_cost(min(abs(exponent), limit), min(abs(modulus), limit))
+               for _, exponent, modulus in request.triples)
+    if work > MAX_BULK_MODULAR_WORK:
+        raise HTTPException(status_code=400, detail="Bulk request is too much work; split it into smaller requests")
+    results = []
+    for index, (base, exponent, modulus) in enumerate(request.triples):
+        try:
+            results.append(str(modular_power(base, exponent, modulus, MAX_MODULAR_BITS)))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"Item {index}: {e}")
+    return BulkIntegerResponse(results=results)
+
+
+def statistics_options(quantiles: Optional[list[float]], median: bool, bins: Optional[str]) -> dict:
+    """Validate the optional /statistics query parameters."""
+    if quantiles and any(not 0 <= q <= 1 for q in quantiles):
+        raise HTTPException(status_code=400, detail="Quantiles must be between 0 and 1")
+    if bins is not None and bins != "auto":
+        bins = int(bins)
+        if bins > MAX_HISTOGRAM_BINS:
+            raise HTTPException(status_code=400, detail=f"Bins cannot exceed {MAX_HISTOGRAM_BINS}")
+    return {"quantiles": quantiles, "median": median, "bins": bins}
 
 
-@app.post("/power", response_model=MathResponse)
-def power(request: MathRequest) -> MathResponse:
-    """Raise first number to the power of second number."""
-    result = math.pow(request.a, request.b)
-    return MathResponse(result=result)
+@app.post("/statistics", response_model=dict)
+def statistics(
+    numbers: list[float],
+    quantiles: Optional[list[float]] = Query(None),
+    median: bool = False,
+    bins: Optional[str] = Query(None, pattern=BINS_PATTERN),
+) -> dict:
+    """Calculate statistics for a list of numbers, with optional quantiles, median and histogram."""
+    stats = get_statistics(numbers, **statistics_options(quantiles, median, bins))
+    return stats
 
 
-@app.post("/modulo", response_model=MathResponse)
-def modulo(request: MathRequest) -> MathResponse:
-    """Calculate modulo (remainder) of division."""
-    if not validate_division(request.b):
-        raise HTTPException(status_code=400, detail="Modulo by zero is not allowed")
-    result = request.a % request.b
-    return MathResponse(result=result)
+@app.post("/statistics/rolling", response_model=list[dict])
+def statistics_rolling(request: RollingStatisticsRequest) -> list[dict]:
+    """Calculate statistics for every sliding window of the series."""
+    try:
+        return rolling_statistics(request.numbers, request.window)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
-@app.post("/sqrt", response_model=MathResponse)
-def sqrt(request: SingleNumberRequest) -> MathResponse:
-    """Calculate square root of a number."""
-    if request.value < 0:
-        raise HTTPException(status_code=400, detail="Cannot calculate square root of negative number")
-    result = math.sqrt(request.value)
-    return MathResponse(result=round_to_precision(result))
+# Stream rolling statistics as NDJSON while the request body is still arriving.
+app.add_route(
+    "/statistics/rolling/stream",
+    NumberStreamEndpoint(RollingStreamParams, lambda params: RollingWindow(params.window)),
+    methods=["POST"],
+    name="statistics_rolling_stream",
+)
 
 
-@app.post("/percentage", response_model=MathResponse)
-def percentage(request: MathRequest) -> MathResponse:
-    """Calculate percentage of first number out of second number."""
+@app.post("/scan", response_model=ArrayResponse)
+def scan_endpoint(request: ScanRequest) -> NegotiatedResponse:
+    """Compute a cumulative sum, product, min, max or first differences of a series."""
     try:
-        result = calculate_percentage(request.a, request.b)
-        return MathResponse(result=round_to_precision(result))
+        result = scan(request.numbers, request.op, request.compensated)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    return NegotiatedResponse({"result": result})
 
 
-@app.post("/factorial", response_model=MathResponse)
-def calculate_factorial(request: SingleNumberRequest) -> MathResponse:
-    """Calculate factorial of a number."""
-    if request.value < 0 or request.value != int(request.value):
-        raise HTTPException(status_code=400, detail="Factorial is only defined for non-negative integers")
-    result = factorial(int(request.value))
-    return MathResponse(result=float(result))
-
-
-@app.post("/statistics", response_model=dict)
-def statistics(numbers: list[float]) -> dict:
-    """Calculate statistics for a list of numbers."""
-    stats = get_statistics(numbers)
-    return stats
+# Stream scan output as NDJSON chunks while the request body is still arriving.
+app.add_route(
+    "/scan/stream",
+    NumberStreamEndpoint(ScanStreamParams, lambda params: ChunkedScanner(params.op, params.compensated, params.chunk_size)),
+    methods=["POST"],
+    name="scan_stream",
+)
 
 
 @app.get("/is_even/{number}")
@@ -119,3 +342,156 @@ def format_number_endpoint(number: float):
     formatted = format_number(number)
     return {"original": number, "formatted": formatted}
 
+
+
+@app.post("/jobs/statistics", response_model=JobResponse, status_code=202)
+def submit_statistics_job(
+    numbers: list[float],
+    quantiles: Optional[list[float]] = Query(None),
+    median: bool = False,
+    bins: Optional[str] = Query(None, pattern=BINS_PATTERN),
+) -> JobResponse:
+    """Queue a statistics calculation and return its job id."""
+    try:
+        job_id = job_manager.submit({"numbers": numbers, **statistics_options(quantiles, median, bins)})
+    except JobQueueFullError as e:
+        raise HTTPException(status_code=503, detail=e.message)
+    return JobResponse(job_id=job_id, status="pending")
+
+
+@app.get("/jobs/{job_id}", response_model=JobResponse)
+async def get_job(job_id: str, wait: float = Query(0, ge=0, le=MAX_JOB_WAIT_SECONDS)) -> JobResponse:
+    """Get a job's status and result, optionally waiting up to `wait` seconds for it to finish."""
+    future = job_manager.future(job_id)
+    if future is not None and wait > 0:
+        try:
+            await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)), timeout=wait)
+        except asyncio.TimeoutError:
+            pass
+    job = await run_in_threadpool(job_manager.get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return JobResponse(**job)
+
+
+@app.post("/sessions", response_model=SessionResponse, status_code=201)
+def create_session() -> SessionResponse:
+    """Open a statistics session that numbers can be appended to."""
+    session_id = session_store.create()
+    return SessionResponse(session_id=session_id, **session_store.statistics(session_id))
+
+
+@app.post("/sessions/{session_id}/append", response_model=SessionResponse)
+def append_to_session(session_id: str, numbers: list[float]) -> SessionResponse:
+    """Add a batch of numbers to a session and return its updated statistics."""
+    if len(numbers) > MAX_BULK_ITEMS:
+        raise HTTPException(status_code=400, detail=f"Batches are limited to {MAX_BULK_ITEMS} items")
+    try:
+        statistics = session_store.append(session_id, numbers)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if statistics is None:
+        raise HTTPException(status_code=404, detail="Session not found")
+    return SessionResponse(session_id=session_id, **statistics)
+
+
+@app.get("/sessions/{session_id}", response_model=SessionResponse)
+def get_session(session_id: str) -> SessionResponse:
+    """Get a session's current statistics."""
+    statistics = session_store.statistics(session_id)
+    if statistics is None:
+        raise HTTPException(status_code=404, detail="Session not found")
+    return SessionResponse(session_id=session_id, **statistics)
+
+
+@app.delete("/sessions/{session_id}", status_code=204)
+def delete_session(session_id: str) -> Response:
+    """Close a session."""
+    if not session_store.delete(session_id):
+        raise HTTPException(status_code=404, detail="Session not found")
+    return Response(status_code=204)
+
+
+async def read_arrays(request: Request, model: type[BaseModel]) -> list:
+    """Read array operands from a JSON, MessagePack or CBOR body or a binary float64 buffer.
+
+    Binary bodies (``application/octet-stream``) hold the operands back to
+    back as little-endian row-major float64, with each shape given by an
+    ``<operand>_shape`` query parameter such as ``a_shape=2,3``.
+    """
+    if int(request.headers.get("content-length") or 0) > MAX_ARRAY_BODY_BYTES:
+        raise HTTPException(status_code=413, detail="Request body is too large")
+    body = await request.body()
+    if len(body) > MAX_ARRAY_BODY_BYTES:
+        raise HTTPException(status_code=413, detail="Request body is too large")
+    names = list(model.model_fields)
+    if request.headers.get("content-type", "").split(";")[0].strip() == "application/octet-stream":
+        try:
+            shapes = []
+            for name in names:
+                if f"{name}_shape" not in request.query_params:
+                    raise ValueError(f"Missing {name}_shape query parameter")
+                shapes.append(linalg.parse_shape(request.query_params[f"{name}_shape"]))
+            return linalg.from_buffer(body, shapes)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    decoded = await decode_body(request)
+    try:
+        if decoded is not NOT_DECODED:
+            data = await run_in_threadpool(model.model_validate, decoded)
+        else:
+            data = await run_in_threadpool(model.model_validate_json, body)
+    except ValidationError as exc:
+        raise RequestValidationError([{**error, "loc": ("body", *error["loc"])} for error in exc.errors()])
+    return [getattr(data, name) for name in names]
+
+
+async def compute_array(function, *args):
+    """Run an array operation off the event loop, turning ValueError into a 400."""
+    try:
+        return await run_in_threadpool(function, *args)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def array_response(request: Request, result: linalg.Array) -> Response:
+    """Return an array result as JSON, or as float64 bytes if the client accepts them."""
+    if "application/octet-stream" in request.headers.get("accept", ""):
+        data, shape = linalg.to_buffer(result)
+        return Response(data, media_type="application/octet-stream", headers={"X-Shape": ",".join(map(str, shape))})
+    return NegotiatedResponse({"result": result})
+
+
+@app.post("/vector/dot", response_model=MathResponse)
+async def vector_dot(request: Request) -> MathResponse:
+    """Calculate the dot product of vectors `a` and `b`."""
+    a, b = await read_arrays(request, VectorPairRequest)
+    return MathResponse(result=await compute_array(linalg.dot, a, b))
+
+
+@app.post("/vector/norm", response_model=MathResponse)
+async def vector_norm(request: Request, ord: str = Query("2", pattern="^(1|2|inf)$")) -> MathResponse:
+    """Calculate the 1-, 2- or max-norm of the elements of `a`."""
+    a, = await read_arrays(request, ArrayRequest)
+    return MathResponse(result=await compute_array(linalg.norm, a, ord))
+
+
+@app.post("/matrix/matmul", response_model=ArrayResponse)
+async def matrix_matmul(request: Request) -> Response:
+    """Multiply matrices and/or vectors `a` and `b`."""
+    a, b = await read_arrays(request, ArrayPairRequest)
+    return array_response(request, await compute_array(linalg.matmul, a, b))
+
+
+@app.post("/matrix/transpose", response_model=ArrayResponse)
+async def matrix_transpose(request: Request) -> Response:
+    """Transpose matrix `a`."""
+    a, = await read_arrays(request, ArrayRequest)
+    return array_response(request, await compute_array(linalg.transpose, a))
+
+
+@app.post("/matrix/elementwise", response_model=ArrayResponse)
+async def matrix_elementwise(request: Request, op: str = Query(pattern="^(add|subtract|multiply|divide)$")) -> Response:
+    """Apply `op` elementwise to `a` and `b` with NumPy-style broadcasting."""
+    a, b = await read_arrays(request, ArrayPairRequest)
+    return array_response(request, await compute_array(linalg.elementwise, op, a, b))
@@ -1,5 +1,8 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import Literal, Optional, Union
+
+# A scalar, a vector or a row-major matrix.
+Array = Union[list[list[float]], list[float], float]
 
 
 class MathRequest(BaseModel):
@@ -13,13 +16,137 @@ class SingleNumberRequest(BaseModel):
     value: float
 
 
+class BulkMathRequest(BaseModel):
+    """Request model for bulk two-operand operations, one column per operand."""
+    a: list[float]
+    b: list[float]
+
+
+class BulkSingleNumberRequest(BaseModel):
+    """Request model for bulk single number operations."""
+    value: list[float]
+
+
+class BulkMathResponse(BaseModel):
+    """Response model for bulk operations."""
+    results: list[float]
+
+
+class ExactPowerRequest(BaseModel):
+    """Request model for exact integer powers."""
+    base: int
+    exponent: int = Field(ge=0)
+
+
+class ModularPowerRequest(BaseModel):
+    """Request model for modular exponentiation."""
+    base: int
+    exponent: int
+    modulus: int
+
+
+class BulkModularPowerRequest(BaseModel):
+    """Request model for bulk modular exponentiation of (base, exponent, modulus) triples."""
+    triples: list[tuple[int, int, int]]
+
+
+class IntegerResponse(BaseModel):
+    """Response model for exact integer results, given as decimal strings."""
+    result: str
+
+
+class BulkIntegerResponse(BaseModel):
+    """Response model for bulk exact integer results, given as decimal strings."""
+    results: list[str]
+
+
+class RollingStatisticsRequest(BaseModel):
+    """Request model for rolling statistics."""
+    numbers: list[float]
+    window: int = Field(gt=0)
+
+
+class RollingStreamParams(BaseModel):
+    """Query parameters for streamed rolling statistics."""
+    window: int = Field(gt=0)
+
+
+ScanOp = Literal["cumsum", "cumprod", "cummin", "cummax", "diff"]
+
+
+class ScanRequest(BaseModel):
+    """Request model for cumulative scans."""
+    numbers: list[float]
+    op: ScanOp
+    compensated: bool = False
+
+
+class ScanStreamParams(BaseModel):
+    """Query parameters for streamed cumulative scans."""
+    op: ScanOp
+    compensated: bool = False
+    chunk_size: int = Field(1000, gt=0, le=100_000)
+
+
+class VectorPairRequest(BaseModel):
+    """Request model for operations on two vectors."""
+    a: list[float]
+    b: list[float]
+
+
+class ArrayRequest(BaseModel):
+    """Request model for operations on one array."""
+    a: Array
+
+
+class ArrayPairRequest(BaseModel):
+    """Request model for operations on two arrays."""
+    a: Array
+    b: Array
+
+
 class MathResponse(BaseModel):
     """Response model for math operations."""
     result: float
 
 
+class ArrayResponse(BaseModel):
+    """Response model for operations returning an array."""
+    result: Array
+
+
 class HealthResponse(BaseModel):
     """Response model for health check."""
     status: str
     version: str
 
+
+class ReadinessResponse(BaseModel):
+    """Response model for the load-aware readiness check."""
+    status: Literal["ready", "degraded", "unready"]
+    event_loop_lag_ms: float
+    threadpool_busy: int
+    threadpool_size: int
+    threadpool_waiting: int
+    in_flight: int
+
+
+
+class SessionResponse(BaseModel):
+    """Response model for statistics sessions."""
+    session_id: str
+    count: int
+    mean: float
+    min: float
+    max: float
+    sum: float
+    variance: float
+    stddev: float
+
+
+class JobResponse(BaseModel):
+    """Response model for background jobs."""
+    job_id: str
+    status: str
+    result: Optional[dict] = None
+    error: Optional[str] = None
@@ -0,0 +1,104 @@
+"""Load monitoring for the readiness endpoint: event-loop lag, threadpool queue and in-flight requests."""
+
+import asyncio
+from collections import deque
+from typing import Any, Optional
+
+from anyio import to_thread
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+READY = "ready"
+DEGRADED = "degraded"
+UNREADY = "unready"
+
+
+class LoadMonitor:
+    """Sample event-loop lag in the background and judge readiness from current load.
+
+    A background task sleeps for ``interval`` seconds at a time; any extra
+    time before it wakes up is event-loop lag, caused by code blocking the
+    loop. The largest lag of the last ``window`` samples is reported so that
+    a single blocked tick is not missed between polls.
+
+    ``thresholds`` maps each metric of ``snapshot`` to a ``(degraded,
+    unready)`` pair; a metric at or above a limit sets that status.
+    """
+
+    def __init__(self, thresholds: dict[str, tuple[float, float]], interval: float = 0.1, window: int = 10):
+        self.thresholds = thresholds
+        self.interval = interval
+        self.in_flight = 0
+        self._lags: deque = deque([0.0], maxlen=window)
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def lag(self) -> float:
+        """Largest recent event-loop lag, in seconds."""
+        return max(self._lags)
+
+    def start(self) -> None:
+        """Start sampling on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop sampling."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            self._lags.append(max(0.0, loop.time() - start - self.interval))
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the current load metrics; must be called on the event loop."""
+        threads = to_thread.current_default_thread_limiter().statistics()
+        return {
+            "event_loop_lag_ms": round(self.lag * 1000, 3),
+            "threadpool_busy": threads.borrowed_tokens,
+            "threadpool_size": int(threads.total_tokens),
+            "threadpool_waiting": threads.tasks_waiting,
+            "in_flight": self.in_flight,
+        }
+
+    def status(self, snapshot: dict[str, Any]) -> str:
+        """Classify a snapshot as ready, degraded or unready."""
+        status = READY
+        for metric, (degraded, unready) in self.thresholds.items():
+            if snapshot[metric] >= unready:
+                return UNREADY
+            if snapshot[metric] >= degraded:
+                status = DEGRADED
+        return status
+
+
+class InFlightMiddleware:
+    """ASGI middleware counting HTTP requests currently being served.
+
+    Requests to ``exclude`` paths, such as the probes themselves, are not
+    counted.
+    """
+
+    def __init__(self, app: ASGIApp, monitor: LoadMonitor, exclude: tuple[str, ...] = ()):
+        self.app = app
+        self.monitor = monitor
+        self.exclude = exclude
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exclude:
+            await self.app(scope, receive, send)
+            return
+        self.monitor.in_flight += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.monitor.in_flight -= 1
@@ -0,0 +1,167 @@
+"""Registry of scalar math operations.
+
+Each operation declares its arity, its scalar implementation from
+``app.utils``, an optional vectorized implementation, a cost class, whether
+its results may be cached, and the rules that reject invalid input. The REST
+routes, the bulk routes and result caching are all generated from here.
+"""
+
+import math
+from functools import lru_cache
+from typing import Callable, Optional
+
+from app.errors import MathError
+from app.utils import (
+    add, subtract, multiply, divide, power, modulo, square_root,
+    calculate_percentage, factorial, round_to_precision, validate_division
+)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy is optional
+    np = None
+
+CHEAP = "cheap"
+MODERATE = "moderate"
+HEAVY = "heavy"
+
+# Largest n whose factorial still fits in a float.
+MAX_FACTORIAL = 170
+
+
+class Operation:
+    """A scalar operation and everything needed to serve it.
+
+    ``checks`` is a sequence of ``(is_invalid, message)`` pairs evaluated on
+    the operands before computing; the first match raises ``MathError``.
+    ``vectorized`` takes one NumPy array per operand and must give the same
+    results as ``scalar`` elementwise. ``precision`` rounds results with
+    ``round_to_precision``. Results that are not finite are rejected, since
+    JSON cannot represent them.
+    """
+
+    def __init__(self, name: str, arity: int, scalar: Callable[..., float], summary: str,
+                 vectorized: Optional[Callable] = None, cost: str = CHEAP, pure: bool = True,
+                 cacheable: bool = False, checks: tuple = (), precision: Optional[int] = None,
+                 cache_size: int = 1024):
+        self.name = name
+        self.arity = arity
+        self.scalar = scalar
+        self.summary = summary
+        self.vectorized = vectorized
+        self.cost = cost
+        self.pure = pure
+        self.cacheable = cacheable and pure
+        self.checks = checks
+        self.precision = precision
+        self._cached = lru_cache(maxsize=cache_size)(self._cached_evaluate) if self.cacheable else None
+
+    @property
+    def path(self) -> str:
+        return f"/{self.name}"
+
+    def validate(self, *args: float) -> None:
+        """Raise MathError if the operands break one of the operation's rules."""
+        for is_invalid, message in self.checks:
+            if is_invalid(*args):
+                raise MathError(message)
+
+    def __call__(self, *args: float) -> float:
+        """Validate the operands and compute the result."""
+        self.validate(*args)
+        if self._cached is not None:
+            # 0.0 == -0.0, so the signs are part of the key to keep results identical.
+            return self._cached(args, tuple(math.copysign(1.0, x) for x in args))
+        return self._evaluate(args)
+
+    def _cached_evaluate(self, args: tuple, signs: tuple) -> float:
+        return self._evaluate(args)
+
+    def _evaluate(self, args: tuple) -> float:
+        try:
+            result = float(self.scalar(*args))
+        except (ValueError, OverflowError, ZeroDivisionError) as e:
+            raise MathError(str(e))
+        if not math.isfinite(result):
+            raise MathError("Result is not a finite number")
+        if self.precision is not None:
+            result = round_to_precision(result, self.precision)
+        return result
+
+    def bulk(self, *columns: list[float]) -> list[float]:
+        """Compute the operation for every row of equal-length operand columns."""
+        for index, row in enumerate(zip(*columns)):
+            try:
+                self.validate(*row)
+            except MathError as e:
+                raise MathError(f"Item {index}: {e.message}")
+        if self.vectorized is None or np is None:
+            results = []
+            for index, row in enumerate(zip(*columns)):
+                try:
+                    results.append(self(*row))
+                except MathError as e:
+                    raise MathError(f"Item {index}: {e.message}")
+            return results
+        with np.errstate(all="ignore"):
+            results = self.vectorized(*(np.asarray(column, dtype=np.float64) for column in columns))
+        invalid = np.flatnonzero(~np.isfinite(results))
+        if invalid.size:
+            raise MathError(f"Item {invalid[0]}: Result is not a finite number")
+        results = results.tolist()
+        if self.precision is not None:
+            results = [round_to_precision(x, self.precision) for x in results]
+        return results
+
+
+def _is_not_factorial_input(value: float) -> bool:
+    return value < 0 or not float(value).is_integer()
+
+
+def _factorial(value: float) -> int:
+    return factorial(int(value))
+
+
+def _register(*operations: Operation) -> dict[str, Operation]:
+    return {operation.name: operation for operation in operations}
+
+
+OPERATIONS: dict[str, Operation] = _register(
+    Operation("add", 2, add, "Add two numbers.", vectorized=np.add if np else None),
+    Operation("subtract", 2, subtract, "Subtract two numbers.", vectorized=np.subtract if np else None),
+    Operation("multiply", 2, multiply, "Multiply two numbers.", vectorized=np.multiply if np else None),
+    Operation(
+        "divide", 2, divide, "Divide two numbers.",
+        vectorized=np.divide if np else None,
+        checks=((lambda a, b: not validate_division(b), "Division by zero is not allowed"),),
+        precision=2,
+    ),
+    Operation(
+        "power", 2, power, "Raise first number to the power of second number.",
+        cost=MODERATE, cacheable=True,
+    ),
+    Operation(
+        "modulo", 2, modulo, "Calculate modulo (remainder) of division.",
+        checks=((lambda a, b: not validate_division(b), "Modulo by zero is not allowed"),),
+    ),
+    Operation(
+        "sqrt", 1, square_root, "Calculate square root of a number.",
+        vectorized=np.sqrt if np else None,
+        checks=((lambda value: value < 0, "Cannot calculate square root of negative number"),),
+        precision=2,
+    ),
+    Operation(
+        "percentage", 2, calculate_percentage, "Calculate percentage of first number out of second number.",
+        vectorized=(lambda value, total: value / total * 100) if np else None,
+        checks=((lambda a, b: b == 0, "Total cannot be zero"),),
+        precision=2,
+    ),
+    Operation(
+        "factorial", 1, _factorial, "Calculate factorial of a number.",
+        cost=HEAVY, cacheable=True,
+        checks=(
+            (_is_not_factorial_input, "Factorial is only defined for non-negative integers"),
+            (lambda value: value > MAX_FACTORIAL, f"Factorial is only supported up to {MAX_FACTORIAL}"),
+        ),
+    ),
+)
@@ -0,0 +1,185 @@
+"""Per-client token-bucket rate limiting and latency-based load shedding."""
+
+import math
+import random
+import time
+from array import array
+from typing import Callable, Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.serialization import NegotiatedResponse
+
+# Token cost of each operation cost class declared in app.operations.
+COST_UNITS = {"cheap": 1.0, "moderate": 2.0, "heavy": 5.0}
+
+
+class TokenBuckets:
+    """A fixed number of token buckets in flat arrays, selected by hashing the client key.
+
+    Memory does not grow with the number of clients. Clients whose keys hash
+    to the same slot share a bucket, so ``slots`` should comfortably exceed
+    the number of concurrently active clients. Each bucket refills at
+    ``rate`` tokens per second up to ``burst``.
+    """
+
+    def __init__(self, rate: float, burst: float, slots: int = 4096):
+        if rate <= 0 or burst <= 0:
+            raise ValueError("Rate and burst must be positive")
+        self.rate = rate
+        self.burst = burst
+        self.slots = slots
+        self._tokens = array("d", [burst]) * slots
+        self._updated = array("d", [0.0]) * slots
+
+    def _refill(self, slot: int, now: float) -> float:
+        tokens = self._tokens[slot]
+        if self._updated[slot]:
+            tokens = min(self.burst, tokens + (now - self._updated[slot]) * self.rate)
+        self._updated[slot] = now
+        return tokens
+
+    def take(self, key: str, cost: float, now: float) -> float:
+        """Take ``cost`` tokens from the key's bucket.
+
+        Return 0 if the request is allowed, otherwise the number of seconds
+        until enough tokens will be available. A full bucket admits a request
+        costing more than ``burst`` but goes into debt for the difference, so
+        the client then waits in proportion to what the request cost.
+        """
+        slot = hash(key) % self.slots
+        tokens = self._refill(slot, now)
+        needed = min(cost, self.burst)
+        if tokens >= needed:
+            self._tokens[slot] = tokens - cost
+            return 0.0
+        self._tokens[slot] = tokens
+        return (needed - tokens) / self.rate
+
+    def charge(self, key: str, cost: float, now: float) -> None:
+        """Take ``cost`` tokens from the key's bucket unconditionally, going into debt if needed."""
+        slot = hash(key) % self.slots
+        self._tokens[slot] = self._refill(slot, now) - cost
+
+
+class LoadShedder:
+    """Shed a share of requests while average latency is above its target.
+
+    Latency is tracked as an exponentially weighted moving average of served
+    requests. The share of requests rejected grows with the overshoot, and is
+    capped at ``max_shed`` so that some requests still get through and keep
+    the average up to date.
+    """
+
+    def __init__(self, target: float, alpha: float = 0.1, max_shed: float = 0.9,
+                 rng: Callable[[], float] = random.random):
+        self.target = target
+        self.alpha = alpha
+        self.max_shed = max_shed
+        self.latency = 0.0
+        self._random = rng
+
+    def observe(self, duration: float) -> None:
+        """Record the latency of a served request, in seconds."""
+        self.latency += self.alpha * (duration - self.latency)
+
+    @property
+    def shed_probability(self) -> float:
+        """Share of requests currently being rejected."""
+        if self.latency <= self.target:
+            return 0.0
+        return min(self.max_shed, (self.latency - self.target) / self.target)
+
+    def should_shed(self) -> bool:
+        """Decide whether to reject the next request."""
+        probability = self.shed_probability
+        return probability > 0 and self._random() < probability
+
+
+def client_key(scope: Scope) -> str:
+    """Identify the client by its X-API-Key header, or else by its IP address."""
+    for name, value in scope.get("headers", ()):
+        if name == b"x-api-key":
+            return "key:" + value.decode("latin-1")
+    client = scope.get("client")
+    return "ip:" + (client[0] if client else "")
+
+
+def content_length(scope: Scope) -> Optional[int]:
+    """Return the declared request body size, or None if it is not known up front."""
+    for name, value in scope.get("headers", ()):
+        if name == b"content-length":
+            try:
+                return int(value)
+            except ValueError:
+                return None
+    return None
+
+
+class RateLimitMiddleware:
+    """ASGI middleware applying token buckets and load shedding before the app runs.
+
+    A request costs its path's entry in ``path_costs`` (1 by default) plus one
+    token per ``bytes_per_token`` of body. Declared bodies are charged up
+    front; bodies without a Content-Length, such as chunked uploads, are
+    charged as they are received. Over-limit clients get
+    ``429`` and, while shedding, other requests get ``503``; both carry a
+    ``Retry-After`` header. Paths in ``exclude`` are never limited.
+    """
+
+    def __init__(self, app: ASGIApp, buckets: Optional[TokenBuckets] = None, shedder: Optional[LoadShedder] = None,
+                 path_costs: Optional[dict[str, float]] = None, bytes_per_token: int = 1024,
+                 exclude: tuple[str, ...] = ()):
+        self.app = app
+        self.buckets = buckets
+        self.shedder = shedder
+        self.path_costs = path_costs or {}
+        self.bytes_per_token = bytes_per_token
+        self.exclude = exclude
+
+    def cost(self, scope: Scope) -> float:
+        """Estimate a request's cost in tokens from its path and declared body size."""
+        return self.path_costs.get(scope["path"], 1.0) + (content_length(scope) or 0) / self.bytes_per_token
+
+    def _charging_receive(self, key: str, receive: Receive) -> Receive:
+        async def charging_receive() -> Message:
+            message = await receive()
+            if message["type"] == "http.request" and message.get("body"):
+                self.buckets.charge(key, len(message["body"]) / self.bytes_per_token, time.monotonic())
+            return message
+
+        return charging_receive
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exclude:
+            await self.app(scope, receive, send)
+            return
+
+        if self.buckets is not None:
+            key = client_key(scope)
+            wait = self.buckets.take(key, self.cost(scope), time.monotonic())
+            if wait:
+                await self._reject(429, "Rate limit exceeded", wait, scope, receive, send)
+                return
+            if content_length(scope) is None:
+                receive = self._charging_receive(key, receive)
+        if self.shedder is None:
+            await self.app(scope, receive, send)
+            return
+        if self.shedder.should_shed():
+            await self._reject(503, "Server is overloaded", self.shedder.latency, scope, receive, send)
+            return
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.shedder.observe(time.perf_counter() - start)
+
+    async def _reject(self, status_code: int, detail: str, retry_after: float,
+                      scope: Scope, receive: Receive, send: Send) -> None:
+        response = NegotiatedResponse(
+            status_code=status_code,
+            content={"detail": detail},
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+        )
+        await response(scope, receive, send)
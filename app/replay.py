@@ -0,0 +1,183 @@
+"""Replay captured traffic against a server or the in-process app and report latency and diffs.
+
+Usage::
+
+    python -m app.replay capture.jsonl --rate 200 --concurrency 16
+    python -m app.replay capture.jsonl --url http://localhost:8000
+
+Without ``--url`` the requests go to ``app.main:app`` in-process. Requests
+are started at a fixed ``rate`` (open loop, so a slow server does not slow
+the load down) with at most ``concurrency`` in flight. Each response is
+compared with the recorded one.
+"""
+
+import argparse
+import asyncio
+import json
+import re
+import sys
+import time
+from collections import defaultdict
+from typing import Any, Optional
+
+import httpx
+
+from app.capture import decode_body
+from app.utils import calculate_quantiles
+
+PERCENTILES = (0.5, 0.9, 0.99)
+# Endpoints whose responses legitimately differ between runs.
+DEFAULT_SKIP_DIFF = r"^/(jobs|sessions|ready|health)"
+
+
+def load_entries(path: str) -> tuple[list[dict[str, Any]], int]:
+    """Read replayable capture records; also return how many were skipped as truncated."""
+    entries, skipped = [], 0
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            if entry.get("truncated"):
+                skipped += 1
+            else:
+                entries.append(entry)
+    return entries, skipped
+
+
+def _parse(content: bytes) -> Any:
+    try:
+        return json.loads(content)
+    except ValueError:
+        return content
+
+
+def diff(entry: dict[str, Any], status: int, content: bytes) -> Optional[str]:
+    """Describe how a response differs from the recorded one, or return None if it matches.
+
+    JSON bodies are compared after parsing, so formatting differences are ignored.
+    """
+    if status != entry["status"]:
+        return f"status {entry['status']} != {status}"
+    expected = decode_body(entry["response"])
+    if expected == content or _parse(expected) == _parse(content):
+        return None
+    return f"body {expected[:200]!r} != {content[:200]!r}"
+
+
+class Report:
+    """Latencies, statuses and diffs collected during a replay, grouped by endpoint."""
+
+    def __init__(self):
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+        self.diffs: list[tuple[str, str]] = []
+        self.elapsed = 0.0
+        self.skipped = 0
+
+    @property
+    def total(self) -> int:
+        """Number of requests sent, including failed ones."""
+        return sum(len(values) for values in self.latencies.values()) + sum(self.errors.values())
+
+    def summary(self) -> dict[str, Any]:
+        """Return throughput, per-endpoint latency percentiles in ms and diff counts."""
+        endpoints = {}
+        for name in sorted(set(self.latencies) | set(self.errors)):
+            values = [x * 1000 for x in self.latencies[name]]
+            quantiles = calculate_quantiles(values, list(PERCENTILES)) if values else []
+            endpoints[name] = {
+                "count": len(values),
+                "errors": self.errors[name],
+                **{f"p{round(q * 100)}_ms": round(v, 3) for q, v in zip(PERCENTILES, quantiles)},
+                "max_ms": round(max(values), 3) if values else None,
+            }
+        return {
+            "requests": self.total,
+            "skipped": self.skipped,
+            "elapsed_s": round(self.elapsed, 3),
+            "throughput_rps": round(self.total / self.elapsed, 1) if self.elapsed else 0.0,
+            "diffs": len(self.diffs),
+            "endpoints": endpoints,
+        }
+
+
+def endpoint_name(entry: dict[str, Any]) -> str:
+    """Group requests by method and route name, falling back to the path."""
+    return f"{entry['method']} {entry.get('operation') or entry['path']}"
+
+
+async def replay(entries: list[dict[str, Any]], client: httpx.AsyncClient, rate: float = 100.0,
+                 concurrency: int = 10, skip_diff: str = DEFAULT_SKIP_DIFF) -> Report:
+    """Send the captured requests at ``rate`` per second and collect a report."""
+    report = Report()
+    semaphore = asyncio.Semaphore(concurrency)
+    skip = re.compile(skip_diff) if skip_diff else None
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+
+    async def send(index: int, entry: dict[str, Any]) -> None:
+        await asyncio.sleep(max(0.0, start + index / rate - loop.time()))
+        name = endpoint_name(entry)
+        async with semaphore:
+            began = time.perf_counter()
+            try:
+                response = await client.request(
+                    entry["method"],
+                    entry["path"] + (f"?{entry['query']}" if entry.get("query") else ""),
+                    content=decode_body(entry["body"]),
+                    headers=entry.get("headers", {}),
+                )
+            except httpx.HTTPError:
+                report.errors[name] += 1
+                return
+            report.latencies[name].append(time.perf_counter() - began)
+        if skip is None or not skip.search(entry["path"]):
+            difference = diff(entry, response.status_code, response.content)
+            if difference is not None:
+                report.diffs.append((f"{entry['method']} {entry['path']}", difference))
+
+    await asyncio.gather(*(send(i, entry) for i, entry in enumerate(entries)))
+    report.elapsed = loop.time() - start
+    return report
+
+
+async def run(path: str, url: Optional[str], rate: float, concurrency: int, skip_diff: str) -> Report:
+    """Replay a capture file against ``url`` or, without one, the in-process app."""
+    entries, skipped = load_entries(path)
+    limits = httpx.Limits(max_connections=concurrency)
+    if url is not None:
+        async with httpx.AsyncClient(base_url=url, limits=limits, timeout=60) as client:
+            report = await replay(entries, client, rate, concurrency, skip_diff)
+    else:
+        from app.main import app
+
+        async with app.router.lifespan_context(app):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://replay", timeout=60) as client:
+                report = await replay(entries, client, rate, concurrency, skip_diff)
+    report.skipped = skipped
+    return report
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Run the replay CLI; the exit status is 1 if any response differed."""
+    parser = argparse.ArgumentParser(description="Replay captured traffic and report latency and response diffs.")
+    parser.add_argument("capture", help="JSONL file written by the capture middleware")
+    parser.add_argument("--url", help="server to replay against; defaults to the in-process app")
+    parser.add_argument("--rate", type=float, default=100.0, help="requests started per second (default 100)")
+    parser.add_argument("--concurrency", type=int, default=10, help="maximum requests in flight (default 10)")
+    parser.add_argument("--skip-diff", default=DEFAULT_SKIP_DIFF,
+                        help=f"regex of paths whose responses are not compared (default {DEFAULT_SKIP_DIFF!r})")
+    parser.add_argument("--show-diffs", type=int, default=10, help="number of diffs to print (default 10)")
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(run(args.capture, args.url, args.rate, args.concurrency, args.skip_diff))
+    print(json.dumps(report.summary(), indent=2))
+    for request, difference in report.diffs[:args.show_diffs]:
+        print(f"DIFF {request}: {difference}", file=sys.stderr)
+    return 1 if report.diffs else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+"""Sliding-window statistics computed in O(n) over a series."""
+
+import math
+from collections import deque
+from typing import Iterable, Iterator, Optional
+
+OVERFLOW_MESSAGE = "Window statistics overflow"
+
+# Recompute the variance from the window when an eviction removes all but this
+# fraction of it; below that the incremental update has lost too many digits.
+_CANCELLATION_RATIO = 1e-3
+
+
+def _add_exact(partials: list[float], value: float) -> None:
+    """Add ``value`` to a list of non-overlapping partial sums without rounding.
+
+    This is the accumulation step of ``math.fsum``; ``math.fsum(partials)``
+    gives the correctly rounded total.
+    """
+    i = 0
+    for partial in partials:
+        if abs(value) < abs(partial):
+            value, partial = partial, value
+        high = value + partial
+        low = partial - (high - value)
+        if low:
+            partials[i] = low
+            i += 1
+        value = high
+    partials[i:] = [value]
+
+
+class RollingWindow:
+    """Incremental statistics over the last ``size`` values pushed.
+
+    The sum is kept exactly as fsum-style partials and min/max are tracked
+    with monotonic deques. The variance accumulator is updated incrementally
+    and recomputed from the window every ``size`` pushes, or sooner when an
+    eviction cancels most of it, so every push is amortized O(1).
+    """
+
+    def __init__(self, size: int):
+        if size < 1:
+            raise ValueError("Window size must be a positive integer")
+        self.size = size
+        self._values: deque[float] = deque()
+        self._mins: deque[tuple[int, float]] = deque()
+        self._maxs: deque[tuple[int, float]] = deque()
+        self._index = 0
+        self._partials: list[float] = []
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._since_recompute = 0
+
+    def push(self, value: float) -> Optional[dict[str, float]]:
+        """Add a value; return the window's statistics once the window is full.
+
+        Raises ``ValueError`` for non-finite values and for windows whose sum
+        or variance overflows a float; the window is unusable after the latter.
+        """
+        if not math.isfinite(value):
+            raise ValueError(f"Invalid number: {value!r}")
+        try:
+            return self._push(value)
+        except OverflowError:
+            raise ValueError(OVERFLOW_MESSAGE) from None
+
+    def _push(self, value: float) -> Optional[dict[str, float]]:
+        index = self._index
+        self._index += 1
+        self._values.append(value)
+        _add_exact(self._partials, value)
+        n = len(self._values)
+        delta = value - self._mean
+        self._mean += delta / n
+        self._m2 += delta * (value - self._mean)
+
+        while self._mins and self._mins[-1][1] > value:
+            self._mins.pop()
+        self._mins.append((index, value))
+        while self._maxs and self._maxs[-1][1] < value:
+            self._maxs.pop()
+        self._maxs.append((index, value))
+
+        if n > self.size:
+            self._evict(self._values.popleft())
+        self._since_recompute += 1
+        if self._since_recompute >= self.size:
+            self._recompute()
+        start = index - self.size + 1
+        if self._mins[0][0] < start:
+            self._mins.popleft()
+        if self._maxs[0][0] < start:
+            self._maxs.popleft()
+
+        if len(self._values) < self.size:
+            return None
+        return self.statistics()
+
+    def _evict(self, value: float) -> None:
+        _add_exact(self._partials, -value)
+        n = len(self._values)
+        previous_m2 = self._m2
+        delta = value - self._mean
+        self._mean -= delta / n
+        self._m2 -= delta * (value - self._mean)
+        if previous_m2 > 0 and self._m2 <= previous_m2 * _CANCELLATION_RATIO:
+            self._recompute()
+
+    def _recompute(self) -> None:
+        """Rebuild the mean and variance accumulator from the window values."""
+        mean = math.fsum(self._values) / len(self._values)
+        self._mean = mean
+        self._m2 = math.fsum((x - mean) ** 2 for x in self._values)
+        self._since_recompute = 0
+
+    def statistics(self) -> dict[str, float]:
+        """Return mean/min/max/sum (as in get_statistics) plus population stddev."""
+        n = len(self._values)
+        if n == 0:
+            return {"mean": 0, "min": 0, "max": 0, "sum": 0, "stddev": 0}
+        try:
+            total = math.fsum(self._partials)
+        except (OverflowError, ValueError):
+            raise ValueError(OVERFLOW_MESSAGE) from None
+        variance = max(self._m2, 0.0) / n
+        if not (math.isfinite(total) and math.isfinite(variance)):
+            raise ValueError(OVERFLOW_MESSAGE)
+        return {
+            "mean": total / n,
+            "min": self._mins[0][1],
+            "max": self._maxs[0][1],
+            "sum": total,
+            "stddev": math.sqrt(variance),
+        }
+
+
+def iter_rolling_statistics(numbers: Iterable[float], window: int) -> Iterator[dict[str, float]]:
+    """Yield the statistics of every full window as values are consumed."""
+    rolling = RollingWindow(window)
+    for value in numbers:
+        stats = rolling.push(value)
+        if stats is not None:
+            yield stats
+
+
+def rolling_statistics(numbers: list[float], window: int) -> list[dict[str, float]]:
+    """Calculate statistics for every window of ``window`` consecutive numbers."""
+    return list(iter_rolling_statistics(numbers, window))
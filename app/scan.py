@@ -0,0 +1,133 @@
+"""Cumulative scans over a series: prefix sums, running products, min/max and differences."""
+
+import math
+import operator
+from itertools import accumulate
+from typing import Any, Optional
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy is optional
+    np = None
+
+SCAN_OPS = ("cumsum", "cumprod", "cummin", "cummax", "diff")
+
+# Series with at least this many values use NumPy when it is available.
+NUMPY_MIN_LENGTH = 64
+
+
+def _check_finite(values: list[float]) -> list[float]:
+    if not all(math.isfinite(x) for x in values):
+        raise ValueError("Result is not a finite number")
+    return values
+
+
+def scan(numbers: list[float], op: str, compensated: bool = False) -> list[float]:
+    """Compute a cumulative scan of numbers in one pass.
+
+    ``diff`` returns one value fewer than its input. ``compensated`` uses
+    Neumaier summation for ``cumsum``, which keeps long float series accurate
+    at the cost of running in pure Python.
+    """
+    if op not in SCAN_OPS:
+        raise ValueError(f"Unknown scan operation: {op}")
+    if op == "cumsum" and compensated:
+        scanner = Scanner(op, compensated=True)
+        return _check_finite([scanner.push(x) for x in numbers])
+    if np is not None and len(numbers) >= NUMPY_MIN_LENGTH:
+        values = np.asarray(numbers, dtype=np.float64)
+        with np.errstate(over="ignore", invalid="ignore"):
+            if op == "cumsum":
+                result = np.cumsum(values)
+            elif op == "cumprod":
+                result = np.cumprod(values)
+            elif op == "cummin":
+                result = np.minimum.accumulate(values)
+            elif op == "cummax":
+                result = np.maximum.accumulate(values)
+            else:
+                result = np.diff(values)
+        if not np.isfinite(result).all():
+            raise ValueError("Result is not a finite number")
+        return result.tolist()
+    if op == "cumsum":
+        return _check_finite(list(accumulate(numbers)))
+    if op == "cumprod":
+        return _check_finite(list(accumulate(numbers, operator.mul)))
+    if op == "cummin":
+        return _check_finite(list(accumulate(numbers, min)))
+    if op == "cummax":
+        return _check_finite(list(accumulate(numbers, max)))
+    return _check_finite([b - a for a, b in zip(numbers, numbers[1:])])
+
+
+class Scanner:
+    """Incremental scan state; each push returns the next output value.
+
+    ``push`` returns None for the first value of ``diff``, which has no
+    predecessor.
+    """
+
+    def __init__(self, op: str, compensated: bool = False):
+        if op not in SCAN_OPS:
+            raise ValueError(f"Unknown scan operation: {op}")
+        self.op = op
+        self.compensated = compensated
+        self._total: Optional[float] = None
+        self._compensation = 0.0
+
+    def push(self, value: float) -> Optional[float]:
+        """Add a value and return the scan output for it."""
+        previous = self._total
+        if previous is None:
+            self._total = value
+            return None if self.op == "diff" else value
+        if self.op == "cumsum":
+            if self.compensated:
+                total = previous + value
+                if abs(previous) >= abs(value):
+                    self._compensation += (previous - total) + value
+                else:
+                    self._compensation += (value - total) + previous
+                self._total = total
+                return total + self._compensation
+            self._total = previous + value
+        elif self.op == "cumprod":
+            self._total = previous * value
+        elif self.op == "cummin":
+            self._total = min(previous, value)
+        elif self.op == "cummax":
+            self._total = max(previous, value)
+        else:
+            self._total = value
+            return value - previous
+        return self._total
+
+
+class ChunkedScanner:
+    """Group scan outputs into ``{"values": [...]}`` chunks for streaming."""
+
+    def __init__(self, op: str, compensated: bool = False, chunk_size: int = 1000):
+        self.scanner = Scanner(op, compensated)
+        self.chunk_size = chunk_size
+        self._chunk: list[float] = []
+
+    def push(self, value: float) -> Optional[dict[str, Any]]:
+        """Add a value; return a chunk once ``chunk_size`` outputs are ready."""
+        output = self.scanner.push(value)
+        if output is None:
+            return None
+        if not math.isfinite(output):
+            raise ValueError("Result is not a finite number")
+        self._chunk.append(output)
+        if len(self._chunk) < self.chunk_size:
+            return None
+        chunk, self._chunk = self._chunk, []
+        return {"values": chunk}
+
+    def finish(self) -> Optional[dict[str, Any]]:
+        """Return the last, partial chunk, if any."""
+        if not self._chunk:
+            return None
+        chunk, self._chunk = self._chunk, []
+        return {"values": chunk}
@@ -0,0 +1,168 @@
+"""MessagePack and CBOR request/response bodies, negotiated alongside JSON.
+
+Requests with a ``Content-Type`` of ``application/msgpack`` or
+``application/cbor`` are decoded by ``NegotiatedRoute`` and validated exactly
+like JSON bodies. ``NegotiationMiddleware`` picks the response format from
+``Accept`` and ``NegotiatedResponse`` renders in it, so the same models and
+error handlers serve every format.
+"""
+
+from contextvars import ContextVar
+from typing import Any, Callable
+
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from starlette.requests import Request
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - msgpack is optional
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:  # pragma: no cover - cbor2 is optional
+    cbor2 = None
+
+JSON = "application/json"
+MSGPACK = "application/msgpack"
+CBOR = "application/cbor"
+
+_ALIASES = {"application/x-msgpack": MSGPACK, "application/vnd.msgpack": MSGPACK}
+_NAMES = {MSGPACK: "MessagePack", CBOR: "CBOR"}
+
+
+def _codecs() -> dict[str, tuple[Callable[[Any], bytes], Callable[[bytes], Any], tuple]]:
+    codecs = {}
+    if msgpack is not None:
+        codecs[MSGPACK] = (msgpack.packb, msgpack.unpackb, (ValueError, TypeError, msgpack.UnpackException))
+    if cbor2 is not None:
+        codecs[CBOR] = (cbor2.dumps, cbor2.loads, (ValueError, TypeError, cbor2.CBORDecodeError))
+    return codecs
+
+
+# Encoder, decoder and decoding errors for each installed binary format.
+CODECS = _codecs()
+
+response_format: ContextVar[str] = ContextVar("response_format", default=JSON)
+
+# Returned by decode_body for bodies that are not MessagePack or CBOR.
+NOT_DECODED = object()
+
+
+def media_type_of(header: str) -> str:
+    """Return the bare, canonical media type of a Content-Type header."""
+    media_type = header.split(";")[0].strip().lower()
+    return _ALIASES.get(media_type, media_type)
+
+
+def negotiate_format(accept: str) -> str:
+    """Pick JSON or an installed binary format for an Accept header.
+
+    The client's q-values decide. At equal q, an exact media type beats a
+    wildcard and JSON beats the binary formats, so ``*/*`` gets JSON.
+    """
+    best, best_rank = JSON, (0.0, False, False)
+    for part in accept.split(","):
+        media_type = media_type_of(part)
+        q = 1.0
+        for param in part.split(";")[1:]:
+            name, _, value = param.strip().partition("=")
+            if name.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if media_type in (JSON, *CODECS):
+            candidate, rank = media_type, (q, True, media_type == JSON)
+        elif media_type in ("application/*", "*/*"):
+            candidate, rank = JSON, (q, False, True)
+        else:
+            continue
+        if q > 0 and rank > best_rank:
+            best, best_rank = candidate, rank
+    return best
+
+
+class NegotiatedResponse(JSONResponse):
+    """JSON response that renders as MessagePack or CBOR when the client asked for it."""
+
+    def __init__(self, content: Any, *args: Any, **kwargs: Any):
+        self.media_type = response_format.get()
+        super().__init__(content, *args, **kwargs)
+
+    def render(self, content: Any) -> bytes:
+        if self.media_type in CODECS:
+            return CODECS[self.media_type][0](content)
+        return super().render(content)
+
+
+class NegotiationMiddleware:
+    """ASGI middleware choosing each request's response format from its Accept header."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        accept = ""
+        for name, value in scope.get("headers", ()):
+            if name == b"accept":
+                accept = value.decode("latin-1")
+                break
+        token = response_format.set(negotiate_format(accept) if accept else JSON)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            response_format.reset(token)
+
+
+async def decode_body(request: Request) -> Any:
+    """Decode a MessagePack or CBOR request body.
+
+    Returns ``NOT_DECODED`` for other content types. Undecodable bodies raise
+    ``RequestValidationError``, as invalid JSON does. The result is kept in
+    the request scope, so later calls return it without decoding again.
+    """
+    if "decoded_body" in request.scope:
+        return request.scope["decoded_body"]
+    media_type = media_type_of(request.headers.get("content-type", ""))
+    if media_type not in CODECS:
+        return NOT_DECODED
+    body = await request.body()
+    _, decode, errors = CODECS[media_type]
+    try:
+        request.scope["decoded_body"] = decode(body)
+    except errors:
+        raise RequestValidationError([{
+            "type": "value_error",
+            "loc": ("body",),
+            "msg": f"{_NAMES[media_type]} decode error",
+            "input": {},
+        }])
+    return request.scope["decoded_body"]
+
+
+class NegotiatedRoute(APIRoute):
+    """Route that feeds decoded MessagePack and CBOR bodies to FastAPI's JSON body handling."""
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Any:
+            decoded = await decode_body(request)
+            if decoded is not NOT_DECODED:
+                # FastAPI only parses application/json bodies, through request.json().
+                request._json = decoded
+                request.scope["headers"] = [
+                    (name, JSON.encode() if name == b"content-type" else value)
+                    for name, value in request.scope["headers"]
+                ]
+                del request._headers
+            return await handler(request)
+
+        return route_handler
@@ -0,0 +1,156 @@
+"""Statistics sessions: clients append batches of numbers and query running statistics."""
+
+import math
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Callable, Optional
+
+OVERFLOW_MESSAGE = "Session statistics overflow"
+
+
+class Accumulator:
+    """Count, mean, variance, min, max and sum of a series, without keeping its values.
+
+    Each batch is summarized in two passes and merged in with Chan et al.'s
+    parallel update, which stays accurate where a running sum of squares
+    would cancel. Two accumulators can be merged the same way, so a series
+    may be summarized in parts.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.sum = 0.0
+
+    def add(self, numbers: list[float]) -> None:
+        """Add a batch of numbers.
+
+        Raises ``ValueError`` for non-finite numbers and when the sum or
+        variance would overflow a float, leaving the accumulator unchanged.
+        """
+        if not numbers:
+            return
+        if not all(math.isfinite(x) for x in numbers):
+            raise ValueError("Numbers must be finite")
+        batch = Accumulator()
+        batch.count = len(numbers)
+        try:
+            batch.sum = math.fsum(numbers)
+            batch.mean = batch.sum / batch.count
+            batch.m2 = math.fsum((x - batch.mean) ** 2 for x in numbers)
+        except OverflowError:
+            raise ValueError(OVERFLOW_MESSAGE) from None
+        batch.min = min(numbers)
+        batch.max = max(numbers)
+        self.merge(batch)
+
+    def merge(self, other: "Accumulator") -> None:
+        """Merge another accumulator's series into this one.
+
+        Raises ``ValueError`` when the result would overflow, leaving this
+        accumulator unchanged.
+        """
+        if other.count == 0:
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        try:
+            total = math.fsum((self.sum, other.sum))
+        except OverflowError:
+            raise ValueError(OVERFLOW_MESSAGE) from None
+        # Weights are applied before squaring so that large deltas only overflow when the result does.
+        mean = self.mean + delta * (other.count / count)
+        m2 = self.m2 + other.m2 + delta * (delta * (self.count * other.count / count))
+        if not (math.isfinite(mean) and math.isfinite(m2)):
+            raise ValueError(OVERFLOW_MESSAGE)
+        self.count, self.mean, self.m2, self.sum = count, mean, m2, total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def statistics(self) -> dict:
+        """Return the statistics of everything added so far; zeros when empty."""
+        if self.count == 0:
+            return {"count": 0, "mean": 0, "min": 0, "max": 0, "sum": 0, "variance": 0, "stddev": 0}
+        variance = max(self.m2, 0.0) / self.count
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "min": self.min,
+            "max": self.max,
+            "sum": self.sum,
+            "variance": variance,
+            "stddev": math.sqrt(variance),
+        }
+
+
+class SessionStore:
+    """Sessions held in memory, bounded by count and idle time.
+
+    Sessions are kept in least-recently-used order. Creating a session when
+    ``max_sessions`` are open evicts the least recently used one, and a
+    session idle for longer than ``ttl`` seconds expires.
+    """
+
+    def __init__(self, max_sessions: int = 1000, ttl: float = 3600, clock: Callable[[], float] = time.monotonic):
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self.clock = clock
+        self._sessions: OrderedDict[str, tuple[Accumulator, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def create(self) -> str:
+        """Open a new, empty session and return its id."""
+        session_id = uuid.uuid4().hex
+        with self._lock:
+            now = self.clock()
+            self._expire(now)
+            while len(self._sessions) >= self.max_sessions:
+                self._sessions.popitem(last=False)
+            self._sessions[session_id] = (Accumulator(), now)
+        return session_id
+
+    def _expire(self, now: float) -> None:
+        # Least recently used first, so stop at the first live session.
+        while self._sessions:
+            session_id, (_, last_used) = next(iter(self._sessions.items()))
+            if now - last_used <= self.ttl:
+                return
+            del self._sessions[session_id]
+
+    def _touch(self, session_id: str) -> Optional[Accumulator]:
+        now = self.clock()
+        self._expire(now)
+        item = self._sessions.get(session_id)
+        if item is None:
+            return None
+        self._sessions[session_id] = (item[0], now)
+        self._sessions.move_to_end(session_id)
+        return item[0]
+
+    def append(self, session_id: str, numbers: list[float]) -> Optional[dict]:
+        """Add numbers to a session and return its statistics, or None if it does not exist."""
+        with self._lock:
+            accumulator = self._touch(session_id)
+            if accumulator is None:
+                return None
+            accumulator.add(numbers)
+            return accumulator.statistics()
+
+    def statistics(self, session_id: str) -> Optional[dict]:
+        """Return a session's statistics, or None if it does not exist."""
+        with self._lock:
+            accumulator = self._touch(session_id)
+            return accumulator.statistics() if accumulator is not None else None
+
+    def delete(self, session_id: str) -> bool:
+        """Close a session; return False if it did not exist."""
+        with self._lock:
+            return self._sessions.pop(session_id, None) is not None
@@ -0,0 +1,126 @@
+"""Helpers for endpoints that consume or produce streams of numbers."""
+
+import json
+import math
+import re
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Optional
+from urllib.parse import parse_qsl
+
+from pydantic import BaseModel, ValidationError
+from starlette.types import Receive, Scope, Send
+
+from app.errors import validation_error_content
+from app.serialization import NegotiatedResponse
+
+_SEPARATORS = re.compile(rb"[\s,\[\]]+")
+
+
+def _parse_token(token: bytes) -> float:
+    try:
+        value = float(token)
+    except ValueError:
+        raise ValueError(f"Invalid number: {token.decode(errors='replace')!r}")
+    if not math.isfinite(value):
+        raise ValueError(f"Invalid number: {token.decode(errors='replace')!r}")
+    return value
+
+
+async def iter_numbers(chunks: AsyncIterable[bytes]) -> AsyncIterator[float]:
+    """Parse numbers from a byte stream as they arrive.
+
+    Numbers may be separated by whitespace, newlines or commas, so both
+    newline-delimited input and a plain JSON array are accepted.
+    """
+    pending = b""
+    async for chunk in chunks:
+        pending += chunk
+        tokens = _SEPARATORS.split(pending)
+        # The last token may continue in the next chunk.
+        pending = tokens.pop()
+        for token in tokens:
+            if token:
+                yield _parse_token(token)
+    if pending:
+        yield _parse_token(pending)
+
+
+async def iter_body(receive: Receive) -> AsyncIterator[bytes]:
+    """Yield the request body chunks from an ASGI receive channel."""
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            return
+        yield message.get("body", b"")
+        if not message.get("more_body", False):
+            return
+
+
+def ndjson_line(item: Any) -> str:
+    """Encode one item as a newline-delimited JSON line."""
+    return json.dumps(item, separators=(",", ":")) + "\n"
+
+
+class NumberStreamEndpoint:
+    """ASGI endpoint that turns a streamed body of numbers into NDJSON results.
+
+    ``processor`` receives the validated query parameters and returns an
+    object whose ``push`` method is called with each number; every non-None
+    value it returns is written as one output line. If the object has a
+    ``finish`` method, its non-None result is written at the end of input.
+    The body is read with this endpoint's own receive loop rather than from
+    inside a ``StreamingResponse``, whose disconnect listener would compete
+    for the body messages.
+
+    Query parameter errors are answered with 422 and an invalid first number
+    with 400, as for the JSON endpoints. Once output has started, an invalid
+    number ends the stream: pending output is flushed with ``finish`` and a
+    final ``{"error": ...}`` line is written.
+    """
+
+    def __init__(self, params_model: type[BaseModel], processor: Callable[[Any], Any]):
+        self.params_model = params_model
+        self.processor = processor
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        query = dict(parse_qsl(scope["query_string"].decode("latin-1")))
+        try:
+            params = self.params_model.model_validate(query)
+        except ValidationError as exc:
+            errors = [{**error, "loc": ("query", *error["loc"])} for error in exc.errors()]
+            response = NegotiatedResponse(status_code=422, content=validation_error_content(errors))
+            await response(scope, receive, send)
+            return
+
+        numbers = iter_numbers(iter_body(receive))
+        try:
+            first = await numbers.__anext__()
+        except StopAsyncIteration:
+            first = None
+        except ValueError as e:
+            await NegotiatedResponse(status_code=400, content={"detail": str(e)})(scope, receive, send)
+            return
+
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"application/x-ndjson")],
+        })
+        state = self.processor(params)
+
+        async def emit(item: Optional[Any]) -> None:
+            if item is not None:
+                await send({"type": "http.response.body", "body": ndjson_line(item).encode(), "more_body": True})
+
+        finish = getattr(state, "finish", None)
+        try:
+            if first is not None:
+                await emit(state.push(first))
+                async for value in numbers:
+                    await emit(state.push(value))
+            if finish is not None:
+                await emit(finish())
+        except ValueError as e:
+            if finish is not None:
+                await emit(finish())
+            await send({"type": "http.response.body", "body": ndjson_line({"error": str(e)}).encode(), "more_body": True})
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
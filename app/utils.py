@@ -1,7 +1,90 @@
 """Utility functions for math operations."""
 
 import math
-from typing import Optional
+from typing import Optional, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy is optional
+    np = None
+
+
+def add(a: float, b: float) -> float:
+    """Add two numbers."""
+    return a + b
+
+
+def subtract(a: float, b: float) -> float:
+    """Subtract the second number from the first."""
+    return a - b
+
+
+def multiply(a: float, b: float) -> float:
+    """Multiply two numbers."""
+    return a * b
+
+
+def divide(a: float, b: float) -> float:
+    """Divide the first number by the second."""
+    return a / b
+
+
+def power(a: float, b: float) -> float:
+    """Raise the first number to the power of the second."""
+    return math.pow(a, b)
+
+
+def modulo(a: float, b: float) -> float:
+    """Calculate the remainder of dividing the first number by the second."""
+    return a % b
+
+
+def square_root(value: float) -> float:
+    """Calculate the square root of a number."""
+    return math.sqrt(value)
+
+
+def exact_power(base: int, exponent: int, max_digits: int = 4300) -> int:
+    """Raise an integer to a non-negative integer power exactly.
+
+    Results longer than ``max_digits`` decimal digits are rejected. A lower
+    bound on the result's size is taken from the base's bit length first, so
+    oversized results are refused before any work is done.
+    """
+    if exponent < 0:
+        raise ValueError("Exponent must be a non-negative integer")
+    # |base| >= 2 ** (bits - 1), and 0.30102 < log10(2); integers only, so huge exponents cannot overflow.
+    if (abs(base).bit_length() - 1) * exponent * 30102 >= max_digits * 100000:
+        raise ValueError(f"Result would exceed {max_digits} digits")
+    result = base ** exponent
+    if abs(result) >= 10 ** max_digits:
+        raise ValueError(f"Result would exceed {max_digits} digits")
+    return result
+
+
+def modular_power(base: int, exponent: int, modulus: int, max_bits: int = 4096) -> int:
+    """Calculate ``base ** exponent % modulus`` without computing the full power.
+
+    Negative exponents use the modular inverse of the base. Exponents and
+    moduli longer than ``max_bits`` bits are rejected, since the work grows
+    with the exponent's length times the square of the modulus's.
+    """
+    if modulus == 0:
+        raise ValueError("Modulus cannot be zero")
+    if exponent.bit_length() > max_bits or modulus.bit_length() > max_bits:
+        raise ValueError(f"Exponent and modulus are limited to {max_bits} bits")
+    try:
+        return pow(base, exponent, modulus)
+    except ValueError:
+        raise ValueError("Base is not invertible for the given modulus")
+
+
+def modular_power_cost(exponent: int, modulus: int) -> int:
+    """Estimate the relative work of ``modular_power``: exponent bits times modulus bits squared.
+
+    Lengths are counted as at least 64 bits, the size of a machine word.
+    """
+    return max(exponent.bit_length(), 64) * max(modulus.bit_length(), 64) ** 2
 
 
 def validate_division(b: float) -> bool:
@@ -43,15 +126,169 @@ def format_number(number: float) -> str:
     return f"{number:,.2f}"
 
 
-def get_statistics(numbers: list[float]) -> dict[str, float]:
-    """Calculate statistics for a list of numbers."""
-    if not numbers:
-        return {"mean": 0, "min": 0, "max": 0, "sum": 0}
-    
-    return {
-        "mean": sum(numbers) / len(numbers),
-        "min": min(numbers),
-        "max": max(numbers),
-        "sum": sum(numbers)
-    }
+def _partition3(values: list[float], left: int, right: int, pivot: float) -> tuple[int, int]:
+    """Three-way partition values[left:right + 1] around pivot.
+
+    Returns (lt, gt) with values < pivot before lt, values == pivot in
+    lt..gt and values > pivot after gt, so duplicates cannot degrade it.
+    """
+    lt, i, gt = left, left, right
+    while i <= gt:
+        value = values[i]
+        if value < pivot:
+            values[lt], values[i] = value, values[lt]
+            lt += 1
+            i += 1
+        elif value > pivot:
+            values[gt], values[i] = value, values[gt]
+            gt -= 1
+        else:
+            i += 1
+    return lt, gt
+
+
+def _median_of_medians(values: list[float], left: int, right: int) -> float:
+    """Pick a pivot guaranteed to split values[left:right + 1] reasonably."""
+    medians = []
+    for start in range(left, right + 1, 5):
+        group = sorted(values[start:min(start + 5, right + 1)])
+        medians.append(group[len(group) // 2])
+    return _select(medians, len(medians) // 2, 0, len(medians) - 1)
+
+
+def _select(values: list[float], k: int, left: int, right: int) -> float:
+    """Introselect: quickselect that switches to median-of-medians pivots when it degrades."""
+    budget = 2 * (right - left + 1).bit_length()
+    while right > left:
+        if budget > 0:
+            budget -= 1
+            mid = (left + right) // 2
+            pivot = sorted((values[left], values[mid], values[right]))[1]
+        else:
+            pivot = _median_of_medians(values, left, right)
+        lt, gt = _partition3(values, left, right, pivot)
+        if k < lt:
+            right = lt - 1
+        elif k > gt:
+            left = gt + 1
+        else:
+            return values[k]
+    return values[k]
+
+
+def select_kth(values: list[float], k: int) -> float:
+    """Return the k-th smallest value (0-based) in O(n), reordering values in place."""
+    if not 0 <= k < len(values):
+        raise ValueError("k is out of range")
+    return _select(values, k, 0, len(values) - 1)
+
+
+def calculate_quantiles(numbers: list[float], quantiles: list[float]) -> list[float]:
+    """Calculate exact quantiles with linear interpolation, without sorting.
+
+    Uses NumPy's partition when it is installed, otherwise introselect on a
+    copy of the input.
+    """
+    if any(not 0 <= q <= 1 for q in quantiles):
+        raise ValueError("Quantiles must be between 0 and 1")
+    n = len(numbers)
+    positions = [q * (n - 1) for q in quantiles]
+    needed = sorted({math.floor(p) for p in positions} | {math.ceil(p) for p in positions})
+    if np is not None:
+        partitioned = np.partition(np.asarray(numbers, dtype=np.float64), needed)
+        picked = {k: float(partitioned[k]) for k in needed}
+    else:
+        scratch = list(numbers)
+        picked = {}
+        left = 0
+        for k in needed:
+            # Everything before k is no larger, so later selections can skip it.
+            picked[k] = float(_select(scratch, k, left, n - 1))
+            left = k
+    result = []
+    for position in positions:
+        low, high = picked[math.floor(position)], picked[math.ceil(position)]
+        result.append(low + (high - low) * (position - math.floor(position)))
+    return result
+
+
+def calculate_histogram(numbers: list[float], bins: Union[int, str] = "auto",
+                        low: Optional[float] = None, high: Optional[float] = None) -> dict[str, list]:
+    """Count numbers into equal-width bins between low and high.
+
+    ``bins="auto"`` uses Sturges' rule. ``low`` and ``high`` default to the
+    minimum and maximum of the numbers.
+    """
+    n = len(numbers)
+    if bins == "auto":
+        bins = math.ceil(math.log2(n)) + 1 if n else 1
+    if not isinstance(bins, int) or bins < 1:
+        raise ValueError("Bins must be a positive integer or 'auto'")
+    if n == 0:
+        return {"edges": [], "counts": []}
+    low = min(numbers) if low is None else low
+    high = max(numbers) if high is None else high
+    low, high = float(low), float(high)
+    if low == high:
+        low, high = low - 0.5, high + 0.5
+    if np is not None:
+        counts, edges = np.histogram(np.asarray(numbers, dtype=np.float64), bins=bins, range=(low, high))
+        return {"edges": edges.tolist(), "counts": counts.tolist()}
+    step = (high - low) / bins
+    edges = [low + i * step for i in range(bins)] + [high]
+    counts = [0] * bins
+    scale = bins / (high - low)
+    for value in numbers:
+        index = min(int((value - low) * scale), bins - 1)
+        # Correct for rounding in the scaled index near an edge.
+        if value < edges[index]:
+            index -= 1
+        elif index < bins - 1 and value >= edges[index + 1]:
+            index += 1
+        counts[index] += 1
+    return {"edges": edges, "counts": counts}
+
+
+def get_statistics(numbers: list[float], quantiles: Optional[list[float]] = None,
+                   median: bool = False, bins: Optional[Union[int, str]] = None) -> dict:
+    """Calculate statistics for a list of numbers.
 
+    Quantiles, the median and a histogram are only computed when requested.
+    With NumPy installed the input is converted to an array once, and the
+    sum, extremes, quantiles and histogram are all taken from that array.
+    """
+    if np is not None and numbers:
+        numbers = np.asarray(numbers, dtype=np.float64)
+    if len(numbers) == 0:
+        stats = {"mean": 0, "min": 0, "max": 0, "sum": 0}
+    elif np is not None:
+        total = float(numbers.sum())
+        stats = {
+            "mean": total / len(numbers),
+            "min": float(numbers.min()),
+            "max": float(numbers.max()),
+            "sum": total
+        }
+    else:
+        total = sum(numbers)
+        stats = {
+            "mean": total / len(numbers),
+            "min": min(numbers),
+            "max": max(numbers),
+            "sum": total
+        }
+    wanted = list(quantiles or [])
+    if median:
+        wanted.append(0.5)
+    if wanted:
+        values = calculate_quantiles(numbers, wanted) if len(numbers) else [0] * len(wanted)
+        if quantiles:
+            stats["quantiles"] = {str(q): v for q, v in zip(quantiles, values)}
+        if median:
+            stats["median"] = values[-1]
+    if bins is not None:
+        if len(numbers):
+            stats["histogram"] = calculate_histogram(numbers, bins, stats["min"], stats["max"])
+        else:
+            stats["histogram"] = calculate_histogram(numbers, bins)
+    return stats
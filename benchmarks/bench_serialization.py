@@ -0,0 +1,63 @@
+"""Compare encode/decode cost of JSON, MessagePack and CBOR request and response bodies.
+
+Run from the repository root with ``python -m benchmarks.bench_serialization``.
+MessagePack and CBOR are skipped when ``msgpack`` or ``cbor2`` is not installed.
+"""
+
+import argparse
+import json
+import random
+import timeit
+
+from pydantic import TypeAdapter
+
+from app.models import MathRequest, MathResponse
+from app.serialization import CBOR, CODECS, MSGPACK
+
+PAYLOADS = {
+    "MathRequest": (TypeAdapter(MathRequest), {"a": 10.5, "b": 5.25}),
+    "MathResponse": (TypeAdapter(MathResponse), {"result": 15.75}),
+}
+
+
+def json_dumps(content):
+    """Encode like the API's JSON responses."""
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode()
+
+
+def time_call(function, number):
+    """Return the best per-call time of ``function`` in microseconds."""
+    return min(timeit.repeat(function, number=number, repeat=5)) / number * 1e6
+
+
+def bench(name, adapter, content, number):
+    """Print encode and decode+validate timings for one payload in every format."""
+    formats = {"json": (json_dumps, json.loads)}
+    for media_type, label in ((MSGPACK, "msgpack"), (CBOR, "cbor")):
+        if media_type in CODECS:
+            formats[label] = CODECS[media_type][:2]
+    for label, (encode, decode) in formats.items():
+        data = encode(content)
+        encode_time = time_call(lambda: encode(content), number)
+        if label == "json":
+            decode_time = time_call(lambda: adapter.validate_json(data), number)
+        else:
+            decode_time = time_call(lambda: adapter.validate_python(decode(data)), number)
+        print(f"{name:<16} {label:<8} {len(data):>9} {encode_time:>11.2f} {decode_time:>16.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=10_000, help="calls per timing for small payloads")
+    parser.add_argument("--size", type=int, default=10_000, help="length of the /statistics list")
+    args = parser.parse_args()
+
+    print(f"{'payload':<16} {'format':<8} {'bytes':>9} {'encode us':>11} {'decode+valid us':>16}")
+    for name, (adapter, content) in PAYLOADS.items():
+        bench(name, adapter, content, args.number)
+    numbers = [random.uniform(-1e6, 1e6) for _ in range(args.size)]
+    bench(f"list[{args.size}]", TypeAdapter(list[float]), numbers, max(1, args.number // args.size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+"""Shared test fixtures."""
+
+import pytest
+
+
+@pytest.fixture(params=["numpy", "pure"])
+def backend(request, monkeypatch):
+    """Run a test through NumPy and through pure Python.
+
+    The test module names the module to switch in ``BACKEND_MODULE``. For
+    the NumPy run, that module's ``NUMPY_MIN_*`` size thresholds are set to
+    0 so that small test inputs take the NumPy path too.
+    """
+    module = request.module.BACKEND_MODULE
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+        for name in dir(module):
+            if name.startswith("NUMPY_MIN_"):
+                monkeypatch.setattr(module, name, 0)
+    else:
+        monkeypatch.setattr(module, "np", None)
+    return request.param
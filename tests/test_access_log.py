@@ -0,0 +1,130 @@
+"""Tests for the buffered access log."""
+
+import json
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from app.access_log import AccessLog, AccessLogMiddleware, RingBuffer
+
+
+def read_lines(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+class TestRingBuffer:
+    """Test cases for RingBuffer class."""
+
+    def test_put_and_drain(self):
+        """Test items come out in order and in batches."""
+        buffer = RingBuffer(10)
+        for i in range(5):
+            assert buffer.put(i) is True
+        assert buffer.drain(3) == [0, 1, 2]
+        assert buffer.drain(3) == [3, 4]
+        assert buffer.drain(3) == []
+
+    def test_drop_on_overflow(self):
+        """Test a full buffer drops new items and counts them."""
+        buffer = RingBuffer(2)
+        buffer.put(1)
+        buffer.put(2)
+        assert buffer.put(3) is False
+        assert buffer.dropped == 1
+        assert len(buffer) == 2
+
+    def test_invalid_capacity(self):
+        """Test a non-positive capacity raises ValueError."""
+        with pytest.raises(ValueError, match="positive"):
+            RingBuffer(0)
+
+
+class TestAccessLog:
+    """Test cases for AccessLog class."""
+
+    def test_flush_writes_json_lines(self, tmp_path):
+        """Test buffered records are written as JSON lines."""
+        path = tmp_path / "access.log"
+        log = AccessLog(str(path), batch_size=2)
+        for i in range(5):
+            log.record({"n": i})
+        assert log.flush() == 5
+        log._close()
+        assert [line["n"] for line in read_lines(path)] == [0, 1, 2, 3, 4]
+
+    def test_writer_thread_flushes_on_stop(self, tmp_path):
+        """Test stopping the writer flushes pending records."""
+        path = tmp_path / "access.log"
+        log = AccessLog(str(path), flush_interval=60)
+        log.start()
+        log.record({"n": 1})
+        log.stop()
+        assert read_lines(path) == [{"n": 1}]
+
+    def test_rotation(self, tmp_path):
+        """Test the file is rotated once it reaches max_bytes."""
+        path = tmp_path / "access.log"
+        log = AccessLog(str(path), batch_size=1, max_bytes=20, backup_count=2)
+        for i in range(4):
+            log.record({"n": i, "pad": "x" * 10})
+            log.flush()
+        log._close()
+        assert (tmp_path / "access.log.1").exists()
+        assert (tmp_path / "access.log.2").exists()
+        assert not (tmp_path / "access.log.3").exists()
+        assert read_lines(tmp_path / "access.log.1")[0]["n"] == 3
+
+    def test_dropped_counter(self, tmp_path):
+        """Test records beyond capacity are dropped and counted."""
+        log = AccessLog(str(tmp_path / "access.log"), capacity=1)
+        assert log.record({"n": 1}) is True
+        assert log.record({"n": 2}) is False
+        assert log.dropped == 1
+
+
+class TestAccessLogMiddleware:
+    """Test cases for AccessLogMiddleware."""
+
+    @pytest.fixture
+    def log_and_client(self, tmp_path):
+        log = AccessLog(str(tmp_path / "access.log"))
+        app = FastAPI()
+
+        @app.post("/echo")
+        def echo(numbers: list[float]):
+            return {"count": len(numbers)}
+
+        @app.get("/fail")
+        def fail():
+            raise HTTPException(status_code=400, detail="bad")
+
+        app.add_middleware(AccessLogMiddleware, access_log=log)
+        return log, TestClient(app)
+
+    def test_records_request(self, log_and_client):
+        """Test a request is recorded with its size, status and latency."""
+        log, client = log_and_client
+        client.post("/echo", content=b"[1, 2, 3]", headers={"Content-Type": "application/json"})
+        [entry] = log.buffer.drain(10)
+        assert entry["method"] == "POST"
+        assert entry["path"] == "/echo"
+        assert entry["operation"] == "echo"
+        assert entry["request_bytes"] == 9
+        assert entry["status"] == 200
+        assert entry["duration_ms"] >= 0
+
+    def test_records_error_status(self, log_and_client):
+        """Test error responses are recorded with their status."""
+        log, client = log_and_client
+        client.get("/fail")
+        assert log.buffer.drain(10)[0]["status"] == 400
+
+    def test_records_unknown_path(self, log_and_client):
+        """Test unmatched paths are recorded without an operation."""
+        log, client = log_and_client
+        client.get("/missing")
+        entry = log.buffer.drain(10)[0]
+        assert entry["status"] == 404
+        assert entry["operation"] is None
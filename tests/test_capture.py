@@ -0,0 +1,94 @@
+"""Tests for traffic capture."""
+
+import json
+
+from fastapi import FastAPI
+from fastapi.responses import Response
+from fastapi.testclient import TestClient
+
+from app.access_log import AccessLog
+from app.capture import CaptureMiddleware, decode_body, encode_body
+
+
+def read_lines(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def make_client(capture_log, **options):
+    """Build a test app behind the capture middleware."""
+    app = FastAPI()
+
+    @app.post("/echo")
+    def echo(numbers: list[float]):
+        return {"count": len(numbers)}
+
+    @app.get("/binary")
+    def binary():
+        return Response(b"\xff\x00", media_type="application/octet-stream")
+
+    app.add_middleware(CaptureMiddleware, capture_log=capture_log, **options)
+    return TestClient(app)
+
+
+class TestBodyEncoding:
+    """Test cases for encode_body and decode_body."""
+
+    def test_round_trip(self):
+        """Test text and binary bodies round trip."""
+        assert encode_body(b"[1, 2]") == {"text": "[1, 2]"}
+        assert decode_body(encode_body(b"[1, 2]")) == b"[1, 2]"
+        assert "base64" in encode_body(b"\xff\x00")
+        assert decode_body(encode_body(b"\xff\x00")) == b"\xff\x00"
+
+
+class TestCaptureMiddleware:
+    """Test cases for CaptureMiddleware."""
+
+    def test_records_request_and_response(self, tmp_path):
+        """Test a sampled request is recorded with everything needed to replay it."""
+        capture_log = AccessLog(str(tmp_path / "capture.jsonl"))
+        client = make_client(capture_log, sample_rate=1.0)
+        client.post("/echo?x=1", json=[1, 2, 3], headers={"X-API-Key": "secret"})
+        capture_log.flush()
+        entry, = read_lines(tmp_path / "capture.jsonl")
+        assert entry["method"] == "POST"
+        assert entry["path"] == "/echo"
+        assert entry["query"] == "x=1"
+        assert entry["operation"] == "echo"
+        assert entry["headers"]["content-type"] == "application/json"
+        assert "x-api-key" not in entry["headers"]
+        assert entry["status"] == 200
+        assert entry["duration_ms"] >= 0
+        assert json.loads(entry["body"]["text"]) == [1, 2, 3]
+        assert json.loads(entry["response"]["text"]) == {"count": 3}
+
+    def test_binary_response(self, tmp_path):
+        """Test binary responses are recorded as base64."""
+        capture_log = AccessLog(str(tmp_path / "capture.jsonl"))
+        make_client(capture_log, sample_rate=1.0).get("/binary")
+        capture_log.flush()
+        entry, = read_lines(tmp_path / "capture.jsonl")
+        assert decode_body(entry["response"]) == b"\xff\x00"
+
+    def test_sampling(self, tmp_path):
+        """Test only sampled requests are recorded."""
+        capture_log = AccessLog(str(tmp_path / "capture.jsonl"))
+        draws = iter([0.5, 0.05, 0.2])
+        client = make_client(capture_log, sample_rate=0.1, rng=lambda: next(draws))
+        for n in range(3):
+            client.post("/echo", json=[0] * n)
+        capture_log.flush()
+        entry, = read_lines(tmp_path / "capture.jsonl")
+        assert json.loads(entry["response"]["text"]) == {"count": 1}
+
+    def test_large_bodies_are_truncated(self, tmp_path):
+        """Test bodies over the limit are left out."""
+        capture_log = AccessLog(str(tmp_path / "capture.jsonl"))
+        client = make_client(capture_log, sample_rate=1.0, max_body_bytes=10)
+        client.post("/echo", json=list(range(100)))
+        capture_log.flush()
+        entry, = read_lines(tmp_path / "capture.jsonl")
+        assert entry["truncated"] is True
+        assert "body" not in entry
+        assert entry["status"] == 200
@@ -0,0 +1,145 @@
+"""Tests for response compression."""
+
+import asyncio
+import gzip
+import zlib
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.compression import CompressionMiddleware, GzipEncoder, available_encoders, negotiate
+
+LARGE = "0123456789," * 10_000
+
+
+def make_client(**options):
+    """Build a test app behind the compression middleware."""
+    app = FastAPI()
+
+    @app.get("/small")
+    def small():
+        return PlainTextResponse("tiny")
+
+    @app.get("/large")
+    def large():
+        return PlainTextResponse(LARGE)
+
+    @app.get("/huge")
+    def huge():
+        return PlainTextResponse(LARGE * 10)
+
+    @app.get("/encoded")
+    def encoded():
+        return Response(gzip.compress(LARGE.encode()), headers={"Content-Encoding": "gzip"})
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse(iter([b"line 1\n", b"line 2\n"]), media_type="application/x-ndjson")
+
+    app.add_middleware(CompressionMiddleware, **options)
+    return TestClient(app)
+
+
+class TestNegotiate:
+    """Test cases for negotiate."""
+
+    def test_preference_order_breaks_ties(self):
+        """Test the server's order picks among equally weighted encodings."""
+        assert negotiate("gzip, br, zstd", ["zstd", "br", "gzip"]) == "zstd"
+
+    def test_q_values(self):
+        """Test the client's q-values take priority."""
+        assert negotiate("zstd;q=0.5, gzip", ["zstd", "gzip"]) == "gzip"
+
+    def test_refused(self):
+        """Test q=0 and unsupported encodings give identity."""
+        assert negotiate("gzip;q=0", ["gzip"]) is None
+        assert negotiate("deflate", ["gzip"]) is None
+
+    def test_wildcard(self):
+        """Test the wildcard accepts any encoding."""
+        assert negotiate("*", ["gzip"]) == "gzip"
+        assert negotiate("*;q=0, gzip", ["zstd", "gzip"]) == "gzip"
+
+
+class TestEncoders:
+    """Test cases for the incremental encoders."""
+
+    def test_gzip_flush_is_decodable(self):
+        """Test flushed output decodes before the stream is finished."""
+        encoder = GzipEncoder()
+        decoder = zlib.decompressobj(31)
+        assert decoder.decompress(encoder.compress(b"hello ", flush=True)) == b"hello "
+        assert decoder.decompress(encoder.compress(b"world") + encoder.finish()) == b"world"
+
+    @pytest.mark.parametrize("name, module", [("zstd", "zstandard"), ("br", "brotli")])
+    def test_optional_encoders(self, name, module):
+        """Test zstd and brotli round trip when installed."""
+        decoder = pytest.importorskip(module)
+        encoder = available_encoders()[name]()
+        data = encoder.compress(LARGE.encode(), flush=True) + encoder.finish()
+        if name == "zstd":
+            assert decoder.ZstdDecompressor().decompressobj().decompress(data) == LARGE.encode()
+        else:
+            assert decoder.decompress(data) == LARGE.encode()
+
+
+class TestCompressionMiddleware:
+    """Test cases for CompressionMiddleware."""
+
+    def test_large_response_is_compressed(self):
+        """Test large responses are gzip encoded."""
+        response = make_client().get("/large", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.text == LARGE
+
+    def test_huge_response_is_compressed_in_pieces(self):
+        """Test responses larger than one piece, compressed off the event loop, decode correctly."""
+        response = make_client().get("/huge", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.text == LARGE * 10
+
+    def test_small_response_is_not_compressed(self):
+        """Test responses under the minimum size are sent as is."""
+        response = make_client().get("/small", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in response.headers
+        assert response.text == "tiny"
+
+    def test_no_accept_encoding(self):
+        """Test clients that do not accept compression get identity."""
+        response = make_client().get("/large", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in response.headers
+        assert response.headers["content-length"] == str(len(LARGE))
+
+    def test_already_encoded(self):
+        """Test responses with a Content-Encoding are not compressed again."""
+        response = make_client().get("/encoded", headers={"Accept-Encoding": "gzip"})
+        assert response.text == LARGE
+
+    def test_stream_is_compressed(self):
+        """Test streamed responses are compressed regardless of size."""
+        response = make_client().get("/stream", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.text == "line 1\nline 2\n"
+
+    def test_stream_chunks_are_flushed(self):
+        """Test each streamed chunk can be decoded as soon as it is sent."""
+        async def app(scope, receive, send):
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"first\n", "more_body": True})
+            await send({"type": "http.response.body", "body": b"second\n", "more_body": False})
+
+        messages = []
+
+        async def send(message):
+            messages.append(message)
+
+        scope = {"type": "http", "headers": [(b"accept-encoding", b"gzip")]}
+        asyncio.run(CompressionMiddleware(app)(scope, None, send))
+        decoder = zlib.decompressobj(31)
+        bodies = [m["body"] for m in messages if m["type"] == "http.response.body"]
+        assert decoder.decompress(bodies[0]) == b"first\n"
+        assert decoder.decompress(b"".join(bodies[1:])) == b"second\n"
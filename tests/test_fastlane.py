@@ -0,0 +1,81 @@
+"""Tests for the raw ASGI fast lane.
+
+The endpoint tests from test_main are run again with the fast lane in front
+of the app, to check that responses are the same with and without it.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.fastlane import FastLane
+from app.main import app
+from tests import test_main
+from tests.test_main import (  # noqa: F401 - collected again with the fast lane client
+    TestAddEndpoint,
+    TestSubtractEndpoint,
+    TestMultiplyEndpoint,
+    TestIsEvenEndpoint,
+    TestDivideEndpoint,
+    TestBulkEndpoints,
+)
+
+fast_client = TestClient(FastLane(app))
+
+
+@pytest.fixture(autouse=True)
+def use_fast_lane(monkeypatch):
+    """Send test_main's requests through the fast lane."""
+    monkeypatch.setattr(test_main, "client", fast_client)
+
+
+async def unreachable(scope, receive, send):
+    """Stand-in app failing any request the fast lane passes on."""
+    raise AssertionError(f"{scope['method']} {scope['path']} was not answered by the fast lane")
+
+
+class TestFastLane:
+    """Test cases for requests answered by the fast lane itself."""
+
+    def test_operations(self):
+        """Test the binary operations are answered directly."""
+        client = TestClient(FastLane(unreachable))
+        assert client.post("/add", json={"a": 10, "b": 5}).json() == {"result": 15.0}
+        assert client.post("/subtract", json={"a": 10, "b": 5.5}).json() == {"result": 4.5}
+        assert client.post("/multiply", json={"a": -2, "b": 3, "extra": 1}).json() == {"result": -6.0}
+
+    def test_is_even(self):
+        """Test /is_even is answered directly."""
+        client = TestClient(FastLane(unreachable))
+        assert client.get("/is_even/4").json() == {"number": 4, "is_even": True}
+        assert client.get("/is_even/-3").json() == {"number": -3, "is_even": False}
+
+    @pytest.mark.parametrize("kwargs", [
+        {"json": {"a": "1", "b": 2}},
+        {"json": {"a": True, "b": 2}},
+        {"json": {"a": 1}},
+        {"json": [1, 2]},
+        {"json": {"a": 1e308, "b": 1e308}},
+        {"content": b"{bad", "headers": {"Content-Type": "application/json"}},
+        {"content": b'{"a": 1, "b": 2}', "headers": {"Content-Type": "text/plain"}},
+        {"json": {"a": 1, "b": 2}, "headers": {"Accept": "application/msgpack"}},
+        {"json": {"a": 1, "b": 2, "pad": "x" * 5000}},
+    ])
+    def test_passes_through(self, kwargs):
+        """Test requests the fast lane cannot answer exactly reach the app with their body intact."""
+        response = fast_client.post("/add", **kwargs)
+        expected = TestClient(app).post("/add", **kwargs)
+        assert response.status_code == expected.status_code
+        assert response.content == expected.content
+
+    @pytest.mark.parametrize("number", ["007", "4.0", "99999999999999999999", "abc"])
+    def test_is_even_passes_through(self, number):
+        """Test path segments that are not plain integers reach the app."""
+        response = fast_client.get(f"/is_even/{number}")
+        expected = TestClient(app).get(f"/is_even/{number}")
+        assert response.status_code == expected.status_code
+        assert response.content == expected.content
+
+    def test_other_routes_pass_through(self):
+        """Test other routes are unchanged."""
+        assert fast_client.post("/divide", json={"a": 1, "b": 4}).json() == {"result": 0.25}
+        assert fast_client.get("/health").json()["status"] == "healthy"
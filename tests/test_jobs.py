@@ -0,0 +1,200 @@
+"""Tests for background statistics jobs."""
+
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app.main as main
+from app.errors import JobQueueFullError
+from app.jobs import COMPLETED, FAILED, PENDING, RUNNING, JobManager, JobStore
+from app.main import app
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.db"))
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def manager(store, monkeypatch):
+    manager = JobManager(store, max_workers=2)
+    monkeypatch.setattr(main, "job_manager", manager)
+    yield manager
+    manager.shutdown()
+
+
+class TestJobStore:
+    """Test cases for JobStore."""
+
+    def test_create_and_get(self, store):
+        """Test a new job is pending."""
+        store.create("abc", {"numbers": [1, 2]})
+        job = store.get("abc")
+        assert job == {"job_id": "abc", "status": PENDING, "result": None, "error": None}
+
+    def test_get_missing(self, store):
+        """Test unknown ids return None."""
+        assert store.get("missing") is None
+
+    def test_lifecycle(self, store):
+        """Test running and completed states."""
+        store.create("abc", {"numbers": [1]})
+        store.mark_running("abc")
+        assert store.get("abc")["status"] == RUNNING
+        store.complete("abc", {"sum": 1})
+        job = store.get("abc")
+        assert job["status"] == COMPLETED
+        assert job["result"] == {"sum": 1}
+
+    def test_fail(self, store):
+        """Test failed jobs keep their error message."""
+        store.create("abc", {"numbers": [1]})
+        store.fail("abc", "boom")
+        job = store.get("abc")
+        assert job["status"] == FAILED
+        assert job["error"] == "boom"
+
+    def test_results_persist_across_connections(self, tmp_path):
+        """Test completed results survive reopening the database."""
+        path = str(tmp_path / "jobs.db")
+        first = JobStore(path)
+        first.create("abc", {"numbers": [1]})
+        first.complete("abc", {"sum": 1})
+        first.close()
+        second = JobStore(path)
+        assert second.get("abc")["result"] == {"sum": 1}
+        second.close()
+
+    def test_expired_results(self, tmp_path):
+        """Test results are hidden and purged after their TTL."""
+        store = JobStore(str(tmp_path / "jobs.db"), result_ttl=0)
+        store.create("abc", {"numbers": [1]})
+        store.complete("abc", {"sum": 1})
+        assert store.get("abc") is None
+        assert store.purge_expired() == 1
+        store.close()
+
+
+class TestJobManager:
+    """Test cases for JobManager."""
+
+    def test_submit_runs_job(self, manager):
+        """Test a submitted job completes with the statistics result."""
+        job_id = manager.submit({"numbers": [1, 2, 3]})
+        future = manager.future(job_id)
+        if future is not None:
+            future.result(timeout=5)
+        job = manager.get(job_id)
+        assert job["status"] == COMPLETED
+        assert job["result"]["sum"] == 6
+
+    def test_submit_failure(self, manager):
+        """Test a job with a bad payload is marked failed."""
+        job_id = manager.submit({})
+        future = manager.future(job_id)
+        if future is not None:
+            future.result(timeout=5)
+        assert manager.get(job_id)["status"] == FAILED
+
+    def test_recover_requeues_unfinished_jobs(self, tmp_path):
+        """Test jobs left pending or running by a previous process are run on recover."""
+        path = str(tmp_path / "jobs.db")
+        previous = JobStore(path)
+        previous.create("pending", {"numbers": [1, 2]})
+        previous.create("running", {"numbers": [3]})
+        previous.mark_running("running")
+        previous.close()
+
+        manager = JobManager(JobStore(path))
+        assert manager.recover() == 2
+        for job_id in ("pending", "running"):
+            future = manager.future(job_id)
+            if future is not None:
+                future.result(timeout=5)
+        assert manager.get("pending")["result"]["sum"] == 3
+        assert manager.get("running")["result"]["sum"] == 3
+        assert manager.store.unfinished() == []
+        manager.shutdown()
+
+    def test_submit_purges_expired_jobs(self, tmp_path):
+        """Test expired rows are deleted while new jobs are submitted."""
+        store = JobStore(str(tmp_path / "jobs.db"), result_ttl=0)
+        store.create("old", {"numbers": [1]})
+        store.complete("old", {"sum": 1})
+        manager = JobManager(store, purge_interval=0)
+        manager.submit({"numbers": [1]})
+        assert store._execute("SELECT id FROM jobs WHERE id = ?", ("old",)) == []
+        manager.shutdown()
+
+    def test_queue_full(self, store):
+        """Test submit raises once max_pending jobs are in flight."""
+        manager = JobManager(store, max_workers=1, max_pending=0)
+        with pytest.raises(JobQueueFullError):
+            manager.submit({"numbers": [1]})
+
+
+class TestJobEndpoints:
+    """Test cases for the /jobs endpoints."""
+
+    def test_submit_and_poll(self, manager):
+        """Test submitting a job and long-polling for its result."""
+        response = client.post("/jobs/statistics", json=[1, 2, 3, 4])
+        assert response.status_code == 202
+        job_id = response.json()["job_id"]
+        response = client.get(f"/jobs/{job_id}", params={"wait": 5})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "completed"
+        assert data["result"] == {"mean": 2.5, "min": 1.0, "max": 4.0, "sum": 10.0}
+
+    def test_submit_with_options(self, manager):
+        """Test jobs accept the same options as /statistics."""
+        response = client.post("/jobs/statistics?median=true&bins=2", json=[1, 2, 3, 4])
+        job_id = response.json()["job_id"]
+        data = client.get(f"/jobs/{job_id}", params={"wait": 5}).json()
+        assert data["result"]["median"] == 2.5
+        assert data["result"]["histogram"]["counts"] == [2, 2]
+
+    def test_poll_without_wait(self, manager):
+        """Test polling eventually returns the completed job."""
+        job_id = client.post("/jobs/statistics", json=[5]).json()["job_id"]
+        deadline = time.time() + 5
+        while time.time() < deadline:
+            data = client.get(f"/jobs/{job_id}").json()
+            if data["status"] == "completed":
+                break
+            time.sleep(0.01)
+        assert data["result"]["mean"] == 5.0
+
+    def test_startup_recovers_jobs(self, manager):
+        """Test app startup re-queues jobs left unfinished by a previous process."""
+        manager.store.create("leftover", {"numbers": [2, 4]})
+        with TestClient(app) as startup_client:
+            response = startup_client.get("/jobs/leftover", params={"wait": 5})
+        assert response.json()["result"]["mean"] == 3.0
+
+    def test_unknown_job(self, manager):
+        """Test polling an unknown job returns 404."""
+        response = client.get("/jobs/unknown")
+        assert response.status_code == 404
+
+    def test_queue_full(self, store, monkeypatch):
+        """Test a full queue returns 503."""
+        monkeypatch.setattr(main, "job_manager", JobManager(store, max_pending=0))
+        response = client.post("/jobs/statistics", json=[1])
+        assert response.status_code == 503
+
+    def test_invalid_payload(self, manager):
+        """Test a non-list payload is rejected."""
+        response = client.post("/jobs/statistics", json="not a list")
+        assert response.status_code == 422
+
+    def test_wait_out_of_range(self, manager):
+        """Test wait is bounded."""
+        response = client.get("/jobs/abc", params={"wait": 1000})
+        assert response.status_code == 422
@@ -0,0 +1,160 @@
+"""Tests for vector and matrix operations."""
+
+import struct
+
+import pytest
+from app import linalg
+from app.linalg import dot, elementwise, from_buffer, matmul, norm, parse_shape, shape_of, to_buffer, transpose
+
+
+BACKEND_MODULE = linalg
+
+
+class TestShapeOf:
+    """Test cases for shape_of function."""
+
+    def test_shapes(self):
+        """Test scalar, vector and matrix shapes."""
+        assert shape_of(3.0) == ()
+        assert shape_of([1, 2]) == (2,)
+        assert shape_of([[1, 2], [3, 4], [5, 6]]) == (3, 2)
+
+    def test_ragged(self):
+        """Test ragged arrays are rejected."""
+        with pytest.raises(ValueError, match="same length"):
+            shape_of([[1, 2], [3]])
+
+    def test_too_many_dimensions(self):
+        """Test arrays above 2 dimensions are rejected."""
+        with pytest.raises(ValueError, match="at most 2"):
+            shape_of([[[1]]])
+
+
+class TestDotAndNorm:
+    """Test cases for dot and norm functions."""
+
+    def test_dot(self, backend):
+        """Test the dot product of two vectors."""
+        assert dot([1, 2, 3], [4, 5, 6]) == 32.0
+
+    def test_dot_mismatched(self, backend):
+        """Test vectors of different lengths are rejected."""
+        with pytest.raises(ValueError, match="same length"):
+            dot([1, 2], [1])
+
+    def test_norms(self, backend):
+        """Test the 1-, 2- and max-norms."""
+        assert norm([3, -4]) == 5.0
+        assert norm([3, -4], "1") == 7.0
+        assert norm([[3], [-4]], "inf") == 4.0
+
+    def test_unknown_norm(self):
+        """Test unknown norm orders are rejected."""
+        with pytest.raises(ValueError, match="Unknown norm"):
+            norm([1], "3")
+
+
+class TestMatmul:
+    """Test cases for matmul function."""
+
+    def test_matrix_matrix(self, backend):
+        """Test a matrix-matrix product."""
+        assert matmul([[1, 2], [3, 4]], [[5, 6], [7, 8]]) == [[19.0, 22.0], [43.0, 50.0]]
+
+    def test_matrix_vector(self, backend):
+        """Test matrix-vector and vector-matrix products."""
+        assert matmul([[1, 2], [3, 4]], [1, 1]) == [3.0, 7.0]
+        assert matmul([1, 1], [[1, 2], [3, 4]]) == [4.0, 6.0]
+
+    def test_not_aligned(self, backend):
+        """Test misaligned shapes are rejected."""
+        with pytest.raises(ValueError, match="not aligned"):
+            matmul([[1, 2]], [[1, 2]])
+
+    def test_scalar_rejected(self):
+        """Test scalars are rejected."""
+        with pytest.raises(ValueError, match="vectors or matrices"):
+            matmul(2.0, [1.0])
+
+    def test_result_size_limit(self, monkeypatch):
+        """Test results over MAX_ELEMENTS are rejected before computing."""
+        monkeypatch.setattr(linalg, "MAX_ELEMENTS", 10)
+        with pytest.raises(ValueError, match="limited to 10"):
+            matmul([[1]] * 5, [[1] * 5])
+
+
+class TestTranspose:
+    """Test cases for transpose function."""
+
+    def test_transpose(self):
+        """Test transposing a matrix."""
+        assert transpose([[1, 2, 3], [4, 5, 6]]) == [[1, 4], [2, 5], [3, 6]]
+
+    def test_transpose_vector(self):
+        """Test vectors are returned unchanged."""
+        assert transpose([1, 2]) == [1, 2]
+
+
+class TestElementwise:
+    """Test cases for elementwise function."""
+
+    def test_same_shape(self, backend):
+        """Test elementwise ops on equal shapes."""
+        assert elementwise("subtract", [[5, 6], [7, 8]], [[1, 2], [3, 4]]) == [[4, 4], [4, 4]]
+
+    def test_broadcasting(self, backend):
+        """Test scalars, rows and columns broadcast against matrices."""
+        assert elementwise("add", [[1, 2], [3, 4]], [10, 20]) == [[11, 22], [13, 24]]
+        assert elementwise("multiply", [[1], [2]], [1, 2, 3]) == [[1, 2, 3], [2, 4, 6]]
+        assert elementwise("divide", [2, 4], 2) == [1, 2]
+        assert elementwise("add", 1, 2) == 3
+
+    def test_incompatible_shapes(self, backend):
+        """Test shapes that cannot broadcast are rejected."""
+        with pytest.raises(ValueError, match="broadcast"):
+            elementwise("add", [1, 2, 3], [1, 2])
+
+    def test_divide_by_zero(self, backend):
+        """Test division by zero is rejected."""
+        with pytest.raises(ValueError, match="Division by zero"):
+            elementwise("divide", [1, 2], [1, 0])
+
+    def test_overflow(self, backend):
+        """Test non-finite results are rejected."""
+        with pytest.raises(ValueError, match="finite"):
+            elementwise("multiply", [1e308], [10])
+
+    def test_unknown_op(self):
+        """Test unknown operations are rejected."""
+        with pytest.raises(ValueError, match="Unknown operation"):
+            elementwise("power", [1], [1])
+
+
+class TestBuffers:
+    """Test cases for binary buffer helpers."""
+
+    def test_parse_shape(self):
+        """Test parsing shapes."""
+        assert parse_shape("2,3") == (2, 3)
+        assert parse_shape("4") == (4,)
+        assert parse_shape("") == ()
+
+    def test_parse_invalid_shape(self):
+        """Test invalid shapes are rejected."""
+        for text in ("a", "1,2,3", "-1"):
+            with pytest.raises(ValueError, match="Invalid shape"):
+                parse_shape(text)
+
+    def test_round_trip(self, backend):
+        """Test decoding operands from one buffer and encoding a result."""
+        data = struct.pack("<7d", 1, 2, 3, 4, 5, 6, 7)
+        a, b = from_buffer(data, [(2, 3), ()])
+        assert shape_of(a) == (2, 3)
+        assert transpose(a) == [[1, 4], [2, 5], [3, 6]]
+        assert float(b) == 7.0
+        assert to_buffer([[1.0, 2.0]]) == (struct.pack("<2d", 1, 2), (1, 2))
+
+    def test_buffer_size_mismatch(self):
+        """Test buffers must match their shapes."""
+        with pytest.raises(ValueError, match="does not match"):
+            from_buffer(b"\x00" * 8, [(2,)])
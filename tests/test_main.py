@@ -1,6 +1,8 @@
+import json
+import struct
 import pytest
 from fastapi.testclient import TestClient
-from app.main import app
+from app.main import app, load_monitor
 
 client = TestClient(app)
 
@@ -27,6 +29,34 @@ class TestHealthEndpoint:
         assert data["version"] == "1.0.0"
 
 
+class TestReadyEndpoint:
+    """Test cases for the /ready endpoint."""
+    
+    def test_ready(self):
+        """Test readiness of an idle worker."""
+        response = client.get("/ready")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "ready"
+        assert set(data) == {
+            "status", "event_loop_lag_ms", "threadpool_busy", "threadpool_size", "threadpool_waiting", "in_flight"
+        }
+    
+    def test_degraded(self, monkeypatch):
+        """Test a worker over a degraded threshold still receives traffic."""
+        monkeypatch.setitem(load_monitor.thresholds, "event_loop_lag_ms", (0, 1000))
+        response = client.get("/ready")
+        assert response.status_code == 200
+        assert response.json()["status"] == "degraded"
+    
+    def test_unready(self, monkeypatch):
+        """Test a worker over an unready threshold returns 503."""
+        monkeypatch.setitem(load_monitor.thresholds, "threadpool_waiting", (0, 0))
+        response = client.get("/ready")
+        assert response.status_code == 503
+        assert response.json()["status"] == "unready"
+
+
 class TestAddEndpoint:
     """Test cases for the /add endpoint."""
     
@@ -246,6 +276,11 @@ class TestPowerEndpoint:
         """Test power with invalid type."""
         response = client.post("/power", json={"a": "invalid", "b": 5})
         assert response.status_code == 422
+    
+    def test_power_overflow(self):
+        """Test power with a result too large for a float."""
+        response = client.post("/power", json={"a": 10, "b": 1000})
+        assert response.status_code == 400
 
 
 class TestModuloEndpoint:
@@ -363,6 +398,91 @@ class TestPercentageEndpoint:
         assert response.status_code == 422
 
 
+class TestExactPowerEndpoints:
+    """Test cases for the /power/exact and /power/mod endpoints."""
+    
+    def test_power_exact(self):
+        """Test an exact power beyond float precision."""
+        response = client.post("/power/exact", json={"base": 3, "exponent": 40})
+        assert response.status_code == 200
+        assert response.json() == {"result": str(3 ** 40)}
+    
+    def test_power_exact_accepts_strings(self):
+        """Test integers can be sent as decimal strings."""
+        response = client.post("/power/exact", json={"base": str(2 ** 64), "exponent": "2"})
+        assert response.json() == {"result": str(2 ** 128)}
+    
+    def test_power_exact_too_large(self):
+        """Test results over the digit limit are rejected before computing."""
+        response = client.post("/power/exact", json={"base": 10, "exponent": 10 ** 12})
+        assert response.status_code == 400
+        assert response.json() == {"detail": "Result would exceed 4300 digits"}
+    
+    def test_power_exact_huge_exponent(self):
+        """Test an exponent too large for a float returns 400 rather than 500."""
+        response = client.post("/power/exact", json={"base": 2, "exponent": str(10 ** 400)})
+        assert response.status_code == 400
+        assert response.json() == {"detail": "Result would exceed 4300 digits"}
+    
+    def test_power_exact_negative_exponent(self):
+        """Test negative exponents are validation errors."""
+        response = client.post("/power/exact", json={"base": 2, "exponent": -1})
+        assert response.status_code == 422
+    
+    def test_power_exact_non_integer(self):
+        """Test non-integer operands are validation errors."""
+        response = client.post("/power/exact", json={"base": 2.5, "exponent": 2})
+        assert response.status_code == 422
+    
+    def test_power_mod(self):
+        """Test modular exponentiation."""
+        response = client.post("/power/mod", json={"base": 4, "exponent": 13, "modulus": 497})
+        assert response.status_code == 200
+        assert response.json() == {"result": "445"}
+    
+    def test_power_mod_zero_modulus(self):
+        """Test a zero modulus."""
+        response = client.post("/power/mod", json={"base": 4, "exponent": 13, "modulus": 0})
+        assert response.status_code == 400
+        assert response.json() == {"detail": "Modulus cannot be zero"}
+    
+    def test_bulk_power_mod(self):
+        """Test bulk modular exponentiation."""
+        response = client.post("/bulk/power/mod", json={"triples": [[4, 13, 497], [3, -1, 7], [2, 100, 10 ** 9 + 7]]})
+        assert response.status_code == 200
+        assert response.json() == {"results": ["445", "5", str(pow(2, 100, 10 ** 9 + 7))]}
+    
+    def test_bulk_power_mod_invalid_item(self):
+        """Test bulk request with an invalid triple."""
+        response = client.post("/bulk/power/mod", json={"triples": [[4, 13, 497], [2, -1, 4]]})
+        assert response.status_code == 400
+        assert response.json() == {"detail": "Item 1: Base is not invertible for the given modulus"}
+    
+    def test_power_mod_operand_limit(self):
+        """Test exponents and moduli over 4096 bits are rejected."""
+        response = client.post("/power/mod", json={"base": 3, "exponent": str(2 ** 4096), "modulus": 7})
+        assert response.status_code == 400
+        assert response.json() == {"detail": "Exponent and modulus are limited to 4096 bits"}
+    
+    def test_bulk_power_mod_operand_limit(self):
+        """Test an oversized item in a bulk request is reported by index."""
+        response = client.post("/bulk/power/mod", json={"triples": [[4, 13, 497], [3, 5, str(2 ** 4096)]]})
+        assert response.status_code == 400
+        assert response.json() == {"detail": "Item 1: Exponent and modulus are limited to 4096 bits"}
+    
+    def test_bulk_power_mod_work_limit(self):
+        """Test bulk requests whose total work is too large are rejected before computing."""
+        big = str(2 ** 4095 + 1)
+        response = client.post("/bulk/power/mod", json={"triples": [[3, big, big]] * 17})
+        assert response.status_code == 400
+        assert response.json() == {"detail": "Bulk request is too much work; split it into smaller requests"}
+    
+    def test_bulk_power_mod_malformed(self):
+        """Test triples of the wrong length are validation errors."""
+        response = client.post("/bulk/power/mod", json={"triples": [[4, 13]]})
+        assert response.status_code == 422
+
+
 class TestFactorialEndpoint:
     """Test cases for the /factorial endpoint."""
     
@@ -405,6 +525,56 @@ class TestFactorialEndpoint:
         """Test factorial with invalid type."""
         response = client.post("/factorial", json={"value": "invalid"})
         assert response.status_code == 422
+    
+    def test_factorial_too_large(self):
+        """Test factorial of a number whose result does not fit in a float."""
+        response = client.post("/factorial", json={"value": 171})
+        assert response.status_code == 400
+        assert response.json() == {"detail": "Factorial is only supported up to 170"}
+
+
+class TestBulkEndpoints:
+    """Test cases for the /bulk/{operation} endpoints."""
+    
+    def test_bulk_add(self):
+        """Test bulk addition."""
+        response = client.post("/bulk/add", json={"a": [1, 2, 3], "b": [10, 20, 30]})
+        assert response.status_code == 200
+        assert response.json() == {"results": [11, 22, 33]}
+    
+    def test_bulk_divide_rounds_like_divide(self):
+        """Test bulk division rounds each result like /divide."""
+        response = client.post("/bulk/divide", json={"a": [10, 1], "b": [3, 3]})
+        assert response.json() == {"results": [3.33, 0.33]}
+    
+    def test_bulk_single_operand(self):
+        """Test bulk square roots."""
+        response = client.post("/bulk/sqrt", json={"value": [4, 9, 2]})
+        assert response.status_code == 200
+        assert response.json() == {"results": [2.0, 3.0, 1.41]}
+    
+    def test_bulk_invalid_item(self):
+        """Test bulk request with an invalid item."""
+        response = client.post("/bulk/modulo", json={"a": [1, 2], "b": [1, 0]})
+        assert response.status_code == 400
+        assert response.json() == {"detail": "Item 1: Modulo by zero is not allowed"}
+    
+    def test_bulk_length_mismatch(self):
+        """Test bulk request with operand lists of different lengths."""
+        response = client.post("/bulk/multiply", json={"a": [1, 2], "b": [1]})
+        assert response.status_code == 400
+    
+    def test_bulk_too_many_items(self, monkeypatch):
+        """Test bulk request over the item limit."""
+        monkeypatch.setattr("app.main.MAX_BULK_ITEMS", 2)
+        response = client.post("/bulk/sqrt", json={"value": [1, 2, 3]})
+        assert response.status_code == 400
+        assert response.json() == {"detail": "Bulk requests are limited to 2 items"}
+    
+    def test_bulk_missing_field(self):
+        """Test bulk request with a missing operand list."""
+        response = client.post("/bulk/add", json={"a": [1]})
+        assert response.status_code == 422
 
 
 class TestStatisticsEndpoint:
@@ -475,6 +645,44 @@ class TestStatisticsEndpoint:
         """Test statistics with invalid type."""
         response = client.post("/statistics", json="not a list")
         assert response.status_code == 422
+    
+    def test_statistics_quantiles_and_median(self):
+        """Test statistics with quantiles and median."""
+        response = client.post("/statistics?quantiles=0.25&quantiles=0.99&median=true", json=[4, 1, 3, 2])
+        assert response.status_code == 200
+        data = response.json()
+        assert data["quantiles"]["0.25"] == 1.75
+        assert abs(data["quantiles"]["0.99"] - 3.97) < 0.0001
+        assert data["median"] == 2.5
+        assert data["sum"] == 10.0
+    
+    def test_statistics_histogram(self):
+        """Test statistics with a fixed-bin histogram."""
+        response = client.post("/statistics?bins=2", json=[1, 2, 2, 3, 4, 5])
+        assert response.status_code == 200
+        assert response.json()["histogram"] == {"edges": [1.0, 3.0, 5.0], "counts": [3, 3]}
+    
+    def test_statistics_auto_histogram(self):
+        """Test statistics with an auto-binned histogram."""
+        response = client.post("/statistics?bins=auto", json=list(range(16)))
+        assert response.status_code == 200
+        assert sum(response.json()["histogram"]["counts"]) == 16
+    
+    def test_statistics_invalid_quantile(self):
+        """Test statistics with a quantile outside [0, 1]."""
+        response = client.post("/statistics?quantiles=2", json=[1, 2])
+        assert response.status_code == 400
+        assert "between 0 and 1" in response.json()["detail"]
+    
+    def test_statistics_invalid_bins(self):
+        """Test statistics with invalid bins."""
+        response = client.post("/statistics?bins=zero", json=[1, 2])
+        assert response.status_code == 422
+    
+    def test_statistics_too_many_bins(self):
+        """Test statistics with too many bins."""
+        response = client.post("/statistics?bins=1000000", json=[1, 2])
+        assert response.status_code == 400
 
 
 class TestIsEvenEndpoint:
@@ -531,3 +739,242 @@ class TestFormatNumberEndpoint:
         response = client.get("/format/0.5")
         assert response.status_code == 200
         assert response.json() == {"original": 0.5, "formatted": "0.50"}
+
+
+class TestRollingStatisticsEndpoint:
+    """Test cases for the /statistics/rolling endpoints."""
+    
+    def test_rolling_statistics(self):
+        """Test rolling statistics over a series."""
+        response = client.post("/statistics/rolling", json={"numbers": [1, 2, 3, 4], "window": 2})
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 3
+        assert data[0] == {"mean": 1.5, "min": 1.0, "max": 2.0, "sum": 3.0, "stddev": 0.5}
+    
+    def test_rolling_statistics_invalid_window(self):
+        """Test rolling statistics with a non-positive window."""
+        response = client.post("/statistics/rolling", json={"numbers": [1, 2], "window": 0})
+        assert response.status_code == 422
+    
+    def test_rolling_statistics_stream(self):
+        """Test streaming rolling statistics as NDJSON."""
+        response = client.post("/statistics/rolling/stream?window=2", content=b"1\n2\n3\n")
+        assert response.status_code == 200
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["sum"] for line in lines] == [3.0, 5.0]
+    
+    def test_rolling_statistics_stream_invalid_number(self):
+        """Test streaming rolling statistics reports invalid input."""
+        response = client.post("/statistics/rolling/stream?window=1", content=b"1\nabc\n")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert lines[-1] == {"error": "Invalid number: 'abc'"}
+    
+    def test_rolling_statistics_non_finite(self):
+        """Test rolling statistics rejects non-finite numbers."""
+        response = client.post("/statistics/rolling", content=b'{"numbers": [1, Infinity], "window": 1}', headers={"Content-Type": "application/json"})
+        assert response.status_code == 400
+        assert "Invalid number" in response.json()["detail"]
+    
+    def test_rolling_statistics_overflow(self):
+        """Test windows whose sum overflows return 400 rather than 500."""
+        response = client.post("/statistics/rolling", json={"numbers": [1e308, 1e308, 1], "window": 2})
+        assert response.status_code == 400
+        assert response.json() == {"detail": "Window statistics overflow"}
+    
+    def test_rolling_statistics_stream_overflow(self):
+        """Test an overflowing window ends the stream with an error line."""
+        response = client.post("/statistics/rolling/stream?window=2", content=b"1 1 1e308 1e308")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert lines[0]["sum"] == 2
+        assert lines[-1] == {"error": "Window statistics overflow"}
+    
+    def test_rolling_statistics_stream_json_array(self):
+        """Test streaming rolling statistics accepts a JSON array body."""
+        response = client.post("/statistics/rolling/stream?window=3", content=b"[1, 2, 3, 4]")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["mean"] for line in lines] == [2.0, 3.0]
+    
+    def test_rolling_statistics_stream_empty_body(self):
+        """Test streaming rolling statistics with no input."""
+        response = client.post("/statistics/rolling/stream?window=2", content=b"")
+        assert response.status_code == 200
+        assert response.text == ""
+    
+    def test_rolling_statistics_stream_invalid_first_number(self):
+        """Test an invalid first number is rejected before streaming starts."""
+        response = client.post("/statistics/rolling/stream?window=2", content=b"abc\n1\n")
+        assert response.status_code == 400
+        assert response.json() == {"detail": "Invalid number: 'abc'"}
+    
+    def test_rolling_statistics_stream_missing_window(self):
+        """Test streaming rolling statistics requires a window."""
+        response = client.post("/statistics/rolling/stream", content=b"1\n")
+        assert response.status_code == 422
+        data = response.json()
+        assert data["detail"] == "Validation error"
+        assert data["errors"][0]["field"] == "query.window"
+    
+    def test_rolling_statistics_stream_invalid_window(self):
+        """Test streaming rolling statistics rejects a non-positive window."""
+        response = client.post("/statistics/rolling/stream?window=0", content=b"1\n")
+        assert response.status_code == 422
+
+
+class TestVectorEndpoints:
+    """Test cases for the /vector endpoints."""
+    
+    def test_dot(self):
+        """Test dot product."""
+        response = client.post("/vector/dot", json={"a": [1, 2, 3], "b": [4, 5, 6]})
+        assert response.status_code == 200
+        assert response.json() == {"result": 32.0}
+    
+    def test_dot_mismatched(self):
+        """Test dot product of vectors with different lengths."""
+        response = client.post("/vector/dot", json={"a": [1, 2], "b": [1]})
+        assert response.status_code == 400
+    
+    def test_dot_missing_field(self):
+        """Test dot product with missing field."""
+        response = client.post("/vector/dot", json={"a": [1, 2]})
+        assert response.status_code == 422
+        assert response.json()["errors"][0]["field"] == "body.b"
+    
+    def test_norm(self):
+        """Test norms."""
+        assert client.post("/vector/norm", json={"a": [3, 4]}).json() == {"result": 5.0}
+        assert client.post("/vector/norm?ord=inf", json={"a": [3, -4]}).json() == {"result": 4.0}
+    
+    def test_norm_invalid_order(self):
+        """Test norm with an invalid order."""
+        response = client.post("/vector/norm?ord=3", json={"a": [3, 4]})
+        assert response.status_code == 422
+
+
+class TestMatrixEndpoints:
+    """Test cases for the /matrix endpoints."""
+    
+    def test_matmul(self):
+        """Test matrix multiplication."""
+        response = client.post("/matrix/matmul", json={"a": [[1, 2], [3, 4]], "b": [[5, 6], [7, 8]]})
+        assert response.status_code == 200
+        assert response.json() == {"result": [[19.0, 22.0], [43.0, 50.0]]}
+    
+    def test_matmul_ragged(self):
+        """Test matrix multiplication with a ragged matrix."""
+        response = client.post("/matrix/matmul", json={"a": [[1, 2], [3]], "b": [1, 2]})
+        assert response.status_code == 400
+    
+    def test_transpose(self):
+        """Test transpose."""
+        response = client.post("/matrix/transpose", json={"a": [[1, 2, 3]]})
+        assert response.json() == {"result": [[1.0], [2.0], [3.0]]}
+    
+    def test_elementwise(self):
+        """Test elementwise operation with broadcasting."""
+        response = client.post("/matrix/elementwise?op=add", json={"a": [[1, 2], [3, 4]], "b": [10, 20]})
+        assert response.json() == {"result": [[11.0, 22.0], [13.0, 24.0]]}
+    
+    def test_elementwise_divide_by_zero(self):
+        """Test elementwise division by zero."""
+        response = client.post("/matrix/elementwise?op=divide", json={"a": [1, 2], "b": 0})
+        assert response.status_code == 400
+        assert "Division by zero" in response.json()["detail"]
+    
+    def test_elementwise_invalid_op(self):
+        """Test elementwise with an unknown operation."""
+        response = client.post("/matrix/elementwise?op=power", json={"a": [1], "b": [1]})
+        assert response.status_code == 422
+    
+    def test_binary_input_and_output(self):
+        """Test float64 buffers in and out."""
+        body = struct.pack("<6d", 1, 2, 3, 4, 5, 6)
+        response = client.post(
+            "/matrix/transpose?a_shape=2,3",
+            content=body,
+            headers={"Content-Type": "application/octet-stream", "Accept": "application/octet-stream"},
+        )
+        assert response.status_code == 200
+        assert response.headers["x-shape"] == "3,2"
+        assert struct.unpack("<6d", response.content) == (1, 4, 2, 5, 3, 6)
+    
+    def test_binary_two_operands(self):
+        """Test two operands packed into one buffer."""
+        body = struct.pack("<4d", 1, 2, 3, 4)
+        response = client.post(
+            "/matrix/matmul?a_shape=1,2&b_shape=2,1",
+            content=body,
+            headers={"Content-Type": "application/octet-stream"},
+        )
+        assert response.json() == {"result": [[11.0]]}
+    
+    def test_binary_missing_shape(self):
+        """Test binary input without a shape."""
+        response = client.post("/matrix/transpose", content=b"\x00" * 8, headers={"Content-Type": "application/octet-stream"})
+        assert response.status_code == 400
+        assert "a_shape" in response.json()["detail"]
+    
+    def test_body_too_large(self, monkeypatch):
+        """Test oversized bodies are rejected."""
+        import app.main as main
+        monkeypatch.setattr(main, "MAX_ARRAY_BODY_BYTES", 10)
+        response = client.post("/matrix/transpose", json={"a": [[1, 2, 3]]})
+        assert response.status_code == 413
+
+
+class TestScanEndpoint:
+    """Test cases for the /scan endpoints."""
+    
+    def test_scan(self):
+        """Test a cumulative sum."""
+        response = client.post("/scan", json={"numbers": [1, 2, 3], "op": "cumsum"})
+        assert response.status_code == 200
+        assert response.json() == {"result": [1.0, 3.0, 6.0]}
+    
+    def test_scan_large_result_is_compressed(self):
+        """Test large results are compressed for clients that accept it."""
+        numbers = list(range(2000))
+        response = client.post("/scan", json={"numbers": numbers, "op": "cummax"}, headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.json() == {"result": [float(x) for x in numbers]}
+    
+    def test_small_result_is_not_compressed(self):
+        """Test small results are sent uncompressed."""
+        response = client.post("/add", json={"a": 1, "b": 2}, headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in response.headers
+    
+    def test_scan_compensated(self):
+        """Test a compensated cumulative sum."""
+        response = client.post("/scan", json={"numbers": [1e16, 1, -1e16], "op": "cumsum", "compensated": True})
+        assert response.json()["result"][-1] == 1.0
+    
+    def test_scan_invalid_op(self):
+        """Test an unknown operation."""
+        response = client.post("/scan", json={"numbers": [1], "op": "cumfoo"})
+        assert response.status_code == 422
+    
+    def test_scan_overflow(self):
+        """Test an overflowing running product."""
+        response = client.post("/scan", json={"numbers": [1e200, 1e200], "op": "cumprod"})
+        assert response.status_code == 400
+    
+    def test_scan_stream(self):
+        """Test streaming scan output in chunks."""
+        response = client.post("/scan/stream?op=cumsum&chunk_size=2", content=b"1\n2\n3\n")
+        assert response.status_code == 200
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert lines == [{"values": [1.0, 3.0]}, {"values": [6.0]}]
+    
+    def test_scan_stream_error_flushes_chunk(self):
+        """Test an invalid number flushes pending output before the error line."""
+        response = client.post("/scan/stream?op=diff", content=b"1\n3\nabc\n")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert lines == [{"values": [2.0]}, {"error": "Invalid number: 'abc'"}]
+    
+    def test_scan_stream_invalid_chunk_size(self):
+        """Test streaming scan rejects a non-positive chunk size."""
+        response = client.post("/scan/stream?op=cumsum&chunk_size=0", content=b"1\n")
+        assert response.status_code == 422
@@ -0,0 +1,94 @@
+"""Tests for the load monitor."""
+
+import asyncio
+import time
+
+from app.monitor import DEGRADED, READY, UNREADY, InFlightMiddleware, LoadMonitor
+
+THRESHOLDS = {"event_loop_lag_ms": (100, 500), "threadpool_waiting": (1, 10), "in_flight": (5, 10)}
+
+
+def snapshot(**overrides):
+    """Build an idle snapshot with some metrics overridden."""
+    return {
+        "event_loop_lag_ms": 0.0, "threadpool_busy": 0, "threadpool_size": 40,
+        "threadpool_waiting": 0, "in_flight": 0, **overrides,
+    }
+
+
+class TestLoadMonitor:
+    """Test cases for LoadMonitor."""
+
+    def test_status(self):
+        """Test classifying snapshots against the thresholds."""
+        monitor = LoadMonitor(THRESHOLDS)
+        assert monitor.status(snapshot()) == READY
+        assert monitor.status(snapshot(event_loop_lag_ms=100)) == DEGRADED
+        assert monitor.status(snapshot(threadpool_waiting=3)) == DEGRADED
+        assert monitor.status(snapshot(in_flight=10)) == UNREADY
+        assert monitor.status(snapshot(event_loop_lag_ms=150, threadpool_waiting=20)) == UNREADY
+
+    def test_snapshot_reports_threadpool(self):
+        """Test the snapshot includes the default threadpool's size and usage."""
+        async def main():
+            return LoadMonitor(THRESHOLDS).snapshot()
+
+        result = asyncio.run(main())
+        assert result["threadpool_size"] > 0
+        assert result["threadpool_busy"] == 0
+        assert result["event_loop_lag_ms"] == 0.0
+
+    def test_measures_blocked_loop(self):
+        """Test lag is recorded when the event loop is blocked."""
+        async def main():
+            monitor = LoadMonitor(THRESHOLDS, interval=0.01)
+            monitor.start()
+            await asyncio.sleep(0.03)
+            time.sleep(0.2)
+            await asyncio.sleep(0.03)
+            await monitor.stop()
+            return monitor
+
+        monitor = asyncio.run(main())
+        assert monitor.lag >= 0.15
+        assert monitor.status(snapshot(event_loop_lag_ms=monitor.lag * 1000)) == DEGRADED
+
+    def test_stop_without_start(self):
+        """Test stopping a monitor that never started."""
+        asyncio.run(LoadMonitor(THRESHOLDS).stop())
+
+
+class TestInFlightMiddleware:
+    """Test cases for InFlightMiddleware."""
+
+    def test_counts_requests(self):
+        """Test requests are counted while being served, except excluded paths."""
+        monitor = LoadMonitor(THRESHOLDS)
+        seen = []
+
+        async def app(scope, receive, send):
+            seen.append(monitor.in_flight)
+
+        middleware = InFlightMiddleware(app, monitor, exclude=("/ready",))
+
+        async def main():
+            await middleware({"type": "http", "path": "/add"}, None, None)
+            await middleware({"type": "http", "path": "/ready"}, None, None)
+
+        asyncio.run(main())
+        assert seen == [1, 0]
+        assert monitor.in_flight == 0
+
+    def test_counts_failed_requests(self):
+        """Test the count is released when the app raises."""
+        monitor = LoadMonitor(THRESHOLDS)
+
+        async def app(scope, receive, send):
+            raise RuntimeError
+
+        middleware = InFlightMiddleware(app, monitor)
+        try:
+            asyncio.run(middleware({"type": "http", "path": "/add"}, None, None))
+        except RuntimeError:
+            pass
+        assert monitor.in_flight == 0
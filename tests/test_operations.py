@@ -0,0 +1,105 @@
+"""Tests for the operation registry."""
+
+import math
+import random
+
+import pytest
+from app import operations as operations_module
+from app.errors import MathError
+from app.operations import OPERATIONS, Operation
+
+
+BACKEND_MODULE = operations_module
+
+
+class TestOperation:
+    """Test cases for a single registered operation."""
+
+    def test_registry_covers_scalar_routes(self):
+        """Test every scalar endpoint has a registry entry."""
+        assert set(OPERATIONS) == {
+            "add", "subtract", "multiply", "divide", "power", "modulo", "sqrt", "percentage", "factorial"
+        }
+
+    def test_call(self):
+        """Test calling operations."""
+        assert OPERATIONS["add"](1, 2) == 3
+        assert OPERATIONS["divide"](10, 3) == 3.33
+        assert OPERATIONS["sqrt"](2) == 1.41
+        assert OPERATIONS["factorial"](5) == 120.0
+
+    def test_checks(self):
+        """Test invalid operands raise MathError with the rule's message."""
+        with pytest.raises(MathError, match="Division by zero is not allowed"):
+            OPERATIONS["divide"](1, 0)
+        with pytest.raises(MathError, match="Modulo by zero is not allowed"):
+            OPERATIONS["modulo"](1, 0)
+        with pytest.raises(MathError, match="Cannot calculate square root of negative number"):
+            OPERATIONS["sqrt"](-1)
+        with pytest.raises(MathError, match="Factorial is only defined for non-negative integers"):
+            OPERATIONS["factorial"](2.5)
+        with pytest.raises(MathError, match="Factorial is only supported up to 170"):
+            OPERATIONS["factorial"](171)
+
+    def test_non_finite_result(self):
+        """Test overflowing results are rejected."""
+        with pytest.raises(MathError, match="Result is not a finite number"):
+            OPERATIONS["multiply"](1e308, 10)
+
+    def test_scalar_errors_become_math_errors(self):
+        """Test errors from the implementation are reported as MathError."""
+        with pytest.raises(MathError):
+            OPERATIONS["power"](10, 1000)
+        with pytest.raises(MathError):
+            OPERATIONS["power"](-8, 1 / 3)
+
+    def test_cache(self):
+        """Test cacheable operations reuse results."""
+        calls = []
+        operation = Operation("square", 1, lambda x: calls.append(x) or x * x, "Square.", cacheable=True)
+        assert operation(3) == 9
+        assert operation(3) == 9
+        assert calls == [3]
+
+    def test_cache_keeps_signed_zero(self):
+        """Test 0.0 and -0.0 are cached separately."""
+        power = OPERATIONS["power"]
+        assert math.copysign(1, power(0.0, 3)) == 1
+        assert math.copysign(1, power(-0.0, 3)) == -1
+
+    def test_impure_operations_are_not_cached(self):
+        """Test only pure operations are cached."""
+        operation = Operation("noise", 0, random.random, "Noise.", pure=False, cacheable=True)
+        assert not operation.cacheable
+
+
+class TestBulk:
+    """Test cases for bulk evaluation."""
+
+    @pytest.mark.parametrize("name", ["add", "subtract", "multiply", "divide", "percentage"])
+    def test_matches_scalar(self, backend, name):
+        """Test bulk results equal the scalar results."""
+        rng = random.Random(name)
+        a = [rng.uniform(-1e6, 1e6) for _ in range(200)]
+        b = [rng.uniform(1, 1e3) for _ in range(200)]
+        operation = OPERATIONS[name]
+        assert operation.bulk(a, b) == [operation(x, y) for x, y in zip(a, b)]
+
+    def test_single_operand(self, backend):
+        """Test bulk evaluation of one-operand operations."""
+        assert OPERATIONS["sqrt"].bulk([4, 2, 0]) == [2.0, 1.41, 0.0]
+        assert OPERATIONS["factorial"].bulk([0, 5]) == [1.0, 120.0]
+
+    def test_empty(self, backend):
+        """Test empty columns."""
+        assert OPERATIONS["add"].bulk([], []) == []
+
+    def test_invalid_item(self, backend):
+        """Test the failing item is named in the error."""
+        with pytest.raises(MathError, match="Item 2: Division by zero is not allowed"):
+            OPERATIONS["divide"].bulk([1, 2, 3], [1, 2, 0])
+
+    def test_non_finite_item(self, backend):
+        """Test overflowing items are rejected."""
+        with pytest.raises(MathError, match="Item 1: Result is not a finite number"):
+            OPERATIONS["add"].bulk([1, 1e308], [1, 1e308])
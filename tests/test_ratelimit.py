@@ -0,0 +1,177 @@
+"""Tests for rate limiting and load shedding."""
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from app.ratelimit import LoadShedder, RateLimitMiddleware, TokenBuckets, client_key
+
+
+class TestTokenBuckets:
+    """Test cases for TokenBuckets."""
+
+    def test_burst_then_refill(self):
+        """Test a bucket allows a burst, then refills over time."""
+        buckets = TokenBuckets(rate=2, burst=3)
+        assert [buckets.take("a", 1, now=10.0) for _ in range(3)] == [0, 0, 0]
+        assert buckets.take("a", 1, now=10.0) == pytest.approx(0.5)
+        assert buckets.take("a", 1, now=10.5) == 0
+
+    def test_refill_is_capped_at_burst(self):
+        """Test an idle bucket does not accumulate more than burst."""
+        buckets = TokenBuckets(rate=1, burst=2)
+        buckets.take("a", 1, now=1.0)
+        assert buckets.take("a", 2, now=1000.0) == 0
+        assert buckets.take("a", 1, now=1000.0) == pytest.approx(1)
+
+    def test_clients_are_separate(self):
+        """Test one client's usage does not affect another's."""
+        buckets = TokenBuckets(rate=1, burst=1, slots=1 << 16)
+        assert buckets.take("a", 1, now=1.0) == 0
+        assert buckets.take("a", 1, now=1.0) > 0
+        assert buckets.take("b", 1, now=1.0) == 0
+
+    def test_cost_above_burst_goes_into_debt(self):
+        """Test a full bucket serves a request costing more than burst, then waits off the debt."""
+        buckets = TokenBuckets(rate=1, burst=2)
+        assert buckets.take("a", 100, now=1.0) == 0
+        assert buckets.take("a", 1, now=1.0) == pytest.approx(99)
+        assert buckets.take("a", 100, now=50.0) == pytest.approx(51)
+        assert buckets.take("a", 100, now=101.0) == 0
+
+    def test_charge(self):
+        """Test charging takes tokens without checking, so later requests wait."""
+        buckets = TokenBuckets(rate=1, burst=2)
+        buckets.charge("a", 5, now=1.0)
+        assert buckets.take("a", 1, now=1.0) == pytest.approx(4)
+
+    def test_invalid_rate(self):
+        """Test rate and burst must be positive."""
+        with pytest.raises(ValueError):
+            TokenBuckets(rate=0, burst=1)
+
+
+class TestLoadShedder:
+    """Test cases for LoadShedder."""
+
+    def test_no_shedding_under_target(self):
+        """Test nothing is shed while latency is under target."""
+        shedder = LoadShedder(target=0.1, rng=lambda: 0.0)
+        shedder.observe(0.05)
+        assert shedder.shed_probability == 0
+        assert not shedder.should_shed()
+
+    def test_shedding_grows_with_latency(self):
+        """Test the shed share grows with the overshoot and is capped."""
+        shedder = LoadShedder(target=0.1, alpha=1.0, max_shed=0.9)
+        shedder.observe(0.15)
+        assert shedder.shed_probability == pytest.approx(0.5)
+        shedder.observe(10)
+        assert shedder.shed_probability == 0.9
+
+    def test_should_shed(self):
+        """Test requests are shed according to the probability."""
+        shedder = LoadShedder(target=0.1, alpha=1.0, rng=lambda: 0.4)
+        shedder.observe(0.15)
+        assert shedder.should_shed()
+        shedder.observe(0.13)
+        assert not shedder.should_shed()
+
+
+class TestClientKey:
+    """Test cases for client_key."""
+
+    def test_api_key(self):
+        """Test the API key identifies the client when present."""
+        scope = {"headers": [(b"x-api-key", b"secret")], "client": ("1.2.3.4", 1)}
+        assert client_key(scope) == "key:secret"
+
+    def test_ip(self):
+        """Test the client IP is used without an API key."""
+        assert client_key({"headers": [], "client": ("1.2.3.4", 1)}) == "ip:1.2.3.4"
+
+
+def make_client(**options):
+    """Build a test app behind the rate limit middleware."""
+    app = FastAPI()
+
+    @app.post("/cheap")
+    def cheap():
+        return {"ok": True}
+
+    @app.post("/upload")
+    async def upload(request: Request):
+        return {"size": len(await request.body())}
+
+    @app.get("/health")
+    def health():
+        return {"ok": True}
+
+    app.add_middleware(RateLimitMiddleware, exclude=("/health",), **options)
+    return TestClient(app)
+
+
+class TestRateLimitMiddleware:
+    """Test cases for RateLimitMiddleware."""
+
+    def test_rate_limited(self):
+        """Test a client over its budget gets 429 with Retry-After."""
+        client = make_client(buckets=TokenBuckets(rate=0.1, burst=2))
+        assert client.post("/cheap").status_code == 200
+        assert client.post("/cheap").status_code == 200
+        response = client.post("/cheap")
+        assert response.status_code == 429
+        assert response.json() == {"detail": "Rate limit exceeded"}
+        assert response.headers["retry-after"] == "10"
+
+    def test_cost_includes_payload(self):
+        """Test large bodies cost more tokens."""
+        client = make_client(buckets=TokenBuckets(rate=0.1, burst=3), bytes_per_token=10)
+        assert client.post("/cheap", content=b"x" * 20).status_code == 200
+        assert client.post("/cheap").status_code == 429
+
+    def test_payload_cost_is_not_capped(self):
+        """Test a body far larger than burst is served once, then blocks the client for longer."""
+        client = make_client(buckets=TokenBuckets(rate=0.1, burst=3), bytes_per_token=10)
+        assert client.post("/cheap", content=b"x" * 1000).status_code == 200
+        response = client.post("/cheap")
+        assert response.status_code == 429
+        assert int(response.headers["retry-after"]) > 900
+
+    def test_chunked_body_is_charged(self):
+        """Test bodies without a Content-Length are charged as they are received."""
+        client = make_client(buckets=TokenBuckets(rate=0.1, burst=3), bytes_per_token=10)
+        response = client.post("/upload", content=iter([b"x" * 500, b"x" * 500]))
+        assert response.json() == {"size": 1000}
+        response = client.post("/cheap")
+        assert response.status_code == 429
+        assert int(response.headers["retry-after"]) > 900
+
+    def test_path_costs(self):
+        """Test per-path base costs."""
+        client = make_client(buckets=TokenBuckets(rate=0.1, burst=5), path_costs={"/cheap": 5})
+        assert client.post("/cheap").status_code == 200
+        assert client.post("/cheap").status_code == 429
+
+    def test_excluded_paths(self):
+        """Test excluded paths are never limited."""
+        client = make_client(buckets=TokenBuckets(rate=0.1, burst=1))
+        assert all(client.get("/health").status_code == 200 for _ in range(5))
+
+    def test_load_shedding(self):
+        """Test requests are shed with 503 while latency is over target."""
+        shedder = LoadShedder(target=0.001, rng=lambda: 0.0)
+        shedder.latency = 1.0
+        client = make_client(shedder=shedder)
+        response = client.post("/cheap")
+        assert response.status_code == 503
+        assert response.json() == {"detail": "Server is overloaded"}
+        assert response.headers["retry-after"] == "1"
+
+    def test_served_requests_update_latency(self):
+        """Test served requests feed the latency average."""
+        shedder = LoadShedder(target=10.0)
+        shedder.latency = 1.0
+        client = make_client(shedder=shedder)
+        assert client.post("/cheap").status_code == 200
+        assert shedder.latency < 1.0
@@ -0,0 +1,117 @@
+"""Tests for the traffic replay tool."""
+
+import asyncio
+import json
+
+import httpx
+
+from app import replay as replay_module
+from app.capture import encode_body
+from app.main import app
+from app.replay import Report, diff, load_entries, main, replay
+
+
+def entry(method, path, body, status, response, **extra):
+    """Build a capture record."""
+    return {
+        "method": method, "path": path, "query": "", "operation": path.strip("/"),
+        "headers": {"content-type": "application/json"},
+        "body": encode_body(json.dumps(body).encode() if body is not None else b""),
+        "status": status,
+        "response": encode_body(json.dumps(response).encode()),
+        **extra,
+    }
+
+
+def run_replay(entries, **options):
+    """Replay entries against the in-process app without running its lifespan."""
+    async def go():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://replay") as client:
+            return await replay(entries, client, **options)
+
+    return asyncio.run(go())
+
+
+class TestLoadEntries:
+    """Test cases for load_entries."""
+
+    def test_skips_truncated(self, tmp_path):
+        """Test truncated records are counted and skipped."""
+        path = tmp_path / "capture.jsonl"
+        path.write_text(
+            json.dumps(entry("POST", "/add", {"a": 1, "b": 2}, 200, {"result": 3.0})) + "\n\n"
+            + json.dumps({"method": "POST", "path": "/add", "truncated": True}) + "\n"
+        )
+        entries, skipped = load_entries(str(path))
+        assert len(entries) == 1
+        assert skipped == 1
+
+
+class TestDiff:
+    """Test cases for diff."""
+
+    def test_match(self):
+        """Test JSON bodies match regardless of formatting."""
+        recorded = entry("POST", "/add", {}, 200, {"result": 3.0})
+        assert diff(recorded, 200, b'{ "result" : 3.0 }') is None
+
+    def test_status(self):
+        """Test status differences are reported."""
+        assert diff(entry("POST", "/add", {}, 200, {}), 500, b"{}") == "status 200 != 500"
+
+    def test_body(self):
+        """Test body differences are reported."""
+        assert diff(entry("POST", "/add", {}, 200, {"result": 3.0}), 200, b'{"result":4.0}').startswith("body")
+
+
+class TestReplay:
+    """Test cases for replaying captured traffic."""
+
+    def test_replay_reports_latency_and_diffs(self):
+        """Test a replay groups latencies by endpoint and finds changed responses."""
+        entries = [
+            entry("POST", "/add", {"a": 1, "b": 2}, 200, {"result": 3.0}),
+            entry("POST", "/add", {"a": 2, "b": 2}, 200, {"result": 4.0}),
+            entry("POST", "/divide", {"a": 1, "b": 0}, 400, {"detail": "Division by zero is not allowed"}),
+            entry("POST", "/multiply", {"a": 2, "b": 3}, 200, {"result": 7.0}),
+        ]
+        report = run_replay(entries, rate=1000, concurrency=2)
+        summary = report.summary()
+        assert summary["requests"] == 4
+        assert summary["diffs"] == 1
+        assert report.diffs[0][0] == "POST /multiply"
+        assert summary["endpoints"]["POST add"]["count"] == 2
+        assert set(summary["endpoints"]["POST add"]) == {"count", "errors", "p50_ms", "p90_ms", "p99_ms", "max_ms"}
+        assert summary["throughput_rps"] > 0
+
+    def test_skip_diff(self):
+        """Test paths matching skip_diff are not compared."""
+        entries = [entry("GET", "/health", None, 200, {"status": "other"})]
+        assert run_replay(entries, rate=1000).diffs == []
+        assert len(run_replay(entries, rate=1000, skip_diff="").diffs) == 1
+
+    def test_rate(self):
+        """Test requests are spread out at the requested rate."""
+        entries = [entry("POST", "/add", {"a": 1, "b": 2}, 200, {"result": 3.0})] * 5
+        assert run_replay(entries, rate=50).elapsed >= 4 / 50
+
+
+class TestMain:
+    """Test cases for the command line."""
+
+    def test_exit_status(self, monkeypatch, capsys, tmp_path):
+        """Test the summary is printed and diffs make the exit status 1."""
+        report = Report()
+        report.latencies["POST add"] = [0.001, 0.002]
+        report.elapsed = 1.0
+
+        async def fake_run(*args):
+            return report
+
+        monkeypatch.setattr(replay_module, "run", fake_run)
+        assert main([str(tmp_path / "capture.jsonl")]) == 0
+        assert json.loads(capsys.readouterr().out)["requests"] == 2
+        report.diffs.append(("POST /add", "status 200 != 500"))
+        assert main([str(tmp_path / "capture.jsonl")]) == 1
+        assert "DIFF POST /add" in capsys.readouterr().err
@@ -0,0 +1,103 @@
+"""Tests for rolling window statistics."""
+
+import math
+import random
+
+import pytest
+from app.rolling import RollingWindow, rolling_statistics
+from app.utils import get_statistics
+
+
+def brute_force(numbers, window):
+    results = []
+    for i in range(len(numbers) - window + 1):
+        chunk = numbers[i:i + window]
+        stats = get_statistics(chunk)
+        mean = stats["mean"]
+        stats["stddev"] = math.sqrt(sum((x - mean) ** 2 for x in chunk) / window)
+        results.append(stats)
+    return results
+
+
+class TestRollingStatistics:
+    """Test cases for rolling_statistics function."""
+
+    def test_rolling_simple(self):
+        """Test rolling statistics on a short series."""
+        result = rolling_statistics([1, 2, 3, 4], 2)
+        assert [r["sum"] for r in result] == [3, 5, 7]
+        assert [r["mean"] for r in result] == [1.5, 2.5, 3.5]
+        assert [r["min"] for r in result] == [1, 2, 3]
+        assert [r["max"] for r in result] == [2, 3, 4]
+        assert all(r["stddev"] == 0.5 for r in result)
+
+    def test_rolling_matches_brute_force(self):
+        """Test rolling statistics agree with recomputing every window."""
+        rng = random.Random(42)
+        numbers = [rng.uniform(-100, 100) for _ in range(200)]
+        for window in (1, 3, 17, 200):
+            expected = brute_force(numbers, window)
+            actual = rolling_statistics(numbers, window)
+            assert len(actual) == len(expected)
+            for got, want in zip(actual, expected):
+                assert got["min"] == want["min"]
+                assert got["max"] == want["max"]
+                for key in ("mean", "sum", "stddev"):
+                    assert abs(got[key] - want[key]) < 1e-9
+
+    def test_rolling_window_larger_than_series(self):
+        """Test no windows are produced when the series is too short."""
+        assert rolling_statistics([1, 2], 3) == []
+
+    def test_rolling_large_magnitudes(self):
+        """Test large values leaving the window do not corrupt later windows."""
+        result = rolling_statistics([1e16, 1, 2, 3], 2)
+        assert [r["sum"] for r in result] == [1e16, 3.0, 5.0]
+        assert result[1]["mean"] == 1.5
+        assert result[1]["stddev"] == 0.5
+        assert result[2]["stddev"] == 0.5
+
+    def test_rolling_large_magnitudes_long_series(self):
+        """Test mixed magnitudes stay accurate over a long series."""
+        rng = random.Random(7)
+        numbers = [rng.uniform(-1, 1) * 10 ** rng.randint(0, 15) for _ in range(500)]
+        window = 5
+        for i, got in enumerate(rolling_statistics(numbers, window)):
+            chunk = numbers[i:i + window]
+            mean = math.fsum(chunk) / window
+            stddev = math.sqrt(math.fsum((x - mean) ** 2 for x in chunk) / window)
+            assert got["sum"] == math.fsum(chunk)
+            assert abs(got["stddev"] - stddev) <= 1e-9 * max(abs(x) for x in chunk)
+
+    def test_rolling_non_finite(self):
+        """Test non-finite values are rejected."""
+        with pytest.raises(ValueError, match="Invalid number"):
+            rolling_statistics([1, float("inf"), 2], 2)
+
+    def test_rolling_overflow(self):
+        """Test finite values whose window sum or variance overflows raise ValueError."""
+        with pytest.raises(ValueError, match="Window statistics overflow"):
+            rolling_statistics([1e308, 1e308, 1], 2)
+        with pytest.raises(ValueError, match="Window statistics overflow"):
+            rolling_statistics([1, 1, 1e308, -1e308], 2)
+        assert rolling_statistics([1e307, 1e307], 2)[0]["sum"] == 2e307
+
+    def test_rolling_invalid_window(self):
+        """Test a non-positive window raises ValueError."""
+        with pytest.raises(ValueError, match="positive"):
+            RollingWindow(0)
+
+
+class TestRollingWindow:
+    """Test cases for RollingWindow class."""
+
+    def test_push_returns_none_until_full(self):
+        """Test push only reports full windows."""
+        rolling = RollingWindow(3)
+        assert rolling.push(1) is None
+        assert rolling.push(2) is None
+        assert rolling.push(3)["sum"] == 6
+
+    def test_statistics_empty(self):
+        """Test statistics of an empty window follow get_statistics."""
+        assert RollingWindow(2).statistics() == {"mean": 0, "min": 0, "max": 0, "sum": 0, "stddev": 0}
@@ -0,0 +1,91 @@
+"""Tests for cumulative scans."""
+
+import math
+
+import pytest
+from app import scan as scan_module
+from app.scan import ChunkedScanner, Scanner, scan
+
+
+BACKEND_MODULE = scan_module
+
+
+class TestScan:
+    """Test cases for scan function."""
+
+    def test_cumsum(self, backend):
+        """Test prefix sums."""
+        assert scan([1, 2, 3, 4], "cumsum") == [1, 3, 6, 10]
+
+    def test_cumprod(self, backend):
+        """Test running products."""
+        assert scan([1, 2, 3, 4], "cumprod") == [1, 2, 6, 24]
+
+    def test_running_min_max(self, backend):
+        """Test running minimum and maximum."""
+        assert scan([3, 1, 2, 0], "cummin") == [3, 1, 1, 0]
+        assert scan([1, 3, 2, 4], "cummax") == [1, 3, 3, 4]
+
+    def test_diff(self, backend):
+        """Test first differences."""
+        assert scan([1, 4, 9, 16], "diff") == [3, 5, 7]
+        assert scan([1], "diff") == []
+
+    def test_empty(self, backend):
+        """Test scans of an empty series."""
+        assert scan([], "cumsum") == []
+
+    def test_overflow(self, backend):
+        """Test non-finite results are rejected."""
+        with pytest.raises(ValueError, match="finite"):
+            scan([1e200, 1e200], "cumprod")
+
+    def test_unknown_op(self):
+        """Test unknown operations are rejected."""
+        with pytest.raises(ValueError, match="Unknown scan operation"):
+            scan([1], "cumfoo")
+
+    def test_compensated_cumsum(self):
+        """Test compensated summation keeps small terms next to large ones."""
+        numbers = [1e16, 1.0, -1e16] * 10
+        plain = scan(numbers, "cumsum")
+        compensated = scan(numbers, "cumsum", compensated=True)
+        expected = [math.fsum(numbers[:i + 1]) for i in range(len(numbers))]
+        assert compensated == expected
+        assert plain != expected
+
+
+class TestScanner:
+    """Test cases for Scanner class."""
+
+    @pytest.mark.parametrize("op", ["cumsum", "cumprod", "cummin", "cummax", "diff"])
+    def test_matches_scan(self, op):
+        """Test incremental output matches the batch scan."""
+        numbers = [3.0, -1.5, 2.0, 7.0, 0.5]
+        scanner = Scanner(op)
+        outputs = [scanner.push(x) for x in numbers]
+        assert [x for x in outputs if x is not None] == scan(numbers, op)
+
+    def test_unknown_op(self):
+        """Test unknown operations are rejected."""
+        with pytest.raises(ValueError, match="Unknown scan operation"):
+            Scanner("cumfoo")
+
+
+class TestChunkedScanner:
+    """Test cases for ChunkedScanner class."""
+
+    def test_chunks(self):
+        """Test outputs are grouped into chunks with a final partial chunk."""
+        scanner = ChunkedScanner("cumsum", chunk_size=2)
+        outputs = [scanner.push(x) for x in [1, 2, 3, 4, 5]]
+        assert [x for x in outputs if x is not None] == [{"values": [1, 3]}, {"values": [6, 10]}]
+        assert scanner.finish() == {"values": [15]}
+        assert scanner.finish() is None
+
+    def test_overflow(self):
+        """Test non-finite outputs are rejected."""
+        scanner = ChunkedScanner("cumprod")
+        scanner.push(1e200)
+        with pytest.raises(ValueError, match="finite"):
+            scanner.push(1e200)
@@ -0,0 +1,129 @@
+"""Tests for MessagePack and CBOR negotiation."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import serialization
+from app.main import app
+from app.serialization import CBOR, JSON, MSGPACK, negotiate_format
+
+client = TestClient(app)
+
+FORMATS = [
+    pytest.param((MSGPACK, "msgpack", "packb", "unpackb"), id="msgpack"),
+    pytest.param((CBOR, "cbor2", "dumps", "loads"), id="cbor"),
+]
+
+
+@pytest.fixture(params=FORMATS)
+def codec(request):
+    """Return the media type and encode/decode functions of an installed binary format."""
+    media_type, module_name, encode, decode = request.param
+    module = pytest.importorskip(module_name)
+    return media_type, getattr(module, encode), getattr(module, decode)
+
+
+def post(codec, path, content, **kwargs):
+    """Post a body in the codec's format, asking for a response in the same format."""
+    media_type, encode, _ = codec
+    return client.post(
+        path, content=encode(content),
+        headers={"Content-Type": media_type, "Accept": media_type}, **kwargs,
+    )
+
+
+class TestNegotiateFormat:
+    """Test cases for negotiate_format."""
+
+    def test_json_by_default(self):
+        """Test wildcards and unknown types get JSON."""
+        assert negotiate_format("*/*") == JSON
+        assert negotiate_format("text/html") == JSON
+
+    def test_binary(self, monkeypatch):
+        """Test an exact binary type beats a wildcard, and JSON wins ties between exact types."""
+        monkeypatch.setattr(serialization, "CODECS", {MSGPACK: None, CBOR: None})
+        assert negotiate_format("application/msgpack") == MSGPACK
+        assert negotiate_format("application/x-msgpack, */*") == MSGPACK
+        assert negotiate_format("application/json, application/cbor") == JSON
+        assert negotiate_format("application/json;q=0.5, application/cbor") == CBOR
+        assert negotiate_format("application/msgpack;q=0") == JSON
+
+    def test_uninstalled_formats_are_ignored(self, monkeypatch):
+        """Test formats whose package is missing are never chosen."""
+        monkeypatch.setattr(serialization, "CODECS", {})
+        assert negotiate_format("application/msgpack") == JSON
+
+
+class TestBinaryEndpoints:
+    """Test cases for endpoints called with binary formats."""
+
+    def test_add(self, codec):
+        """Test a scalar operation."""
+        media_type, _, decode = codec
+        response = post(codec, "/add", {"a": 10, "b": 5})
+        assert response.status_code == 200
+        assert response.headers["content-type"] == media_type
+        assert decode(response.content) == {"result": 15.0}
+
+    def test_statistics(self, codec):
+        """Test an endpoint whose body is a bare list."""
+        _, _, decode = codec
+        response = post(codec, "/statistics", [1, 2, 3, 4])
+        assert decode(response.content) == {"mean": 2.5, "min": 1, "max": 4, "sum": 10}
+
+    def test_matrix(self, codec):
+        """Test an array endpoint."""
+        _, _, decode = codec
+        response = post(codec, "/matrix/transpose", {"a": [[1, 2], [3, 4]]})
+        assert decode(response.content) == {"result": [[1, 3], [2, 4]]}
+
+    def test_bulk(self, codec):
+        """Test a bulk endpoint."""
+        _, _, decode = codec
+        response = post(codec, "/bulk/multiply", {"a": [1, 2], "b": [3, 4]})
+        assert decode(response.content) == {"results": [3.0, 8.0]}
+
+    def test_validation_error_matches_json(self, codec):
+        """Test validation errors have the same status and body as with JSON."""
+        _, _, decode = codec
+        response = post(codec, "/add", {"a": "invalid", "b": 5})
+        expected = client.post("/add", json={"a": "invalid", "b": 5})
+        assert response.status_code == expected.status_code == 422
+        assert decode(response.content) == expected.json()
+
+    def test_array_validation_error_matches_json(self, codec):
+        """Test array endpoints report validation errors as with JSON."""
+        _, _, decode = codec
+        response = post(codec, "/vector/dot", {"a": [1]})
+        expected = client.post("/vector/dot", json={"a": [1]})
+        assert response.status_code == expected.status_code == 422
+        assert decode(response.content) == expected.json()
+
+    def test_math_error(self, codec):
+        """Test operation errors are encoded in the negotiated format."""
+        _, _, decode = codec
+        response = post(codec, "/divide", {"a": 1, "b": 0})
+        assert response.status_code == 400
+        assert decode(response.content) == {"detail": "Division by zero is not allowed"}
+
+    def test_not_found(self, codec):
+        """Test HTTP errors are encoded in the negotiated format."""
+        media_type, _, decode = codec
+        response = client.get("/jobs/missing", headers={"Accept": media_type})
+        assert response.status_code == 404
+        assert decode(response.content) == {"detail": "Job not found"}
+
+    def test_invalid_body(self, codec):
+        """Test an undecodable body is a validation error."""
+        media_type, _, decode = codec
+        response = client.post("/add", content=b"\xc1\xff", headers={"Content-Type": media_type, "Accept": media_type})
+        assert response.status_code == 422
+        assert decode(response.content)["detail"] == "Validation error"
+
+    def test_binary_request_json_response(self, codec):
+        """Test the request and response formats are chosen independently."""
+        media_type, encode, _ = codec
+        response = client.post("/subtract", content=encode({"a": 3, "b": 1}), headers={"Content-Type": media_type})
+        assert response.headers["content-type"] == JSON
+        assert response.json() == {"result": 2.0}
@@ -0,0 +1,221 @@
+"""Tests for statistics sessions."""
+
+import random
+import statistics
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app.main as main
+from app.main import app
+from app.sessions import Accumulator, SessionStore
+
+client = TestClient(app)
+
+
+class FakeClock:
+    """Clock that only moves when told to."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def store(monkeypatch):
+    store = SessionStore(max_sessions=3, ttl=60)
+    monkeypatch.setattr(main, "session_store", store)
+    return store
+
+
+class TestAccumulator:
+    """Test cases for Accumulator."""
+
+    def test_matches_batch_statistics(self):
+        """Test statistics over several batches match those of all the numbers at once."""
+        rng = random.Random(1)
+        numbers = [rng.uniform(-1000, 1000) for _ in range(1000)]
+        accumulator = Accumulator()
+        for start in range(0, len(numbers), 137):
+            accumulator.add(numbers[start:start + 137])
+        result = accumulator.statistics()
+        assert result["count"] == len(numbers)
+        assert result["mean"] == pytest.approx(statistics.fmean(numbers))
+        assert result["variance"] == pytest.approx(statistics.pvariance(numbers))
+        assert result["stddev"] == pytest.approx(statistics.pstdev(numbers))
+        assert result["min"] == min(numbers)
+        assert result["max"] == max(numbers)
+        assert result["sum"] == pytest.approx(sum(numbers))
+
+    def test_large_offset(self):
+        """Test the variance stays accurate for values with a large common offset."""
+        accumulator = Accumulator()
+        accumulator.add([1e9 + 4, 1e9 + 7])
+        accumulator.add([1e9 + 13, 1e9 + 16])
+        assert accumulator.statistics()["variance"] == pytest.approx(22.5)
+
+    def test_merge(self):
+        """Test merging two accumulators equals adding everything to one."""
+        left, right, whole = Accumulator(), Accumulator(), Accumulator()
+        left.add([1, 2, 3])
+        right.add([10, 20])
+        whole.add([1, 2, 3, 10, 20])
+        left.merge(right)
+        assert left.statistics() == pytest.approx(whole.statistics())
+
+    def test_merge_into_empty(self):
+        """Test merging into an empty accumulator copies the other one."""
+        empty, other = Accumulator(), Accumulator()
+        other.add([5, -5])
+        empty.merge(other)
+        assert empty.statistics() == other.statistics()
+
+    def test_empty(self):
+        """Test an empty accumulator reports zeros."""
+        accumulator = Accumulator()
+        accumulator.add([])
+        assert accumulator.statistics() == {
+            "count": 0, "mean": 0, "min": 0, "max": 0, "sum": 0, "variance": 0, "stddev": 0,
+        }
+
+    def test_non_finite(self):
+        """Test non-finite numbers are rejected without changing the accumulator."""
+        accumulator = Accumulator()
+        accumulator.add([1, 2])
+        with pytest.raises(ValueError, match="finite"):
+            accumulator.add([3, float("inf")])
+        assert accumulator.statistics()["count"] == 2
+
+    def test_overflow(self):
+        """Test batches whose sum or variance overflows are rejected without changing the accumulator."""
+        accumulator = Accumulator()
+        accumulator.add([1e308])
+        before = accumulator.statistics()
+        for batch in ([1e308], [1e308, 1e308], [-1e308, 1e308]):
+            with pytest.raises(ValueError, match="Session statistics overflow"):
+                accumulator.add(batch)
+        assert accumulator.statistics() == before
+
+
+class TestSessionStore:
+    """Test cases for SessionStore."""
+
+    def test_append_and_statistics(self):
+        """Test appending to a session and reading its statistics."""
+        store = SessionStore()
+        session_id = store.create()
+        assert store.append(session_id, [1, 2, 3])["sum"] == 6
+        assert store.statistics(session_id)["mean"] == 2
+
+    def test_unknown_session(self):
+        """Test unknown sessions return None or False."""
+        store = SessionStore()
+        assert store.statistics("missing") is None
+        assert store.append("missing", [1]) is None
+        assert store.delete("missing") is False
+
+    def test_delete(self):
+        """Test a deleted session is gone."""
+        store = SessionStore()
+        session_id = store.create()
+        assert store.delete(session_id) is True
+        assert store.statistics(session_id) is None
+
+    def test_evicts_least_recently_used(self):
+        """Test creating a session when full evicts the least recently used one."""
+        store = SessionStore(max_sessions=2)
+        first, second = store.create(), store.create()
+        store.statistics(first)
+        third = store.create()
+        assert len(store) == 2
+        assert store.statistics(second) is None
+        assert store.statistics(first) is not None
+        assert store.statistics(third) is not None
+
+    def test_idle_sessions_expire(self):
+        """Test sessions expire after the TTL unless used."""
+        clock = FakeClock()
+        store = SessionStore(ttl=10, clock=clock)
+        idle, active = store.create(), store.create()
+        clock.now = 8
+        store.append(active, [1])
+        clock.now = 15
+        assert store.statistics(idle) is None
+        assert store.statistics(active)["count"] == 1
+        clock.now = 26
+        assert store.statistics(active) is None
+        assert len(store) == 0
+
+
+class TestSessionEndpoints:
+    """Test cases for the /sessions endpoints."""
+
+    def test_lifecycle(self, store):
+        """Test creating a session, appending batches, querying and deleting it."""
+        response = client.post("/sessions")
+        assert response.status_code == 201
+        data = response.json()
+        assert data["count"] == 0
+        session_id = data["session_id"]
+
+        response = client.post(f"/sessions/{session_id}/append", json=[1, 2, 3])
+        assert response.status_code == 200
+        assert response.json()["sum"] == 6
+        client.post(f"/sessions/{session_id}/append", json=[4])
+
+        response = client.get(f"/sessions/{session_id}")
+        assert response.status_code == 200
+        assert response.json() == {
+            "session_id": session_id, "count": 4, "mean": 2.5, "min": 1, "max": 4,
+            "sum": 10, "variance": 1.25, "stddev": pytest.approx(1.25 ** 0.5),
+        }
+
+        assert client.delete(f"/sessions/{session_id}").status_code == 204
+        assert client.get(f"/sessions/{session_id}").status_code == 404
+
+    def test_unknown_session(self, store):
+        """Test unknown sessions return 404."""
+        assert client.get("/sessions/missing").json() == {"detail": "Session not found"}
+        assert client.post("/sessions/missing/append", json=[1]).status_code == 404
+        assert client.delete("/sessions/missing").status_code == 404
+
+    def test_invalid_batch(self, store):
+        """Test non-numeric batches return 422."""
+        session_id = client.post("/sessions").json()["session_id"]
+        response = client.post(f"/sessions/{session_id}/append", json=["a"])
+        assert response.status_code == 422
+
+    def test_non_finite_batch(self, store):
+        """Test non-finite numbers return 400."""
+        session_id = client.post("/sessions").json()["session_id"]
+        response = client.post(
+            f"/sessions/{session_id}/append", content=b"[1, Infinity]",
+            headers={"content-type": "application/json"},
+        )
+        assert response.status_code == 400
+        assert response.json() == {"detail": "Numbers must be finite"}
+
+    def test_overflowing_batch(self, store):
+        """Test a finite batch whose sum overflows returns 400 and leaves the session unchanged."""
+        session_id = client.post("/sessions").json()["session_id"]
+        client.post(f"/sessions/{session_id}/append", json=[1, 2])
+        response = client.post(f"/sessions/{session_id}/append", json=[1e308, 1e308])
+        assert response.status_code == 400
+        assert response.json() == {"detail": "Session statistics overflow"}
+        assert client.get(f"/sessions/{session_id}").json()["sum"] == 3
+
+    def test_batch_too_large(self, store, monkeypatch):
+        """Test batches larger than the bulk limit return 400."""
+        monkeypatch.setattr(main, "MAX_BULK_ITEMS", 2)
+        session_id = client.post("/sessions").json()["session_id"]
+        response = client.post(f"/sessions/{session_id}/append", json=[1, 2, 3])
+        assert response.status_code == 400
+        assert client.get(f"/sessions/{session_id}").json()["count"] == 0
+
+    def test_evicted_when_full(self, store):
+        """Test the least recently used session is evicted at the session limit."""
+        ids = [client.post("/sessions").json()["session_id"] for _ in range(4)]
+        assert client.get(f"/sessions/{ids[0]}").status_code == 404
+        assert client.get(f"/sessions/{ids[3]}").status_code == 200
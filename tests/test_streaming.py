@@ -0,0 +1,51 @@
+"""Tests for stream helpers."""
+
+import asyncio
+
+import pytest
+from app.streaming import iter_numbers, ndjson_line
+
+
+async def _chunks(*chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+def collect(*chunks):
+    async def run():
+        return [value async for value in iter_numbers(_chunks(*chunks))]
+    return asyncio.run(run())
+
+
+class TestIterNumbers:
+    """Test cases for iter_numbers function."""
+
+    def test_newline_delimited(self):
+        """Test newline-delimited numbers."""
+        assert collect(b"1\n2\n3\n") == [1.0, 2.0, 3.0]
+
+    def test_json_array(self):
+        """Test a JSON array body."""
+        assert collect(b"[1, 2.5, -3]") == [1.0, 2.5, -3.0]
+
+    def test_number_split_across_chunks(self):
+        """Test numbers split across chunk boundaries."""
+        assert collect(b"1,2", b"3,4", b"") == [1.0, 23.0, 4.0]
+
+    def test_invalid_number(self):
+        """Test invalid tokens raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid number"):
+            collect(b"1,abc")
+
+    def test_non_finite_number(self):
+        """Test non-finite numbers are rejected."""
+        with pytest.raises(ValueError, match="Invalid number"):
+            collect(b"1,nan")
+
+
+class TestNdjsonLine:
+    """Test cases for ndjson_line function."""
+
+    def test_ndjson_line(self):
+        """Test items are encoded as one compact line."""
+        assert ndjson_line({"a": 1}) == '{"a":1}\n'
@@ -1,6 +1,9 @@
 """Tests for utility functions."""
 
+import random
+
 import pytest  # pyright: ignore[reportMissingImports]
+from app import utils
 from app.utils import (
     validate_division,
     calculate_percentage,
@@ -8,9 +11,17 @@ from app.utils import (
     is_even,
     factorial,
     format_number,
-    get_statistics
+    get_statistics,
+    select_kth,
+    calculate_quantiles,
+    calculate_histogram,
+    exact_power,
+    modular_power,
+    modular_power_cost,
 )
 
+BACKEND_MODULE = utils
+
 
 class TestValidateDivision:
     """Test cases for validate_division function."""
@@ -107,6 +118,73 @@ class TestFactorial:
             factorial(-5)
 
 
+class TestExactPower:
+    """Test cases for exact_power function."""
+    
+    def test_exact_power(self):
+        """Test exact integer powers beyond float precision."""
+        assert exact_power(3, 40) == 3 ** 40
+        assert exact_power(-2, 3) == -8
+        assert exact_power(0, 0) == 1
+        assert exact_power(2, 1000) == 2 ** 1000
+    
+    def test_digit_limit(self):
+        """Test results longer than the digit limit are rejected."""
+        assert exact_power(10, 99, max_digits=100) == 10 ** 99
+        with pytest.raises(ValueError, match="Result would exceed 100 digits"):
+            exact_power(10, 100, max_digits=100)
+        with pytest.raises(ValueError, match="Result would exceed 100 digits"):
+            exact_power(3, 10 ** 15, max_digits=100)
+    
+    def test_huge_exponent(self):
+        """Test exponents too large to convert to float are rejected, not overflowed."""
+        with pytest.raises(ValueError, match="Result would exceed 4300 digits"):
+            exact_power(2, 10 ** 400)
+    
+    def test_trivial_bases_with_huge_exponents(self):
+        """Test bases whose powers stay small are allowed any exponent."""
+        assert exact_power(1, 10 ** 18) == 1
+        assert exact_power(-1, 10 ** 18 + 1) == -1
+    
+    def test_negative_exponent(self):
+        """Test negative exponents are rejected."""
+        with pytest.raises(ValueError, match="non-negative"):
+            exact_power(2, -1)
+
+
+class TestModularPower:
+    """Test cases for modular_power function."""
+    
+    def test_modular_power(self):
+        """Test modular exponentiation with large operands."""
+        assert modular_power(4, 13, 497) == 445
+        assert modular_power(2, 10 ** 18, 10 ** 9 + 7) == pow(2, 10 ** 18, 10 ** 9 + 7)
+    
+    def test_negative_exponent(self):
+        """Test negative exponents use the modular inverse."""
+        assert modular_power(3, -1, 7) == 5
+        with pytest.raises(ValueError, match="not invertible"):
+            modular_power(2, -1, 4)
+    
+    def test_zero_modulus(self):
+        """Test a zero modulus is rejected."""
+        with pytest.raises(ValueError, match="Modulus cannot be zero"):
+            modular_power(2, 3, 0)
+    
+    def test_operand_limit(self):
+        """Test exponents and moduli longer than the bit limit are rejected."""
+        assert modular_power(3, 2 ** 64 - 1, 2 ** 64 - 59, max_bits=64) == pow(3, 2 ** 64 - 1, 2 ** 64 - 59)
+        with pytest.raises(ValueError, match="limited to 64 bits"):
+            modular_power(3, 2 ** 64, 7, max_bits=64)
+        with pytest.raises(ValueError, match="limited to 64 bits"):
+            modular_power(3, 5, -2 ** 64, max_bits=64)
+    
+    def test_cost(self):
+        """Test the cost estimate grows with both operands and has a word-size floor."""
+        assert modular_power_cost(0, 7) == 64 ** 3
+        assert modular_power_cost(2 ** 127, 2 ** 255) == 128 * 256 ** 2
+
+
 class TestFormatNumber:
     """Test cases for format_number function."""
     
@@ -175,3 +253,117 @@ class TestGetStatistics:
         assert result["min"] == 42.0
         assert result["max"] == 42.0
         assert result["sum"] == 42.0
+
+
+class TestSelectKth:
+    """Test cases for select_kth function."""
+    
+    def test_select_kth_matches_sorted(self):
+        """Test every rank matches the sorted order."""
+        rng = random.Random(1)
+        numbers = [rng.randint(-5, 5) for _ in range(101)]
+        expected = sorted(numbers)
+        for k in range(len(numbers)):
+            assert select_kth(list(numbers), k) == expected[k]
+    
+    def test_select_kth_out_of_range(self):
+        """Test an out-of-range rank raises ValueError."""
+        with pytest.raises(ValueError, match="out of range"):
+            select_kth([1, 2], 2)
+    
+    def test_median_of_medians_pivot(self):
+        """Test the fallback pivot lies between the 30th and 70th percentiles."""
+        numbers = list(range(100))
+        random.Random(2).shuffle(numbers)
+        pivot = utils._median_of_medians(numbers, 0, len(numbers) - 1)
+        assert 30 <= pivot <= 70
+
+
+class TestCalculateQuantiles:
+    """Test cases for calculate_quantiles function."""
+    
+    def test_quantiles_interpolate(self, backend):
+        """Test quantiles use linear interpolation between ranks."""
+        assert calculate_quantiles([4, 1, 3, 2], [0, 0.25, 0.5, 1]) == [1.0, 1.75, 2.5, 4.0]
+    
+    def test_quantiles_match_sorted(self, backend):
+        """Test quantiles agree with a sort-based computation."""
+        rng = random.Random(3)
+        numbers = [rng.uniform(-10, 10) for _ in range(257)]
+        ordered = sorted(numbers)
+        for q, value in zip([0.01, 0.5, 0.99], calculate_quantiles(numbers, [0.01, 0.5, 0.99])):
+            position = q * (len(numbers) - 1)
+            low = int(position)
+            expected = ordered[low] + (ordered[low + 1] - ordered[low]) * (position - low)
+            assert abs(value - expected) < 1e-12
+    
+    def test_quantiles_out_of_range(self):
+        """Test quantiles outside [0, 1] raise ValueError."""
+        with pytest.raises(ValueError, match="between 0 and 1"):
+            calculate_quantiles([1, 2], [1.5])
+
+
+class TestCalculateHistogram:
+    """Test cases for calculate_histogram function."""
+    
+    def test_histogram_fixed_bins(self, backend):
+        """Test counts for a fixed number of bins."""
+        result = calculate_histogram([1, 2, 2, 3, 4, 5], 2)
+        assert result == {"edges": [1.0, 3.0, 5.0], "counts": [3, 3]}
+    
+    def test_histogram_auto_bins(self, backend):
+        """Test auto binning uses Sturges' rule."""
+        result = calculate_histogram(list(range(16)), "auto")
+        assert len(result["counts"]) == 5
+        assert sum(result["counts"]) == 16
+    
+    def test_histogram_single_value(self, backend):
+        """Test a constant series gets a unit-wide range."""
+        assert calculate_histogram([3, 3], 1) == {"edges": [2.5, 3.5], "counts": [2]}
+    
+    def test_histogram_empty(self):
+        """Test an empty list has no bins."""
+        assert calculate_histogram([], 4) == {"edges": [], "counts": []}
+    
+    def test_histogram_invalid_bins(self):
+        """Test invalid bins raise ValueError."""
+        with pytest.raises(ValueError, match="Bins"):
+            calculate_histogram([1, 2], 0)
+
+
+class TestGetStatisticsOptions:
+    """Test cases for optional get_statistics metrics."""
+    
+    def test_default_keys_unchanged(self):
+        """Test no extra keys are added unless requested."""
+        assert set(get_statistics([1, 2])) == {"mean", "min", "max", "sum"}
+    
+    def test_numpy_converts_input_once(self, monkeypatch):
+        """Test the input is converted to an array once and shared by every metric."""
+        np = pytest.importorskip("numpy")
+        asarray, conversions = np.asarray, []
+        
+        def counting_asarray(values, *args, **kwargs):
+            if not isinstance(values, np.ndarray):
+                conversions.append(values)
+            return asarray(values, *args, **kwargs)
+        
+        monkeypatch.setattr(np, "asarray", counting_asarray)
+        result = get_statistics([4, 1, 3, 2], quantiles=[0.5], median=True, bins=2)
+        assert len(conversions) == 1
+        assert result["sum"] == 10.0
+        assert result["median"] == 2.5
+    
+    def test_quantiles_median_and_histogram(self, backend):
+        """Test all optional metrics together."""
+        result = get_statistics([1, 2, 3, 4], quantiles=[0.25, 0.75], median=True, bins=3)
+        assert result["quantiles"] == {"0.25": 1.75, "0.75": 3.25}
+        assert result["median"] == 2.5
+        assert result["histogram"]["counts"] == [1, 1, 2]
+    
+    def test_options_on_empty_list(self):
+        """Test optional metrics on an empty list."""
+        result = get_statistics([], quantiles=[0.5], median=True, bins="auto")
+        assert result["quantiles"] == {"0.5": 0}
+        assert result["median"] == 0
+        assert result["histogram"] == {"edges": [], "counts": []}